@@ -9,6 +9,7 @@ class BinaryTree:
     """
     A Binary Tree, i.e. arity 2.
     """
+    __slots__ = ('value', 'left', 'right')
 
     def __init__(self, value, left=None, right=None):
         """
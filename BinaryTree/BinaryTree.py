@@ -11,6 +11,7 @@ class BinaryTree:
     @param BinaryTree|None left: left child of this binary tree node
     @param BinaryTree|None right: right child of this binary tree node
     """
+    __slots__ = ('value', 'left', 'right')
 
     def __init__(self, value, left=None, right=None):
         """
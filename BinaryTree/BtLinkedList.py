@@ -11,6 +11,7 @@ class BinaryTree:
     @param BinaryTree|None left: left child of this binary tree node
     @param BinaryTree|None right: right child of this binary tree node
     """
+    __slots__ = ('value', 'left', 'right')
 
     def __init__(self, value, left=None, right=None):
         """
@@ -212,6 +213,7 @@ class LinkedListNode:
     @param LinkedListNode next_: successor to this LinkedListNode
     @param object value: data this LinkedListNode represents
     """
+    __slots__ = ('value', 'next_')
     def __init__(self, value, next_=None):
         """
         Create LinkedListNode self with data value and successor next_.
@@ -0,0 +1,384 @@
+""" array-backed priority queues
+"""
+
+
+class HeapEntry:
+    """
+    Item stored in a Heap, returned by Heap.push as a handle for
+    decrease_key.
+
+    === Attributes ===
+    @param object item: item stored
+    @param object key: key the item is ordered by
+    @param int|None index: position of this entry in its heap's list,
+                           or None once it has left the heap
+    """
+    __slots__ = ('item', 'key', 'index')
+
+    def __init__(self, item, key, index=None):
+        """
+        Create HeapEntry self holding item, ordered by key.
+
+        @param HeapEntry self: this HeapEntry
+        @param object item: item to store
+        @param object key: key the item is ordered by
+        @param int|None index: position of this entry in its heap's list
+        @rtype: None
+        """
+        self.item, self.key, self.index = item, key, index
+
+    def __repr__(self):
+        """
+        Represent HeapEntry self as a string.
+
+        @param HeapEntry self: this HeapEntry
+        @rtype: str
+
+        >>> HeapEntry('a', 1, 0)
+        HeapEntry('a', 1, 0)
+        """
+        return "HeapEntry({!r}, {!r}, {!r})".format(self.item, self.key,
+                                                   self.index)
+
+
+class Heap:
+    """
+    Min-heap: a collection of items where the item with the smallest key
+    can be found in O(1) time and removed, or a new item added, in
+    O(log n) time.  Entries live in a list, and the children of the entry
+    at index i are at indexes 2 * i + 1 and 2 * i + 2.
+
+    === Attributes ===
+    @param list[HeapEntry] _entries: entries in heap order
+    @param (object)->object|None _key: function computing each item's key,
+                                       or None to order by the items
+    """
+    # number of children of each entry
+    _arity = 2
+
+    def __init__(self, items=None, key=None):
+        """
+        Create Heap self holding items, ordered by key(item), or by the
+        items themselves if key is None.  This takes O(len(items)) time.
+
+        @param Heap self: this Heap
+        @param iterable|None items: items to start with
+        @param (object)->object|None key: function computing each item's key
+        @rtype: None
+
+        >>> h = Heap([5, 3, 8, 1])
+        >>> h.peek(), len(h)
+        (1, 4)
+        """
+        self._key = key
+        self._entries = []
+        if items is not None:
+            self._entries = [self._entry(item) for item in items]
+            self._heapify()
+
+    def _entry(self, item):
+        """
+        Return a new HeapEntry for item, not yet in self.
+
+        @param Heap self: this Heap
+        @param object item: item to store
+        @rtype: HeapEntry
+        """
+        return HeapEntry(item, item if self._key is None else self._key(item))
+
+    def _heapify(self):
+        """
+        Rearrange self._entries into heap order, bottom-up, in linear time.
+
+        @param Heap self: this Heap
+        @rtype: None
+        """
+        entries = self._entries
+        for index, entry in enumerate(entries):
+            entry.index = index
+        for index in range((len(entries) - 2) // self._arity, -1, -1):
+            self._sift_down(index)
+
+    def _sift_up(self, index):
+        """
+        Move the entry at index up until its parent's key is no larger.
+
+        @param Heap self: this Heap
+        @param int index: index of the entry to move
+        @rtype: None
+        """
+        entries, arity = self._entries, self._arity
+        entry = entries[index]
+        while index > 0:
+            parent = (index - 1) // arity
+            above = entries[parent]
+            if not entry.key < above.key:
+                break
+            entries[index], above.index = above, index
+            index = parent
+        entries[index], entry.index = entry, index
+
+    def _sift_down(self, index):
+        """
+        Move the entry at index down until no child's key is smaller.
+
+        @param Heap self: this Heap
+        @param int index: index of the entry to move
+        @rtype: None
+        """
+        entries, arity = self._entries, self._arity
+        n = len(entries)
+        entry = entries[index]
+        child = arity * index + 1
+        while child < n:
+            # pick the smallest child
+            smallest = entries[child]
+            for other in range(child + 1, min(child + arity, n)):
+                if entries[other].key < smallest.key:
+                    child, smallest = other, entries[other]
+            if not smallest.key < entry.key:
+                break
+            entries[index], smallest.index = smallest, index
+            index = child
+            child = arity * index + 1
+        entries[index], entry.index = entry, index
+
+    def __len__(self):
+        """
+        Return the number of items in Heap self.
+
+        @param Heap self: this Heap
+        @rtype: int
+
+        >>> len(Heap())
+        0
+        """
+        return len(self._entries)
+
+    def is_empty(self):
+        """
+        Return whether Heap self has no items.
+
+        @param Heap self: this Heap
+        @rtype: bool
+
+        >>> Heap().is_empty()
+        True
+        >>> Heap([1]).is_empty()
+        False
+        """
+        return not self._entries
+
+    def push(self, item):
+        """
+        Add item to Heap self, and return its HeapEntry.
+
+        @param Heap self: this Heap
+        @param object item: item to add
+        @rtype: HeapEntry
+
+        >>> h = Heap()
+        >>> h.push(4).item
+        4
+        >>> h.push(2).index
+        0
+        """
+        entry = self._entry(item)
+        entry.index = len(self._entries)
+        self._entries.append(entry)
+        self._sift_up(entry.index)
+        return entry
+
+    def peek(self):
+        """
+        Return the item with the smallest key in Heap self, without
+        removing it.  Raise IndexError if self is empty.
+
+        @param Heap self: this Heap
+        @rtype: object
+
+        >>> Heap(['b', 'a']).peek()
+        'a'
+        """
+        if not self._entries:
+            raise IndexError("peek at empty heap")
+        return self._entries[0].item
+
+    def pop(self):
+        """
+        Remove and return the item with the smallest key in Heap self.
+        Raise IndexError if self is empty.
+
+        @param Heap self: this Heap
+        @rtype: object
+
+        >>> h = Heap([3, 1, 2])
+        >>> [h.pop(), h.pop(), h.pop()]
+        [1, 2, 3]
+        """
+        if not self._entries:
+            raise IndexError("pop from empty heap")
+        last = self._entries.pop()
+        if not self._entries:
+            last.index = None
+            return last.item
+        top = self._entries[0]
+        self._entries[0] = last
+        self._sift_down(0)
+        top.index = None
+        return top.item
+
+    def pushpop(self, item):
+        """
+        Add item to Heap self, then remove and return the item with the
+        smallest key, faster than push followed by pop.
+
+        @param Heap self: this Heap
+        @param object item: item to add
+        @rtype: object
+
+        >>> h = Heap([2, 4])
+        >>> h.pushpop(1), h.pushpop(3), h.peek()
+        (1, 2, 3)
+        """
+        entry = self._entry(item)
+        if not self._entries or not self._entries[0].key < entry.key:
+            return item
+        return self._replace_top(entry)
+
+    def replace(self, item):
+        """
+        Remove and return the item with the smallest key in Heap self,
+        then add item, faster than pop followed by push.  Raise
+        IndexError if self is empty.
+
+        @param Heap self: this Heap
+        @param object item: item to add
+        @rtype: object
+
+        >>> h = Heap([2, 4])
+        >>> h.replace(5), h.peek()
+        (2, 4)
+        """
+        if not self._entries:
+            raise IndexError("replace in empty heap")
+        return self._replace_top(self._entry(item))
+
+    def _replace_top(self, entry):
+        """
+        Put entry in place of the top entry of non-empty Heap self, and
+        return the top entry's item.
+
+        @param Heap self: this Heap
+        @param HeapEntry entry: entry to add
+        @rtype: object
+        """
+        top = self._entries[0]
+        self._entries[0] = entry
+        self._sift_down(0)
+        top.index = None
+        return top.item
+
+    def decrease_key(self, entry, item):
+        """
+        Replace the item of entry, a HeapEntry in Heap self, with item,
+        whose key must be no larger than the old one, and move it up to
+        its new place.  Raise ValueError if entry is not in self or the
+        key is larger.
+
+        @param Heap self: this Heap
+        @param HeapEntry entry: handle returned by push
+        @param object item: new item for entry
+        @rtype: None
+
+        >>> h = Heap(key=lambda task: task[0])
+        >>> _ = h.push((3, 'write'))
+        >>> entry = h.push((5, 'test'))
+        >>> h.decrease_key(entry, (1, 'test'))
+        >>> h.pop()
+        (1, 'test')
+        """
+        index = entry.index
+        if (index is None or index >= len(self._entries) or
+                self._entries[index] is not entry):
+            raise ValueError("entry is not in this heap")
+        key = item if self._key is None else self._key(item)
+        if entry.key < key:
+            raise ValueError("new key is larger than the old one")
+        entry.item, entry.key = item, key
+        self._sift_up(index)
+
+    def merge(self, other):
+        """
+        Move all the items of Heap other into Heap self, leaving other
+        empty.  Entries of other stay valid handles in self.  Raise
+        ValueError unless other orders items by the same key function.
+        Takes O(len(self) + len(other)) time, or O(m log n) when other
+        has m items, fewer than a quarter as many as self's n, which are
+        pushed one at a time.
+
+        @param Heap self: this Heap
+        @param Heap other: heap to merge into self
+        @rtype: None
+
+        >>> h1, h2 = Heap([4, 1]), Heap([3, 2])
+        >>> h1.merge(h2)
+        >>> [h1.pop() for _ in range(len(h1))], len(h2)
+        ([1, 2, 3, 4], 0)
+        >>> h1.merge(Heap([1], key=abs))
+        Traceback (most recent call last):
+        ...
+        ValueError: heaps order items by different keys
+        """
+        if other is self:
+            return
+        elif other._key is not self._key:
+            raise ValueError("heaps order items by different keys")
+        if len(other) * 4 < len(self):
+            # few enough to push one at a time
+            for entry in other._entries:
+                entry.index = len(self._entries)
+                self._entries.append(entry)
+                self._sift_up(entry.index)
+        else:
+            self._entries.extend(other._entries)
+            self._heapify()
+        other._entries = []
+
+
+class DaryHeap(Heap):
+    """
+    Min-heap where each entry has arity children, so the tree is
+    shallower: pushing and decrease_key are faster, and popping compares
+    more children at each level.
+
+    === Attributes ===
+    @param int _arity: number of children of each entry
+    """
+
+    def __init__(self, items=None, key=None, arity=4):
+        """
+        Create DaryHeap self with arity children per entry, holding items
+        ordered by key(item), or by the items themselves if key is None.
+
+        @param DaryHeap self: this DaryHeap
+        @param iterable|None items: items to start with
+        @param (object)->object|None key: function computing each item's key
+        @param int arity: number of children of each entry, at least 2
+        @rtype: None
+
+        >>> h = DaryHeap([5, 2, 9, 1, 7], arity=3)
+        >>> [h.pop() for _ in range(len(h))]
+        [1, 2, 5, 7, 9]
+        >>> DaryHeap([3, 1, 2]).pop()
+        1
+        """
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self._arity = arity
+        Heap.__init__(self, items, key)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,512 @@
+""" doubly linked list with nodes as handles
+"""
+
+
+from itertools import islice
+
+from LinkedList import LinkedListNode
+
+
+class DoublyLinkedListNode(LinkedListNode):
+    """
+    LinkedListNode that also refers to its predecessor.  The nodes of a
+    DoublyLinkedList are handed out as handles to the values they hold,
+    and stay valid however the list around them changes.
+
+    === Attributes ===
+    @param DoublyLinkedListNode|None prev: predecessor to this node
+    """
+    __slots__ = ('prev',)
+
+    def __init__(self, value, next_=None, prev=None):
+        """
+        Create DoublyLinkedListNode self with data value, successor next_
+        and predecessor prev.
+
+        @param DoublyLinkedListNode self: this DoublyLinkedListNode
+        @param object value: data of this node
+        @param DoublyLinkedListNode|None next_: successor to this node
+        @param DoublyLinkedListNode|None prev: predecessor to this node
+        @rtype: None
+
+        >>> print(DoublyLinkedListNode(5, DoublyLinkedListNode(7)))
+        5 -> 7 ->|
+        """
+        LinkedListNode.__init__(self, value, next_)
+        self.prev = prev
+
+
+class DoublyLinkedList:
+    """
+    Collection of DoublyLinkedListNodes, linked both ways, so that
+    either end, or any node given as a handle, can be removed, moved or
+    inserted next to in O(1) time.  A handle must be a node of the list
+    it is passed to.
+
+    === Attributes ===
+    @param DoublyLinkedListNode|None front: first node of this list
+    @param DoublyLinkedListNode|None back: last node of this list
+    @param int size: number of nodes in this list
+    """
+
+    def __init__(self):
+        """
+        Create an empty DoublyLinkedList.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @rtype: None
+        """
+        self.front, self.back, self.size = None, None, 0
+
+    def __str__(self):
+        """
+        Return a human-friendly string representation of
+        DoublyLinkedList self.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @rtype: str
+
+        >>> print(DoublyLinkedList())
+        I'm so empty... experiencing existential angst!!!
+        >>> print(DoublyLinkedList.from_iterable([1, 2]))
+        1 -> 2 ->|
+        """
+        if self.front is None:
+            assert self.back is None and self.size == 0, "ooooops!"
+            return "I'm so empty... experiencing existential angst!!!"
+        else:
+            return str(self.front)
+
+    def __eq__(self, other):
+        """
+        Return whether DoublyLinkedList self is equivalent to other.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param DoublyLinkedList|object other: object to compare to self
+        @rtype: bool
+
+        >>> DoublyLinkedList().__eq__(None)
+        False
+        >>> lnk = DoublyLinkedList.from_iterable([5])
+        >>> lnk == DoublyLinkedList.from_iterable([5])
+        True
+        """
+        return type(self) == type(other) and self.front == other.front and (
+            self.back == other.back and self.size == other.size)
+
+    def __len__(self):
+        """
+        Return the number of nodes in DoublyLinkedList self.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @rtype: int
+
+        >>> len(DoublyLinkedList.from_iterable('abc'))
+        3
+        """
+        return self.size
+
+    def __iter__(self):
+        """
+        Yield the values of DoublyLinkedList self from front to back.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @rtype: iterator
+
+        >>> list(DoublyLinkedList.from_iterable([1, 2, 3]))
+        [1, 2, 3]
+        """
+        node = self.front
+        while node is not None:
+            yield node.value
+            node = node.next_
+
+    def __reversed__(self):
+        """
+        Yield the values of DoublyLinkedList self from back to front.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @rtype: iterator
+
+        >>> list(reversed(DoublyLinkedList.from_iterable([1, 2, 3])))
+        [3, 2, 1]
+        """
+        node = self.back
+        while node is not None:
+            yield node.value
+            node = node.prev
+
+    def __contains__(self, value):
+        """
+        Return whether DoublyLinkedList self contains value.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param object value: value to search for in self
+        @rtype: bool
+
+        >>> lnk = DoublyLinkedList.from_iterable([0, 1, 2])
+        >>> 2 in lnk, 3 in lnk
+        (True, False)
+        """
+        node = self.front
+        while node is not None:
+            if node.value == value:
+                return True
+            node = node.next_
+        return False
+
+    def node_at(self, index):
+        """
+        Return the node of DoublyLinkedList self at position index, which
+        may be negative to count from the back, walking from whichever end
+        is nearer.  Raise IndexError if there is no such node.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param int index: position of the node
+        @rtype: DoublyLinkedListNode
+
+        >>> DoublyLinkedList.from_iterable('abcd').node_at(-2).value
+        'c'
+        """
+        if -self.size > index or index >= self.size:
+            raise IndexError("out of range!!!")
+        elif index < 0:
+            index += self.size
+        if index <= self.size // 2:
+            node = self.front
+            for _ in range(index):
+                node = node.next_
+        else:
+            node = self.back
+            for _ in range(self.size - 1 - index):
+                node = node.prev
+        return node
+
+    def __getitem__(self, index):
+        """
+        Return the value at DoublyLinkedList self's position index, or a
+        new DoublyLinkedList of the values in slice index, found in one
+        pass.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param int|slice index: position to retrieve value from
+        @rtype: object|DoublyLinkedList
+
+        >>> lnk = DoublyLinkedList.from_iterable(range(6))
+        >>> lnk[1], lnk[-1]
+        (1, 5)
+        >>> print(lnk[::-2])
+        5 -> 3 -> 1 ->|
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            if step > 0:
+                return self.from_iterable(islice(self, start, stop, step))
+            # walk backwards from the back, which the prev links allow
+            return self.from_iterable(islice(reversed(self),
+                                             self.size - 1 - start,
+                                             self.size - 1 - stop, -step))
+        return self.node_at(index).value
+
+    def __setitem__(self, index, value):
+        """
+        Set the value of list at position index to value.  Raise
+        IndexError if index >= self.size.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param int index: position of list to change
+        @param object value: new value for linked list
+        @rtype: None
+
+        >>> lnk = DoublyLinkedList.from_iterable([5])
+        >>> lnk[0] = 7
+        >>> print(lnk)
+        7 ->|
+        """
+        self.node_at(index).value = value
+
+    def _link(self, node, prev, next_):
+        """
+        Link node into DoublyLinkedList self between prev and next_, which
+        are neighbours in self, or None at either end.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param DoublyLinkedListNode node: node not in any list
+        @param DoublyLinkedListNode|None prev: node to go before node
+        @param DoublyLinkedListNode|None next_: node to go after node
+        @rtype: None
+        """
+        node.prev, node.next_ = prev, next_
+        if prev is None:
+            self.front = node
+        else:
+            prev.next_ = node
+        if next_ is None:
+            self.back = node
+        else:
+            next_.prev = node
+        self.size += 1
+
+    def _unlink(self, node):
+        """
+        Unlink node from DoublyLinkedList self, leaving it in no list.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param DoublyLinkedListNode node: node of self
+        @rtype: None
+        """
+        if node.prev is None:
+            self.front = node.next_
+        else:
+            node.prev.next_ = node.next_
+        if node.next_ is None:
+            self.back = node.prev
+        else:
+            node.next_.prev = node.prev
+        node.prev = node.next_ = None
+        self.size -= 1
+
+    def append(self, value):
+        """
+        Insert value after self.back, and return its node.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param object value: value to add
+        @rtype: DoublyLinkedListNode
+
+        >>> lnk = DoublyLinkedList()
+        >>> lnk.append(5).value
+        5
+        >>> _ = lnk.append(6)
+        >>> print(lnk), lnk.back.prev.value
+        5 -> 6 ->|
+        (None, 5)
+        """
+        node = DoublyLinkedListNode(value)
+        self._link(node, self.back, None)
+        return node
+
+    def prepend(self, value):
+        """
+        Insert value before self.front, and return its node.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param object value: value to add
+        @rtype: DoublyLinkedListNode
+
+        >>> lnk = DoublyLinkedList()
+        >>> _ = lnk.prepend(0)
+        >>> _ = lnk.prepend(1)
+        >>> str(lnk.front), lnk.back.value
+        ('1 -> 0 ->|', 0)
+        """
+        node = DoublyLinkedListNode(value)
+        self._link(node, None, self.front)
+        return node
+
+    def extend(self, values):
+        """
+        Insert each of values after self.back, in order.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param iterable values: values to add
+        @rtype: None
+
+        >>> lnk = DoublyLinkedList.from_iterable('ab')
+        >>> lnk.extend(lnk)
+        >>> print(lnk)
+        a -> b -> a -> b ->|
+        """
+        if values is self:
+            # do not chase the nodes being added
+            values = list(values)
+        for value in values:
+            self.append(value)
+
+    @classmethod
+    def from_iterable(cls, values):
+        """
+        Return a new cls holding values, in order.
+
+        @param type cls: this class
+        @param iterable values: values to hold
+        @rtype: DoublyLinkedList
+
+        >>> print(DoublyLinkedList.from_iterable('abc'))
+        a -> b -> c ->|
+        """
+        lnk = cls()
+        lnk.extend(values)
+        return lnk
+
+    def insert_after(self, node, value):
+        """
+        Insert value into DoublyLinkedList self just after node, and
+        return its new node.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param DoublyLinkedListNode node: node of self
+        @param object value: value to insert
+        @rtype: DoublyLinkedListNode
+
+        >>> lnk = DoublyLinkedList()
+        >>> one = lnk.append(1)
+        >>> three = lnk.insert_after(one, 3)
+        >>> _ = lnk.insert_after(one, 2)
+        >>> print(lnk), lnk.back is three
+        1 -> 2 -> 3 ->|
+        (None, True)
+        """
+        new_node = DoublyLinkedListNode(value)
+        self._link(new_node, node, node.next_)
+        return new_node
+
+    def insert_before(self, node, value):
+        """
+        Insert value into DoublyLinkedList self just before node, and
+        return its new node.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param DoublyLinkedListNode node: node of self
+        @param object value: value to insert
+        @rtype: DoublyLinkedListNode
+
+        >>> lnk = DoublyLinkedList()
+        >>> two = lnk.append(2)
+        >>> _ = lnk.insert_before(two, 1)
+        >>> print(lnk)
+        1 -> 2 ->|
+        """
+        new_node = DoublyLinkedListNode(value)
+        self._link(new_node, node.prev, node)
+        return new_node
+
+    def remove(self, node):
+        """
+        Remove node from DoublyLinkedList self, and return its value.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param DoublyLinkedListNode node: node of self
+        @rtype: object
+
+        >>> lnk = DoublyLinkedList()
+        >>> _, two, _ = lnk.append(1), lnk.append(2), lnk.append(3)
+        >>> lnk.remove(two)
+        2
+        >>> print(lnk), lnk.size
+        1 -> 3 ->|
+        (None, 2)
+        """
+        self._unlink(node)
+        return node.value
+
+    def delete_front(self):
+        """
+        Delete self.front from self.
+
+        Assume self.front is not None
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @rtype: None
+
+        >>> lnk = DoublyLinkedList.from_iterable([1, 0])
+        >>> lnk.delete_front()
+        >>> str(lnk.front), lnk.front.prev
+        ('0 ->|', None)
+        """
+        assert self.front is not None, "unexpected None!"
+        self._unlink(self.front)
+
+    def delete_back(self):
+        """
+        Delete self.back from self.
+
+        Assume self.back is not None
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @rtype: None
+
+        >>> lnk = DoublyLinkedList.from_iterable([1, 0])
+        >>> lnk.delete_back()
+        >>> lnk.delete_back()
+        >>> print(lnk)
+        I'm so empty... experiencing existential angst!!!
+        """
+        assert self.back is not None, "unexpected None!"
+        self._unlink(self.back)
+
+    def move_to_front(self, node):
+        """
+        Move node of DoublyLinkedList self to its front.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param DoublyLinkedListNode node: node of self
+        @rtype: None
+
+        >>> lnk = DoublyLinkedList()
+        >>> _, _, c = lnk.append('a'), lnk.append('b'), lnk.append('c')
+        >>> lnk.move_to_front(c)
+        >>> print(lnk), lnk.back.value
+        c -> a -> b ->|
+        (None, 'b')
+        """
+        if node is not self.front:
+            self._unlink(node)
+            self._link(node, None, self.front)
+
+    def move_to_back(self, node):
+        """
+        Move node of DoublyLinkedList self to its back: for an LRU cache,
+        the node of each value used, so that front is the least recently
+        used.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param DoublyLinkedListNode node: node of self
+        @rtype: None
+
+        >>> lnk = DoublyLinkedList()
+        >>> handles = {key: lnk.append(key) for key in 'abc'}
+        >>> lnk.move_to_back(handles['a'])
+        >>> lnk.delete_front()
+        >>> print(lnk)
+        c -> a ->|
+        """
+        if node is not self.back:
+            self._unlink(node)
+            self._link(node, self.back, None)
+
+    def copy(self):
+        """
+        Return a copy of DoublyLinkedList self, with different nodes but
+        equivalent values.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @rtype: DoublyLinkedList
+
+        >>> lnk = DoublyLinkedList.from_iterable([7, 5])
+        >>> print(lnk.copy())
+        7 -> 5 ->|
+        """
+        return DoublyLinkedList.from_iterable(self)
+
+    def __add__(self, other):
+        """
+        Return a new list by concatenating self to other.  Leave both self
+        and other unchanged.
+
+        @param DoublyLinkedList self: this DoublyLinkedList
+        @param DoublyLinkedList other: linked list to concatenate to self
+        @rtype: DoublyLinkedList
+
+        >>> lnk = DoublyLinkedList.from_iterable([5])
+        >>> print(lnk + DoublyLinkedList.from_iterable([7]))
+        5 -> 7 ->|
+        """
+        added_lnk = self.copy()
+        added_lnk.extend(other)
+        return added_lnk
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
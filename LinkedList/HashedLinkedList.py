@@ -0,0 +1,407 @@
+""" linked list with a hash index from values to nodes
+"""
+
+
+from LinkedList import LinkedList, LinkedListNode
+
+
+class HashedNode(LinkedListNode):
+    """
+    LinkedListNode that also refers to its predecessor, so a
+    HashedLinkedList can unlink it or insert before it without walking
+    from front.
+
+    === Attributes ===
+    @param HashedNode|None prev: predecessor to this HashedNode
+    """
+    __slots__ = ('prev',)
+
+    def __init__(self, value, next_=None, prev=None):
+        """
+        Create HashedNode self with data value, successor next_ and
+        predecessor prev.
+
+        @param HashedNode self: this HashedNode
+        @param object value: data of this node
+        @param HashedNode|None next_: successor to this HashedNode
+        @param HashedNode|None prev: predecessor to this HashedNode
+        @rtype: None
+        """
+        LinkedListNode.__init__(self, value, next_)
+        self.prev = prev
+
+
+class HashedLinkedList(LinkedList):
+    """
+    LinkedList of HashedNodes that keeps a dict from each value to the
+    nodes holding it, updated by every method that changes the list, so
+    membership, insert_before, delete_after and remove take O(1) average
+    time.  That is as long as values are distinct, as in an ordered set:
+    when several nodes hold a value, finding the first of them walks from
+    front until it meets one.  Values must be hashable.
+
+    === Attributes ===
+    @param dict[object, dict[int, HashedNode]] _nodes: nodes holding each
+                                                       value, by id
+    """
+
+    def __init__(self):
+        """
+        Create an empty HashedLinkedList.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @rtype: None
+        """
+        LinkedList.__init__(self)
+        self._nodes = {}
+
+    def _remember(self, node):
+        """
+        Add node to the index of HashedLinkedList self.  Methods adding a
+        node call this before linking it in, so that an unhashable value
+        raises TypeError while self is still unchanged.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param HashedNode node: node of self, or about to be linked in
+        @rtype: None
+        """
+        self._nodes.setdefault(node.value, {})[id(node)] = node
+
+    def _forget(self, node):
+        """
+        Remove node from the index of HashedLinkedList self.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param HashedNode node: node about to be unlinked from self
+        @rtype: None
+        """
+        nodes = self._nodes[node.value]
+        del nodes[id(node)]
+        if not nodes:
+            del self._nodes[node.value]
+
+    def _first(self, value):
+        """
+        Return the first node of HashedLinkedList self holding value, or
+        None if there is none.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param object value: value to look for
+        @rtype: HashedNode|None
+        """
+        nodes = self._nodes.get(value)
+        if nodes is None:
+            return None
+        elif len(nodes) == 1:
+            return next(iter(nodes.values()))
+        node = self.front
+        while id(node) not in nodes:
+            node = node.next_
+        return node
+
+    def _unlink(self, node):
+        """
+        Remove node from HashedLinkedList self and its index.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param HashedNode node: node of self to remove
+        @rtype: None
+        """
+        if node.prev is None:
+            self.front = node.next_
+        else:
+            node.prev.next_ = node.next_
+        if node.next_ is None:
+            self.back = node.prev
+        else:
+            node.next_.prev = node.prev
+        self._forget(node)
+        self.size -= 1
+
+    def _reindex(self):
+        """
+        Recompute the predecessors, back and index of HashedLinkedList
+        self from its chain of next_ pointers, after relinking its nodes.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @rtype: None
+        """
+        self._nodes, self.back, self.size = {}, None, 0
+        node = self.front
+        while node is not None:
+            node.prev = self.back
+            self._remember(node)
+            self.back, self.size = node, self.size + 1
+            node = node.next_
+
+    def __contains__(self, value):
+        """
+        Return whether HashedLinkedList self contains value.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param object value: value to search for in self
+        @rtype: bool
+
+        >>> lnk = HashedLinkedList.from_iterable([0, 1, 2])
+        >>> 2 in lnk, 3 in lnk
+        (True, False)
+        """
+        return value in self._nodes
+
+    def __setitem__(self, index, value):
+        """
+        Set the value of list at position index to value.  Raise
+        IndexError if index >= self.size.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param int index: position of list to change
+        @param object value: new value for linked list
+        @rtype: None
+
+        >>> lnk = HashedLinkedList.from_iterable([5, 6])
+        >>> lnk[-1] = 7
+        >>> print(lnk), 6 in lnk, 7 in lnk
+        5 -> 7 ->|
+        (None, False, True)
+        """
+        if -self.size > index or index >= self.size:
+            raise IndexError("out of range!!!")
+        elif index < 0:
+            index += self.size
+        node = self.front
+        for _ in range(index):
+            node = node.next_
+        # hash value before changing anything
+        self._nodes.setdefault(value, {})
+        self._forget(node)
+        node.value = value
+        self._remember(node)
+
+    def append(self, value):
+        """
+        Insert value after self.back.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param object value: value to add
+        @rtype: None
+
+        >>> lnk = HashedLinkedList()
+        >>> lnk.append(5)
+        >>> lnk.append(6)
+        >>> print(lnk.front), lnk.back.prev.value
+        5 -> 6 ->|
+        (None, 5)
+        >>> lnk.append([7])
+        Traceback (most recent call last):
+        ...
+        TypeError: unhashable type: 'list'
+        >>> list(lnk), len(lnk)
+        ([5, 6], 2)
+        """
+        new_node = HashedNode(value, None, self.back)
+        self._remember(new_node)
+        if self.back is None:
+            self.front = new_node
+        else:
+            self.back.next_ = new_node
+        self.back = new_node
+        self.size += 1
+
+    def extend(self, values):
+        """
+        Insert each of values after self.back, in order.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param iterable values: values to add
+        @rtype: None
+
+        >>> lnk = HashedLinkedList.from_iterable('ab')
+        >>> lnk.extend(lnk)
+        >>> print(lnk)
+        a -> b -> a -> b ->|
+        """
+        if values is self:
+            # do not chase the nodes being added
+            values = list(values)
+        for value in values:
+            self.append(value)
+
+    def prepend(self, value):
+        """
+        Insert value before self.front.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param object value: value to add
+        @rtype: None
+
+        >>> lnk = HashedLinkedList()
+        >>> lnk.prepend(0)
+        >>> lnk.prepend(1)
+        >>> str(lnk.front), lnk.back.value
+        ('1 -> 0 ->|', 0)
+        """
+        new_node = HashedNode(value, self.front)
+        self._remember(new_node)
+        if self.front is None:
+            self.back = new_node
+        else:
+            self.front.prev = new_node
+        self.front = new_node
+        self.size += 1
+
+    def delete_front(self):
+        """
+        Delete self.front from self.
+
+        Assume self.front is not None
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @rtype: None
+
+        >>> lnk = HashedLinkedList.from_iterable([1, 0])
+        >>> lnk.delete_front()
+        >>> str(lnk.front), 1 in lnk
+        ('0 ->|', False)
+        """
+        assert self.front is not None, "unexpected None!"
+        self._unlink(self.front)
+
+    def insert_before(self, value1, value2):
+        """
+        Insert value1 into HashedLinkedList self before the first
+        occurrence of value2, if it exists.  Otherwise leave self
+        unchanged.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param object value1: value to insert, if possible
+        @param object value2: value to insert value1 ahead of
+        @rtype: None
+
+        >>> lnk = HashedLinkedList.from_iterable([1, 3])
+        >>> lnk.insert_before(2, 3)
+        >>> lnk.insert_before(0, 1)
+        >>> lnk.insert_before(9, 4)
+        >>> print(lnk), lnk.size
+        0 -> 1 -> 2 -> 3 ->|
+        (None, 4)
+        """
+        node = self._first(value2)
+        if node is not None:
+            new_node = HashedNode(value1, node, node.prev)
+            self._remember(new_node)
+            if node.prev is None:
+                self.front = new_node
+            else:
+                node.prev.next_ = new_node
+            node.prev = new_node
+            self.size += 1
+
+    def delete_after(self, value):
+        """
+        Remove the node following the first occurrence of value, if
+        possible, otherwise leave self unchanged.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param object value: value just before the deletion
+        @rtype: None
+
+        >>> lnk = HashedLinkedList.from_iterable([1, 2, 3])
+        >>> lnk.delete_after(2)
+        >>> lnk.delete_after(2)
+        >>> print(lnk), lnk.back.value, 3 in lnk
+        1 -> 2 ->|
+        (None, 2, False)
+        """
+        node = self._first(value)
+        if node is not None and node.next_ is not None:
+            self._unlink(node.next_)
+
+    def remove(self, value):
+        """
+        Remove the first occurrence of value from HashedLinkedList self.
+        Raise ValueError if there is none.  Removing a value and appending
+        it again moves it to the back, as an LRU ordered set does.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param object value: value to remove
+        @rtype: None
+
+        >>> lnk = HashedLinkedList.from_iterable('abc')
+        >>> lnk.remove('a')
+        >>> lnk.append('a')
+        >>> print(lnk)
+        b -> c -> a ->|
+        >>> lnk.remove('d')
+        Traceback (most recent call last):
+        ...
+        ValueError: 'd' is not in list
+        """
+        node = self._first(value)
+        if node is None:
+            raise ValueError("{!r} is not in list".format(value))
+        self._unlink(node)
+
+    def remove_first_double(self):
+        """
+        Remove the first of two equal neighbouring values, as LinkedList
+        does, and rebuild the index.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @rtype: None
+        """
+        LinkedList.remove_first_double(self)
+        self._reindex()
+
+    def sort(self, key=None):
+        """
+        Sort HashedLinkedList self as LinkedList does, by relinking its
+        nodes, and rebuild the predecessors and index.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param (object)->object|None key: function computing each value's key
+        @rtype: None
+
+        >>> lnk = HashedLinkedList.from_iterable([3, 1, 2])
+        >>> lnk.sort()
+        >>> print(lnk), lnk.back.prev.value
+        1 -> 2 -> 3 ->|
+        (None, 2)
+        """
+        LinkedList.sort(self, key)
+        self._reindex()
+
+    def copy(self):
+        """
+        Return a copy of HashedLinkedList self, with different nodes but
+        equivalent values.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @rtype: HashedLinkedList
+
+        >>> lnk = HashedLinkedList.from_iterable([7, 5])
+        >>> print(lnk.copy())
+        7 -> 5 ->|
+        """
+        return HashedLinkedList.from_iterable(self)
+
+    def __add__(self, other):
+        """
+        Return a new list by concatenating self to other.  Leave both self
+        and other unchanged.
+
+        @param HashedLinkedList self: this HashedLinkedList
+        @param LinkedList other: linked list to concatenate to self
+        @rtype: HashedLinkedList
+
+        >>> lnk = HashedLinkedList.from_iterable([5])
+        >>> print(lnk + LinkedList.from_iterable([7]))
+        5 -> 7 ->|
+        """
+        added_lnk = self.copy()
+        added_lnk.extend(other)
+        return added_lnk
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
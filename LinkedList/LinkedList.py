@@ -2,6 +2,9 @@
 """
 
 
+from itertools import islice
+
+
 class LinkedListNode:
     """
     Node to be used in linked list
@@ -10,6 +13,7 @@ class LinkedListNode:
     @param LinkedListNode next_: successor to this LinkedListNode
     @param object value: data this LinkedListNode represents
     """
+    __slots__ = ('value', 'next_')
     def __init__(self, value, next_=None):
         """
         Create LinkedListNode self with data value and successor next_.
@@ -142,21 +146,17 @@ class LinkedList:
         1
         >>>
         """
-        # Checks if the size of linked list is 0
-        if self.size != 0:
-            # checks if the value is in the linked list
-            if self.__contains__(value):
-                # run the loop over to assign current to required node
-                current = self.front
-                while current.value != value:
-                    current = current.next_
-                # checks if the value is the last item in the list
-                if current.next_ is not None:
-                    # if not then break the link and connect to next one
-                    current.next_ = current.next_.next_
-                    self.size -= 1
-        else:
-            assert self.back is None and self.front is None, "ooops"
+        # walk once to the first node holding value
+        current = self.front
+        while current is not None and current.value != value:
+            current = current.next_
+        # checks if there is a node after it to remove
+        if current is not None and current.next_ is not None:
+            if current.next_ is self.back:
+                self.back = current
+            # break the link and connect to the next one
+            current.next_ = current.next_.next_
+            self.size -= 1
 
     def append(self, value):
         """
@@ -192,6 +192,54 @@ class LinkedList:
         # remember to increase the size
         self.size += 1
 
+    def extend(self, values):
+        """
+        Insert each of values after self.back, in order, linking the new
+        nodes in one pass.
+
+        @param LinkedList self: this LinkedList
+        @param iterable values: values to add
+        @rtype: None
+
+        >>> lnk = LinkedList()
+        >>> lnk.append(0)
+        >>> lnk.extend(range(1, 3))
+        >>> print(lnk), lnk.back.value, lnk.size
+        0 -> 1 -> 2 ->|
+        (None, 2, 3)
+        """
+        if values is self:
+            # do not chase the nodes being added
+            values = list(values)
+        back, size = self.back, self.size
+        try:
+            for value in values:
+                new_node = LinkedListNode(value)
+                if back is None:
+                    self.front = new_node
+                else:
+                    back.next_ = new_node
+                back, size = new_node, size + 1
+        finally:
+            # keep the values added before values raised an error
+            self.back, self.size = back, size
+
+    @classmethod
+    def from_iterable(cls, values):
+        """
+        Return a new cls holding values, in order.
+
+        @param type cls: this class
+        @param iterable values: values to hold
+        @rtype: LinkedList
+
+        >>> print(LinkedList.from_iterable('abc'))
+        a -> b -> c ->|
+        """
+        lnk = cls()
+        lnk.extend(values)
+        return lnk
+
     def prepend(self, value):
         """
         Insert value before LinkedList self.front.
@@ -345,15 +393,15 @@ class LinkedList:
         >>> print(lnk)
         1 -> 2 -> 2 -> 2 ->|
         """
-        if self.__contains__(value2):
-            if self.size == 1 or self.front.value == value2:
-                self.prepend(value1)
-            else:
-                current_node, prev_node = self.front, self.front
-                while current_node.value != value2:
-                    prev_node = current_node
-                    current_node = current_node.next_
-                prev_node.next_ = LinkedListNode(value1, current_node)
+        # walk once to the first node holding value2, and its predecessor
+        prev_node, current_node = None, self.front
+        while current_node is not None and current_node.value != value2:
+            prev_node, current_node = current_node, current_node.next_
+        if current_node is not None and prev_node is None:
+            self.prepend(value1)
+        elif current_node is not None:
+            prev_node.next_ = LinkedListNode(value1, current_node)
+            self.size += 1
 
     def copy(self):
         """
@@ -403,11 +451,12 @@ class LinkedList:
 
     def __getitem__(self, index):
         """
-        Return the value at LinkedList self's position index.
+        Return the value at LinkedList self's position index, or a new
+        LinkedList of the values in slice index, found in one pass.
 
         @param LinkedList self: this LinkedList
-        @param int index: position to retrieve value from
-        @rtype: object
+        @param int|slice index: position to retrieve value from
+        @rtype: object|LinkedList
 
         >>> lnk = LinkedList()
         >>> lnk.append(1)
@@ -416,10 +465,23 @@ class LinkedList:
         0
         >>> lnk[-1]
         0
-        """
+        >>> lnk = LinkedList.from_iterable(range(6))
+        >>> print(lnk[1:5:2])
+        1 -> 3 ->|
+        >>> print(lnk[::-2])
+        5 -> 3 -> 1 ->|
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            if step > 0:
+                return self.from_iterable(islice(self, start, stop, step))
+            # walk forwards once over the values the slice covers, then
+            # take them backwards
+            span = list(islice(self, stop + 1, start + 1))
+            return self.from_iterable(span[::step])
         # deal with a negative index by adding self.size
         if (-self.size > index
-                or index > self.size):
+                or index >= self.size):
             raise IndexError("out of range!!!")
         elif index < 0:
             index += self.size
@@ -459,6 +521,90 @@ class LinkedList:
         # return False
         return False
 
+    def __iter__(self):
+        """
+        Yield the values of LinkedList self from front to back, walking
+        the list once.
+
+        @param LinkedList self: this LinkedList
+        @rtype: iterator
+
+        >>> lnk = LinkedList.from_iterable([1, 2, 3])
+        >>> list(lnk), sum(lnk)
+        ([1, 2, 3], 6)
+        """
+        current_node = self.front
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next_
+
+    def __reversed__(self):
+        """
+        Yield the values of LinkedList self from back to front.  The nodes
+        only point forwards, so the values are gathered in one pass
+        first.
+
+        @param LinkedList self: this LinkedList
+        @rtype: iterator
+
+        >>> list(reversed(LinkedList.from_iterable([1, 2, 3])))
+        [3, 2, 1]
+        """
+        yield from reversed(list(self))
+
+    def sort(self, key=None):
+        """
+        Sort LinkedList self in non-decreasing order of key(value), or of
+        the values themselves if key is None, keeping equal values in
+        their original order.  The existing nodes are relinked by a
+        bottom-up natural merge sort: runs already in order are found in
+        one pass and merged like a binary counter, so the only new node is
+        one placeholder shared by every merge, only O(log n) runs wait to
+        be merged at once, and a sorted list takes n - 1 comparisons.
+
+        @param LinkedList self: this LinkedList
+        @param (object)->object|None key: function computing each value's key
+        @rtype: None
+
+        >>> lnk = LinkedList()
+        >>> for value in [3, 1, 2, 5, 4]:
+        ...     lnk.append(value)
+        >>> lnk.sort()
+        >>> print(lnk)
+        1 -> 2 -> 3 -> 4 -> 5 ->|
+        >>> lnk.back.value, lnk.size
+        (5, 5)
+        >>> lnk.sort(key=lambda value: -value)
+        >>> print(lnk)
+        5 -> 4 -> 3 -> 2 -> 1 ->|
+        """
+        if self.size < 2:
+            return
+        # pending[i] is None, or the (front, back) of a run made by
+        # merging 2 ** i runs, from earlier in the list than pending[i - 1]
+        pending = []
+        start = LinkedListNode(None)
+        node = self.front
+        while node is not None:
+            end = _run_end(node, key)
+            node, end.next_, run = end.next_, None, (node, end)
+            i = 0
+            while i < len(pending) and pending[i] is not None:
+                run = _merge_runs(*pending[i], *run, key=key, start=start)
+                pending[i] = None
+                i += 1
+            if i == len(pending):
+                pending.append(run)
+            else:
+                pending[i] = run
+        run = None
+        for waiting in pending:
+            if waiting is not None:
+                run = (waiting if run is None
+                       else _merge_runs(*waiting, *run, key=key,
+                                        start=start))
+        self.front, self.back = run
+
     def remove_first_double(self):
         """
         >>> list_ = LinkedList()
@@ -581,6 +727,74 @@ class LinkedList:
 
 
 
+def _run_end(node, key):
+    """
+    Return the last node of the run of nodes from node onward whose values
+    are in non-decreasing order of key(value), or of the values if key is
+    None.
+
+    @param LinkedListNode node: first node of the run
+    @param (object)->object|None key: function computing each value's key
+    @rtype: LinkedListNode
+
+    >>> _run_end(LinkedListNode(1, LinkedListNode(2, LinkedListNode(0))),
+    ...          None).value
+    2
+    """
+    previous = node.value if key is None else key(node.value)
+    while node.next_ is not None:
+        current = (node.next_.value if key is None
+                   else key(node.next_.value))
+        if current < previous:
+            break
+        node, previous = node.next_, current
+    return node
+
+
+def _merge_runs(first, first_end, second, second_end, key, start):
+    """
+    Link the nodes of the sorted runs first...first_end and
+    second...second_end, each ending in None, into one sorted run, taking
+    from first on ties, with start as a placeholder before the result.
+    Return the first and last nodes of the result.  The key of each
+    run's current node is computed only once.
+
+    @param LinkedListNode first: first node of the first run
+    @param LinkedListNode first_end: last node of the first run
+    @param LinkedListNode second: first node of the second run
+    @param LinkedListNode second_end: last node of the second run
+    @param (object)->object|None key: function computing each value's key
+    @param LinkedListNode start: node to link the result after
+    @rtype: (LinkedListNode, LinkedListNode)
+
+    >>> end, second = LinkedListNode(3), LinkedListNode(2)
+    >>> front, back = _merge_runs(LinkedListNode(1, end), end, second,
+    ...                           second, None, LinkedListNode(None))
+    >>> print(front)
+    1 -> 2 -> 3 ->|
+    >>> back.value
+    3
+    """
+    tail = start
+    first_key = first.value if key is None else key(first.value)
+    second_key = second.value if key is None else key(second.value)
+    while True:
+        if second_key < first_key:
+            tail.next_ = second
+            tail, second = second, second.next_
+            if second is None:
+                tail.next_ = first
+                return start.next_, first_end
+            second_key = second.value if key is None else key(second.value)
+        else:
+            tail.next_ = first
+            tail, first = first, first.next_
+            if first is None:
+                tail.next_ = second
+                return start.next_, second_end
+            first_key = first.value if key is None else key(first.value)
+
+
 def merge_list(L1, L2):
     """ addfad
     """
@@ -0,0 +1,491 @@
+""" linked list with a skip list index for finding positions quickly
+"""
+
+
+import random
+
+from LinkedList import LinkedList, LinkedListNode
+
+
+# Most levels of forward pointers any node has, counting next_.
+_MAX_LEVEL = 32
+
+
+class SkipNode(LinkedListNode):
+    """
+    LinkedListNode that may also point further along its list, for the
+    positional index of a SkipLinkedList.  next_ is level 0; forward[k]
+    is level k + 1, and width[k] is how many nodes along it is.
+
+    === Attributes ===
+    @param list[SkipNode|None]|tuple forward: nodes further along, one per
+                                              level above 0
+    @param list[int]|tuple width: number of steps to each forward node
+    """
+    __slots__ = ('forward', 'width')
+
+    def __init__(self, value, levels=1, next_=None):
+        """
+        Create SkipNode self with value and successor next_, with levels
+        levels of pointers counting next_.
+
+        @param SkipNode self: this SkipNode
+        @param object value: data of this node
+        @param int levels: number of levels of pointers, at least 1
+        @param SkipNode|None next_: successor to this SkipNode
+        @rtype: None
+        """
+        LinkedListNode.__init__(self, value, next_)
+        if levels == 1:
+            # most nodes have no upper levels: share one empty tuple
+            self.forward = self.width = ()
+        else:
+            self.forward, self.width = [None] * (levels - 1), [0] * (levels - 1)
+
+
+def _random_levels():
+    """
+    Return a random number of levels for a new node: 1 with probability
+    1/2, 2 with probability 1/4, and so on, up to _MAX_LEVEL.
+
+    @rtype: int
+
+    >>> 1 <= _random_levels() <= _MAX_LEVEL
+    True
+    """
+    levels = 1
+    while levels < _MAX_LEVEL and random.random() < 0.5:
+        levels += 1
+    return levels
+
+
+class SkipLinkedList(LinkedList):
+    """
+    LinkedList of SkipNodes with an indexable skip list over them, so
+    that finding, setting, inserting or deleting the value at an index
+    takes O(log n) expected time instead of walking from front.  front,
+    back, size and every node's next_ stay as in LinkedList, so the
+    methods that only read the list work unchanged; the methods that
+    change it keep the index up to date.
+
+    === Attributes ===
+    @param SkipNode _head: placeholder before front, with pointers at
+                           every level
+    @param int _levels: number of levels above 0 in use
+    """
+
+    def __init__(self):
+        """
+        Create an empty SkipLinkedList.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @rtype: None
+        """
+        LinkedList.__init__(self)
+        self._head = SkipNode(None, _MAX_LEVEL)
+        self._levels = 0
+
+    def _predecessors(self, index):
+        """
+        Return a list of the last node at or before position index (the
+        node before the value at index) on each level, from 0 up, and a
+        list of their positions.  _head is at position 0, and the value
+        at index at position index + 1.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param int index: index of the value to find the predecessors of
+        @rtype: (list[SkipNode], list[int])
+        """
+        update, steps = [self._head] * (_MAX_LEVEL), [0] * (_MAX_LEVEL)
+        node, position = self._head, 0
+        for level in range(self._levels, 0, -1):
+            k = level - 1
+            after = node.forward[k]
+            while after is not None and position + node.width[k] <= index:
+                position += node.width[k]
+                node, after = after, after.forward[k]
+            update[level], steps[level] = node, position
+        while position < index:
+            node = node.next_
+            position += 1
+        update[0], steps[0] = node, position
+        return update, steps
+
+    def _node_at(self, index):
+        """
+        Return the node holding the value at index, which may be negative
+        to count from the back.  Raise IndexError if there is none.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param int index: position of the value
+        @rtype: SkipNode
+        """
+        if -self.size > index or index >= self.size:
+            raise IndexError("out of range!!!")
+        elif index < 0:
+            index += self.size
+        return self._predecessors(index)[0][0].next_
+
+    def __getitem__(self, index):
+        """
+        Return the value at SkipLinkedList self's position index, or a new
+        SkipLinkedList of the values in slice index.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param int|slice index: position to retrieve value from
+        @rtype: object|SkipLinkedList
+
+        >>> lnk = SkipLinkedList.from_iterable(range(100))
+        >>> lnk[42], lnk[-1]
+        (42, 99)
+        >>> print(lnk[95:])
+        95 -> 96 -> 97 -> 98 -> 99 ->|
+        """
+        if isinstance(index, slice):
+            return LinkedList.__getitem__(self, index)
+        return self._node_at(index).value
+
+    def __setitem__(self, index, value):
+        """
+        Set the value of list at position index to value.  Raise
+        IndexError if index >= self.size.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param int index: position of list to change
+        @param object value: new value for linked list
+        @rtype: None
+
+        >>> lnk = SkipLinkedList()
+        >>> lnk.append(5)
+        >>> lnk[0] = 7
+        >>> print(lnk)
+        7 ->|
+        """
+        self._node_at(index).value = value
+
+    def insert_at(self, index, value):
+        """
+        Insert value into SkipLinkedList self so that it is at index.
+        Raise IndexError unless 0 <= index <= self.size.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param int index: position for value
+        @param object value: value to insert
+        @rtype: None
+
+        >>> lnk = SkipLinkedList()
+        >>> lnk.insert_at(0, 'b')
+        >>> lnk.insert_at(0, 'a')
+        >>> lnk.insert_at(2, 'd')
+        >>> lnk.insert_at(2, 'c')
+        >>> print(lnk), lnk.back.value, lnk.size
+        a -> b -> c -> d ->|
+        (None, 'd', 4)
+        """
+        if not 0 <= index <= self.size:
+            raise IndexError("out of range!!!")
+        update, steps = self._predecessors(index)
+        levels = _random_levels()
+        node = SkipNode(value, levels, update[0].next_)
+        update[0].next_ = node
+        for level in range(1, max(levels, self._levels + 1)):
+            before = update[level]
+            if level < levels:
+                node.forward[level - 1] = before.forward[level - 1]
+                if node.forward[level - 1] is not None:
+                    node.width[level - 1] = (before.width[level - 1] -
+                                             (index - steps[level]))
+                before.forward[level - 1] = node
+                before.width[level - 1] = index + 1 - steps[level]
+            elif before.forward[level - 1] is not None:
+                # the pointer now jumps over one more node
+                before.width[level - 1] += 1
+        self._levels = max(self._levels, levels - 1)
+        self.front = self._head.next_
+        if node.next_ is None:
+            self.back = node
+        self.size += 1
+
+    def delete_at(self, index):
+        """
+        Delete the value at index from SkipLinkedList self, which may be
+        negative to count from the back.  Raise IndexError if there is no
+        such value.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param int index: position of the value to delete
+        @rtype: None
+
+        >>> lnk = SkipLinkedList()
+        >>> for value in range(5):
+        ...     lnk.append(value)
+        >>> lnk.delete_at(2)
+        >>> lnk.delete_at(-1)
+        >>> print(lnk), lnk[2], lnk.back.value
+        0 -> 1 -> 3 ->|
+        (None, 3, 3)
+        """
+        if -self.size > index or index >= self.size:
+            raise IndexError("out of range!!!")
+        elif index < 0:
+            index += self.size
+        update = self._predecessors(index)[0]
+        node = update[0].next_
+        update[0].next_ = node.next_
+        for level in range(1, self._levels + 1):
+            before = update[level]
+            if before.forward[level - 1] is node:
+                before.forward[level - 1] = node.forward[level - 1]
+                before.width[level - 1] += node.width[level - 1] - 1
+            elif before.forward[level - 1] is not None:
+                before.width[level - 1] -= 1
+        while self._levels > 0 and self._head.forward[self._levels - 1] is None:
+            self._levels -= 1
+        self.front = self._head.next_
+        if self.back is node:
+            self.back = update[0] if update[0] is not self._head else None
+        self.size -= 1
+
+    def _rebuild(self):
+        """
+        Recompute the upper levels of the index of SkipLinkedList self,
+        and _head, front and back, from the chain of next_ pointers
+        starting at _head.next_.  Each node keeps its number of levels.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @rtype: None
+        """
+        last = [self._head] * _MAX_LEVEL
+        last_position = [0] * _MAX_LEVEL
+        self._head.forward[:] = [None] * (_MAX_LEVEL - 1)
+        self._levels, self.back, self.size = 0, None, 0
+        node = self._head.next_
+        while node is not None:
+            self.size += 1
+            for level in range(1, len(node.forward) + 1):
+                before = last[level]
+                before.forward[level - 1] = node
+                before.width[level - 1] = self.size - last_position[level]
+                node.forward[level - 1] = None
+                last[level], last_position[level] = node, self.size
+            self._levels = max(self._levels, len(node.forward))
+            self.back, node = node, node.next_
+        self.front = self._head.next_
+
+    def append(self, value):
+        """
+        Insert value at the back of SkipLinkedList self.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param object value: value to add
+        @rtype: None
+
+        >>> lnk = SkipLinkedList()
+        >>> lnk.append(5)
+        >>> lnk.append(6)
+        >>> print(lnk.front)
+        5 -> 6 ->|
+        """
+        self.insert_at(self.size, value)
+
+    def extend(self, values):
+        """
+        Insert each of values at the back of SkipLinkedList self, in
+        order.  Many values are linked on in one pass and the index is
+        rebuilt once, rather than searching it for each value.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param iterable values: values to add
+        @rtype: None
+
+        >>> lnk = SkipLinkedList()
+        >>> lnk.append(0)
+        >>> lnk.extend(range(1, 20))
+        >>> lnk[19], lnk.back.value, lnk.size
+        (19, 19, 20)
+        """
+        values = list(values)
+        if len(values) < self.size:
+            # rebuilding would cost more than the searches
+            for value in values:
+                self.append(value)
+            return
+        back = self._head if self.back is None else self.back
+        for value in values:
+            back.next_ = SkipNode(value, _random_levels())
+            back = back.next_
+        self._rebuild()
+
+    def prepend(self, value):
+        """
+        Insert value at the front of SkipLinkedList self.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param object value: value to add
+        @rtype: None
+
+        >>> lnk = SkipLinkedList()
+        >>> lnk.prepend(0)
+        >>> lnk.prepend(1)
+        >>> str(lnk.front)
+        '1 -> 0 ->|'
+        """
+        self.insert_at(0, value)
+
+    def delete_front(self):
+        """
+        Delete the front value of SkipLinkedList self.
+
+        Assume self.front is not None
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @rtype: None
+
+        >>> lnk = SkipLinkedList()
+        >>> lnk.prepend(0)
+        >>> lnk.prepend(1)
+        >>> lnk.delete_front()
+        >>> str(lnk.front)
+        '0 ->|'
+        """
+        assert self.front is not None, "unexpected None!"
+        self.delete_at(0)
+
+    def _index(self, value):
+        """
+        Return the index of the first occurrence of value in
+        SkipLinkedList self, or None if it does not occur.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param object value: value to look for
+        @rtype: int|None
+        """
+        node, index = self.front, 0
+        while node is not None:
+            if node.value == value:
+                return index
+            node, index = node.next_, index + 1
+        return None
+
+    def insert_before(self, value1, value2):
+        """
+        Insert value1 into SkipLinkedList self before the first occurrence
+        of value2, if it exists.  Otherwise leave self unchanged.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param object value1: value to insert, if possible
+        @param object value2: value to insert value1 ahead of
+        @rtype: None
+
+        >>> lnk = SkipLinkedList()
+        >>> lnk.append(2)
+        >>> lnk.insert_before(1, 2)
+        >>> print(lnk)
+        1 -> 2 ->|
+        """
+        index = self._index(value2)
+        if index is not None:
+            self.insert_at(index, value1)
+
+    def delete_after(self, value):
+        """
+        Remove the node following the first occurrence of value, if
+        possible, otherwise leave self unchanged.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param object value: value just before the deletion
+        @rtype: None
+
+        >>> lnk = SkipLinkedList()
+        >>> lnk.append(1)
+        >>> lnk.append(2)
+        >>> lnk.delete_after(1)
+        >>> print(lnk), lnk.back.value
+        1 ->|
+        (None, 1)
+        """
+        index = self._index(value)
+        if index is not None and index + 1 < self.size:
+            self.delete_at(index + 1)
+
+    def remove_first_double(self):
+        """
+        Remove the first of two equal neighbouring values, as LinkedList
+        does, and rebuild the index.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @rtype: None
+        """
+        self._head.next_ = self.front
+        LinkedList.remove_first_double(self)
+        self._head.next_ = self.front
+        self._rebuild()
+
+    def sort(self, key=None):
+        """
+        Sort SkipLinkedList self as LinkedList does, by relinking its
+        nodes, and rebuild the index.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param (object)->object|None key: function computing each value's key
+        @rtype: None
+
+        >>> lnk = SkipLinkedList()
+        >>> for value in [3, 1, 2]:
+        ...     lnk.append(value)
+        >>> lnk.sort()
+        >>> print(lnk), lnk[2]
+        1 -> 2 -> 3 ->|
+        (None, 3)
+        """
+        LinkedList.sort(self, key)
+        self._head.next_ = self.front
+        self._rebuild()
+
+    def copy(self):
+        """
+        Return a copy of SkipLinkedList self, with different nodes but
+        equivalent values.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @rtype: SkipLinkedList
+
+        >>> lnk = SkipLinkedList()
+        >>> lnk.prepend(5)
+        >>> lnk.prepend(7)
+        >>> print(lnk.copy())
+        7 -> 5 ->|
+        """
+        copy_lnk = SkipLinkedList()
+        current = self.front
+        while current is not None:
+            copy_lnk.append(current.value)
+            current = current.next_
+        return copy_lnk
+
+    def __add__(self, other):
+        """
+        Return a new list by concatenating self to other.  Leave both self
+        and other unchanged.
+
+        @param SkipLinkedList self: this SkipLinkedList
+        @param LinkedList other: linked list to concatenate to self
+        @rtype: SkipLinkedList
+
+        >>> lnk1, lnk2 = SkipLinkedList(), SkipLinkedList()
+        >>> lnk1.append(5)
+        >>> lnk2.append(7)
+        >>> print(lnk1 + lnk2)
+        5 -> 7 ->|
+        """
+        added_lnk = self.copy()
+        current = other.front
+        while current is not None:
+            added_lnk.append(current.value)
+            current = current.next_
+        return added_lnk
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
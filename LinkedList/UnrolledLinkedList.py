@@ -0,0 +1,526 @@
+""" linked list whose nodes each hold a block of values
+"""
+
+
+from itertools import islice
+
+
+class UnrolledNode:
+    """
+    Node of an UnrolledLinkedList, holding a block of consecutive values.
+
+    === Attributes ===
+    @param list values: values in this node, in order, never empty while
+                        the node is in a list
+    @param UnrolledNode|None next_: successor to this UnrolledNode
+    """
+    __slots__ = ('values', 'next_')
+
+    def __init__(self, values, next_=None):
+        """
+        Create UnrolledNode self holding list values, with successor next_.
+
+        @param UnrolledNode self: this UnrolledNode
+        @param list values: values of this node
+        @param UnrolledNode|None next_: successor to this UnrolledNode
+        @rtype: None
+        """
+        self.values, self.next_ = values, next_
+
+
+class UnrolledLinkedList:
+    """
+    Linked list of values with the same methods as LinkedList, but each
+    node holds up to capacity values, so scans step through blocks of
+    values instead of one node per value, and each value costs a slot
+    in a list rather than a whole node.  A node that fills up is split
+    in two, and one that drops below a quarter full is merged with its
+    successor if they fit in one node.
+
+    === Attributes ===
+    @param UnrolledNode|None front: first node of this UnrolledLinkedList
+    @param UnrolledNode|None back: last node of this UnrolledLinkedList
+    @param int size: number of values in this UnrolledLinkedList
+    @param int capacity: most values in one node
+    """
+
+    def __init__(self, capacity=64):
+        """
+        Create an empty UnrolledLinkedList with up to capacity values per
+        node.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param int capacity: most values in one node, at least 2
+        @rtype: None
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.front, self.back, self.size = None, None, 0
+        self.capacity = capacity
+
+    def __str__(self):
+        """
+        Return a human-friendly string representation of
+        UnrolledLinkedList self, like LinkedList's.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @rtype: str
+
+        >>> lnk = UnrolledLinkedList()
+        >>> print(lnk)
+        I'm so empty... experiencing existential angst!!!
+        >>> lnk.append(5)
+        >>> lnk.append(7)
+        >>> print(lnk)
+        5 -> 7 ->|
+        """
+        if self.front is None:
+            assert self.back is None and self.size == 0, "ooooops!"
+            return "I'm so empty... experiencing existential angst!!!"
+        return "".join("{} -> ".format(value) for value in self)[:-1] + "|"
+
+    def __eq__(self, other):
+        """
+        Return whether UnrolledLinkedList self holds the same values as
+        other, in the same order, however they are split into nodes.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param UnrolledLinkedList|object other: object to compare to self
+        @rtype: bool
+
+        >>> lnk1, lnk2 = UnrolledLinkedList(), UnrolledLinkedList(2)
+        >>> for value in range(5):
+        ...     lnk1.append(value)
+        ...     lnk2.append(value)
+        >>> lnk1 == lnk2
+        True
+        """
+        return (type(self) == type(other) and self.size == other.size and
+                all(a == b for a, b in zip(self, other)))
+
+    def __iter__(self):
+        """
+        Yield the values of UnrolledLinkedList self from front to back.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @rtype: iterator
+
+        >>> lnk = UnrolledLinkedList()
+        >>> lnk.append(1)
+        >>> lnk.prepend(0)
+        >>> list(lnk)
+        [0, 1]
+        """
+        node = self.front
+        while node is not None:
+            yield from node.values
+            node = node.next_
+
+    def __reversed__(self):
+        """
+        Yield the values of UnrolledLinkedList self from back to front.
+        The nodes only point forwards, so they are gathered in one pass
+        first, and each node's block is read backwards.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @rtype: iterator
+
+        >>> lnk = UnrolledLinkedList.from_iterable(range(5))
+        >>> list(reversed(lnk))
+        [4, 3, 2, 1, 0]
+        """
+        nodes, node = [], self.front
+        while node is not None:
+            nodes.append(node)
+            node = node.next_
+        for node in reversed(nodes):
+            yield from reversed(node.values)
+
+    def __len__(self):
+        """
+        Return the number of values in UnrolledLinkedList self.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @rtype: int
+
+        >>> len(UnrolledLinkedList())
+        0
+        """
+        return self.size
+
+    def __contains__(self, value):
+        """
+        Return whether UnrolledLinkedList self contains value.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param object value: value to search for in self
+        @rtype: bool
+
+        >>> lnk = UnrolledLinkedList()
+        >>> lnk.append(0)
+        >>> lnk.append(1)
+        >>> 1 in lnk, 2 in lnk
+        (True, False)
+        """
+        return self._find(value)[1] is not None
+
+    def _find(self, value):
+        """
+        Return (previous node, node, offset) of the first occurrence of
+        value in UnrolledLinkedList self, or (None, None, None) if it
+        does not occur.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param object value: value to search for
+        @rtype: (UnrolledNode|None, UnrolledNode|None, int|None)
+        """
+        previous, node = None, self.front
+        while node is not None:
+            # the search within a node runs at C speed
+            if value in node.values:
+                return previous, node, node.values.index(value)
+            previous, node = node, node.next_
+        return None, None, None
+
+    def _locate(self, index):
+        """
+        Return (node, offset) of the value at index in UnrolledLinkedList
+        self, which may be negative to count from the back.  Raise
+        IndexError if there is no such value.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param int index: position of the value
+        @rtype: (UnrolledNode, int)
+        """
+        if -self.size > index or index >= self.size:
+            raise IndexError("out of range!!!")
+        elif index < 0:
+            index += self.size
+        node = self.front
+        # skip whole nodes at a time
+        while index >= len(node.values):
+            index -= len(node.values)
+            node = node.next_
+        return node, index
+
+    def __getitem__(self, index):
+        """
+        Return the value at UnrolledLinkedList self's position index, or
+        a new UnrolledLinkedList of the values in slice index, found in
+        one pass.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param int|slice index: position to retrieve value from
+        @rtype: object|UnrolledLinkedList
+
+        >>> lnk = UnrolledLinkedList(2)
+        >>> for value in range(5):
+        ...     lnk.append(value)
+        >>> lnk[3], lnk[-1]
+        (3, 4)
+        >>> print(lnk[-2::-2])
+        3 -> 1 ->|
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            sliced = UnrolledLinkedList(self.capacity)
+            if step > 0:
+                sliced.extend(islice(self, start, stop, step))
+            else:
+                # walk forwards once over the values the slice covers,
+                # then take them backwards
+                sliced.extend(list(islice(self, stop + 1, start + 1))[::step])
+            return sliced
+        node, offset = self._locate(index)
+        return node.values[offset]
+
+    def __setitem__(self, index, value):
+        """
+        Set the value of list at position index to value.  Raise
+        IndexError if index >= self.size.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param int index: position of list to change
+        @param object value: new value for linked list
+        @rtype: None
+
+        >>> lnk = UnrolledLinkedList()
+        >>> lnk.append(5)
+        >>> lnk[0] = 7
+        >>> print(lnk)
+        7 ->|
+        """
+        node, offset = self._locate(index)
+        node.values[offset] = value
+
+    def append(self, value):
+        """
+        Insert value after the last value of UnrolledLinkedList self.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param object value: value to add
+        @rtype: None
+
+        >>> lnk = UnrolledLinkedList(2)
+        >>> for value in range(3):
+        ...     lnk.append(value)
+        >>> lnk.size, lnk.back.values
+        (3, [2])
+        """
+        if self.back is None:
+            self.front = self.back = UnrolledNode([value])
+        elif len(self.back.values) == self.capacity:
+            # start a new node, so appending fills nodes completely
+            self.back.next_ = UnrolledNode([value])
+            self.back = self.back.next_
+        else:
+            self.back.values.append(value)
+        self.size += 1
+
+    def extend(self, values):
+        """
+        Insert each of values after the last value of UnrolledLinkedList
+        self, in order, filling whole nodes at a time.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param iterable values: values to add
+        @rtype: None
+
+        >>> lnk = UnrolledLinkedList(2)
+        >>> lnk.append(0)
+        >>> lnk.extend(range(1, 4))
+        >>> print(lnk), lnk.size, lnk.back.values
+        0 -> 1 -> 2 -> 3 ->|
+        (None, 4, [2, 3])
+        """
+        # do not chase the values being added
+        values = iter(list(values) if values is self else values)
+        if self.back is not None:
+            before = len(self.back.values)
+            self.back.values.extend(islice(values,
+                                           self.capacity - before))
+            self.size += len(self.back.values) - before
+        block = list(islice(values, self.capacity))
+        while block:
+            node = UnrolledNode(block)
+            if self.back is None:
+                self.front = node
+            else:
+                self.back.next_ = node
+            self.back = node
+            self.size += len(block)
+            block = list(islice(values, self.capacity))
+
+    @classmethod
+    def from_iterable(cls, values, capacity=64):
+        """
+        Return a new cls holding values, in order, with up to capacity
+        values per node.
+
+        @param type cls: this class
+        @param iterable values: values to hold
+        @param int capacity: most values in one node, at least 2
+        @rtype: UnrolledLinkedList
+
+        >>> print(UnrolledLinkedList.from_iterable('abc', 2))
+        a -> b -> c ->|
+        """
+        lnk = cls(capacity)
+        lnk.extend(values)
+        return lnk
+
+    def prepend(self, value):
+        """
+        Insert value before the first value of UnrolledLinkedList self.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param object value: value to add
+        @rtype: None
+
+        >>> lnk = UnrolledLinkedList()
+        >>> lnk.prepend(0)
+        >>> lnk.prepend(1)
+        >>> print(lnk)
+        1 -> 0 ->|
+        """
+        if self.front is None:
+            self.front = self.back = UnrolledNode([value])
+        elif len(self.front.values) == self.capacity:
+            self.front = UnrolledNode([value], self.front)
+        else:
+            self.front.values.insert(0, value)
+        self.size += 1
+
+    def delete_front(self):
+        """
+        Delete the first value of UnrolledLinkedList self.
+
+        Assume self.front is not None
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @rtype: None
+
+        >>> lnk = UnrolledLinkedList()
+        >>> lnk.append(0)
+        >>> lnk.append(1)
+        >>> lnk.delete_front()
+        >>> print(lnk)
+        1 ->|
+        """
+        assert self.front is not None, "unexpected None!"
+        self._delete(None, self.front, 0)
+
+    def _delete(self, previous, node, offset):
+        """
+        Delete the value at offset in node, whose predecessor is previous,
+        and unlink node if that empties it, or merge it with its
+        successor if it is under a quarter full and they fit in one node.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param UnrolledNode|None previous: predecessor of node
+        @param UnrolledNode node: node holding the value
+        @param int offset: position of the value in node
+        @rtype: None
+        """
+        del node.values[offset]
+        self.size -= 1
+        following = node.next_
+        if not node.values:
+            if previous is None:
+                self.front = following
+            else:
+                previous.next_ = following
+            if self.back is node:
+                self.back = previous
+        elif (following is not None and
+              len(node.values) < self.capacity // 4 and
+              len(node.values) + len(following.values) <= self.capacity):
+            node.values.extend(following.values)
+            node.next_ = following.next_
+            if self.back is following:
+                self.back = node
+
+    def _insert(self, node, offset, value):
+        """
+        Insert value at offset in node, splitting node in two if it then
+        holds more than capacity values.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param UnrolledNode node: node to insert into
+        @param int offset: position in node to insert at
+        @param object value: value to insert
+        @rtype: None
+        """
+        node.values.insert(offset, value)
+        self.size += 1
+        if len(node.values) > self.capacity:
+            half = len(node.values) // 2
+            node.next_ = UnrolledNode(node.values[half:], node.next_)
+            del node.values[half:]
+            if self.back is node:
+                self.back = node.next_
+
+    def insert_before(self, value1, value2):
+        """
+        Insert value1 into UnrolledLinkedList self before the first
+        occurrence of value2, if it exists.  Otherwise leave self
+        unchanged.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param object value1: value to insert, if possible
+        @param object value2: value to insert value1 ahead of
+        @rtype: None
+
+        >>> lnk = UnrolledLinkedList(2)
+        >>> for value in [2, 2, 2]:
+        ...     lnk.append(value)
+        >>> lnk.insert_before(1, 2)
+        >>> lnk.insert_before(3, 4)
+        >>> print(lnk)
+        1 -> 2 -> 2 -> 2 ->|
+        """
+        node, offset = self._find(value2)[1:]
+        if node is not None:
+            self._insert(node, offset, value1)
+
+    def delete_after(self, value):
+        """
+        Remove the value following the first occurrence of value, if
+        possible, otherwise leave self unchanged.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param object value: value just before the deletion
+        @rtype: None
+
+        >>> lnk = UnrolledLinkedList(2)
+        >>> for value in [1, 2, 3]:
+        ...     lnk.append(value)
+        >>> lnk.delete_after(2)
+        >>> lnk.delete_after(2)
+        >>> print(lnk)
+        1 -> 2 ->|
+        """
+        previous, node, offset = self._find(value)
+        if node is None:
+            return
+        if offset + 1 < len(node.values):
+            self._delete(previous, node, offset + 1)
+        elif node.next_ is not None:
+            self._delete(node, node.next_, 0)
+
+    def copy(self):
+        """
+        Return a copy of UnrolledLinkedList self, with different nodes
+        but equivalent values.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @rtype: UnrolledLinkedList
+
+        >>> lnk = UnrolledLinkedList()
+        >>> lnk.prepend(5)
+        >>> lnk.prepend(7)
+        >>> print(lnk.copy())
+        7 -> 5 ->|
+        """
+        copy_lnk = UnrolledLinkedList(self.capacity)
+        node = self.front
+        while node is not None:
+            copied = UnrolledNode(node.values.copy())
+            if copy_lnk.back is None:
+                copy_lnk.front = copied
+            else:
+                copy_lnk.back.next_ = copied
+            copy_lnk.back = copied
+            node = node.next_
+        copy_lnk.size = self.size
+        return copy_lnk
+
+    def __add__(self, other):
+        """
+        Return a new list by concatenating self to other.  Leave both
+        self and other unchanged.
+
+        @param UnrolledLinkedList self: this UnrolledLinkedList
+        @param UnrolledLinkedList other: list to concatenate to self
+        @rtype: UnrolledLinkedList
+
+        >>> lnk1, lnk2 = UnrolledLinkedList(), UnrolledLinkedList()
+        >>> lnk1.append(5)
+        >>> lnk2.append(7)
+        >>> print(lnk1 + lnk2)
+        5 -> 7 ->|
+        """
+        added_lnk, tail = self.copy(), other.copy()
+        if added_lnk.back is None:
+            added_lnk.front = tail.front
+        else:
+            added_lnk.back.next_ = tail.front
+        if tail.back is not None:
+            added_lnk.back = tail.back
+        added_lnk.size += tail.size
+        return added_lnk
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,118 @@
+""" benchmark the linked lists in this directory
+
+Run python benchmark.py [n] to build lists of n values (10^6 by default)
+with each kind of linked list, and print the time and memory it takes
+to build them, scan them for a missing value, iterate over them, and
+look up values by index.
+"""
+
+
+import random
+import sys
+import time
+import tracemalloc
+import warnings
+
+with warnings.catch_warnings():
+    # LinkedList.py compares ints with "is"; that is not measured here
+    warnings.simplefilter('ignore', SyntaxWarning)
+    from LinkedList import LinkedList
+    from SkipLinkedList import SkipLinkedList
+    from HashedLinkedList import HashedLinkedList
+    from DoublyLinkedList import DoublyLinkedList
+from UnrolledLinkedList import UnrolledLinkedList
+
+
+# Linked list classes to compare, by name.
+LISTS = {'LinkedList': LinkedList,
+         'UnrolledLinkedList': UnrolledLinkedList,
+         'SkipLinkedList': SkipLinkedList,
+         'HashedLinkedList': HashedLinkedList,
+         'DoublyLinkedList': DoublyLinkedList}
+
+
+def build(cls, n):
+    """
+    Return a new cls holding n small ints, the seconds it took to build,
+    and the bytes it takes.  Small ints are cached by Python, so the
+    bytes are those of the list itself, not of its values.
+
+    @param type cls: linked list class
+    @param int n: number of values
+    @rtype: (object, float, int)
+
+    >>> lnk, seconds, size = build(UnrolledLinkedList, 10)
+    >>> len(lnk), size > 0
+    (10, True)
+    """
+    tracemalloc.start()
+    try:
+        start_memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        lnk = cls.from_iterable(value % 256 for value in range(n))
+        seconds = time.perf_counter() - start
+        return lnk, seconds, tracemalloc.get_traced_memory()[0] - start_memory
+    finally:
+        tracemalloc.stop()
+
+
+def time_scan(lnk):
+    """
+    Return the seconds lnk takes to find that it does not contain -1.
+
+    @param object lnk: linked list to scan
+    @rtype: float
+    """
+    start = time.perf_counter()
+    assert -1 not in lnk
+    return time.perf_counter() - start
+
+
+def time_iteration(lnk):
+    """
+    Return the seconds lnk takes to iterate over all its values, as
+    sum(lnk) does.
+
+    @param object lnk: linked list to iterate over
+    @rtype: float
+    """
+    start = time.perf_counter()
+    for _ in lnk:
+        pass
+    return time.perf_counter() - start
+
+
+def time_lookups(lnk, lookups):
+    """
+    Return the seconds lnk takes to look up lookups random indexes.
+
+    @param object lnk: linked list to index
+    @param int lookups: number of indexes to look up
+    @rtype: float
+    """
+    indexes = [random.randrange(len(lnk)) for _ in range(lookups)]
+    start = time.perf_counter()
+    for index in indexes:
+        lnk[index]
+    return time.perf_counter() - start
+
+
+def main(n):
+    """
+    Print the build time, bytes per value, scan time, iteration time and
+    lookup time of each list in LISTS holding n values.
+
+    @param int n: number of values in each list
+    @rtype: None
+    """
+    random.seed(0)
+    for name, cls in LISTS.items():
+        lnk, seconds, size = build(cls, n)
+        print("{:<20} build {:.3f}s {:6.1f} bytes/value  scan {:.4f}s  "
+              "iterate {:.4f}s  100 lookups {:.4f}s".format(
+                  name, seconds, size / n, time_scan(lnk),
+                  time_iteration(lnk), time_lookups(lnk, 100)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
@@ -1,3 +1,6 @@
+from itertools import islice
+
+
 class LinkedListNode:
     """
     Node to be used in linked list
@@ -6,6 +9,7 @@ class LinkedListNode:
     @param LinkedListNode next_: successor to this LinkedListNode
     @param object value: data this LinkedListNode represents
     """
+    __slots__ = ('value', 'next_')
     def __init__(self, value, next_=None):
         """
         Create LinkedListNode self with data value and successor next_.
@@ -163,6 +167,54 @@ class LinkedList:
         # remember to increase the size
         self.size += 1
 
+    def extend(self, values):
+        """
+        Insert each of values after self.back, in order, linking the new
+        nodes in one pass.
+
+        @param LinkedList self: this LinkedList
+        @param iterable values: values to add
+        @rtype: None
+
+        >>> lnk = LinkedList()
+        >>> lnk.append(0)
+        >>> lnk.extend(range(1, 3))
+        >>> print(lnk), lnk.back.value, lnk.size
+        0 -> 1 -> 2 ->|
+        (None, 2, 3)
+        """
+        if values is self:
+            # do not chase the nodes being added
+            values = list(values)
+        back, size = self.back, self.size
+        try:
+            for value in values:
+                new_node = LinkedListNode(value)
+                if back is None:
+                    self.front = new_node
+                else:
+                    back.next_ = new_node
+                back, size = new_node, size + 1
+        finally:
+            # keep the values added before values raised an error
+            self.back, self.size = back, size
+
+    @classmethod
+    def from_iterable(cls, values):
+        """
+        Return a new cls holding values, in order.
+
+        @param type cls: this class
+        @param iterable values: values to hold
+        @rtype: LinkedList
+
+        >>> print(LinkedList.from_iterable('abc'))
+        a -> b -> c ->|
+        """
+        lnk = cls()
+        lnk.extend(values)
+        return lnk
+
     def prepend(self, value):
         """
         Insert value before LinkedList self.front.
@@ -291,11 +343,12 @@ class LinkedList:
 
     def __getitem__(self, index):
         """
-        Return the value at LinkedList self's position index.
+        Return the value at LinkedList self's position index, or a new
+        LinkedList of the values in slice index, found in one pass.
 
         @param LinkedList self: this LinkedList
-        @param int index: position to retrieve value from
-        @rtype: object
+        @param int|slice index: position to retrieve value from
+        @rtype: object|LinkedList
 
         >>> lnk = LinkedList()
         >>> lnk.append(1)
@@ -304,21 +357,33 @@ class LinkedList:
         0
         >>> lnk[-1]
         0
+        >>> lnk = LinkedList.from_iterable(range(6))
+        >>> print(lnk[1:5:2])
+        1 -> 3 ->|
+        >>> print(lnk[::-2])
+        5 -> 3 -> 1 ->|
         """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            if step > 0:
+                return self.from_iterable(islice(self, start, stop, step))
+            # walk forwards once over the values the slice covers, then
+            # take them backwards
+            span = list(islice(self, stop + 1, start + 1))
+            return self.from_iterable(span[::step])
         # deal with a negative index by adding self.size
-        while index < 0:
+        if (-self.size > index
+                or index >= self.size):
+            raise IndexError("out of range!!!")
+        elif index < 0:
             index += self.size
-        if index >= self.size or self.size == 0:
-            raise IndexError("index too big!!!")
-        # an empty list, or an index that is too large is an error
-        else:
-            current_node = self.front
-            # walk index steps along from 0 to retrieve element
-            for step in range(index):
-                current_node = current_node.next_
-                assert current_node is not None, "unexpected None!!!!!"
-            # return the value at position index
-            return current_node.value
+        current_node = self.front
+        # walk index steps along from 0 to retrieve element
+        for _ in range(index):
+            assert current_node is not None, "unexpected None!!!!!"
+            current_node = current_node.next_
+        # return the value at position index
+        return current_node.value
 
     def __contains__(self, value):
         """
@@ -348,6 +413,37 @@ class LinkedList:
         # return False
         return False
 
+    def __iter__(self):
+        """
+        Yield the values of LinkedList self from front to back, walking
+        the list once.
+
+        @param LinkedList self: this LinkedList
+        @rtype: iterator
+
+        >>> lnk = LinkedList.from_iterable([1, 2, 3])
+        >>> list(lnk), sum(lnk)
+        ([1, 2, 3], 6)
+        """
+        current_node = self.front
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next_
+
+    def __reversed__(self):
+        """
+        Yield the values of LinkedList self from back to front.  The nodes
+        only point forwards, so the values are gathered in one pass
+        first.
+
+        @param LinkedList self: this LinkedList
+        @rtype: iterator
+
+        >>> list(reversed(LinkedList.from_iterable([1, 2, 3])))
+        [3, 2, 1]
+        """
+        yield from reversed(list(self))
+
 
 if __name__ == '__main__':
     import doctest
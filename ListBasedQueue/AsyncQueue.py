@@ -0,0 +1,189 @@
+""" FIFO queue that asyncio tasks can share
+"""
+
+
+import asyncio
+import time
+
+from BlockingQueue import QueueMetrics
+from Queue import Queue
+
+
+class AsyncQueue:
+    """
+    FIFO queue that the tasks of one event loop can put to and get from,
+    with the same behaviour as BlockingQueue: if it has a capacity, put
+    waits while it is full, and get waits while it is empty, without
+    blocking other tasks.
+
+    === Attributes ===
+    @param int|None capacity: most objects held at once, or None for no
+                              limit
+    @param QueueMetrics metrics: totals of the queue's use so far
+    @param Queue _items: objects queued
+    @param asyncio.Condition _not_empty: notified when objects are put
+    @param asyncio.Condition _not_full: notified when objects are got
+    """
+
+    def __init__(self, capacity=None):
+        """
+        Create an empty AsyncQueue self holding at most capacity objects,
+        or any number if capacity is None.
+
+        @param AsyncQueue self: this AsyncQueue
+        @param int|None capacity: most objects held at once
+        @rtype: None
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.metrics = QueueMetrics()
+        self._items = Queue()
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)
+        self._not_full = asyncio.Condition(lock)
+
+    def __len__(self):
+        """
+        Return the number of objects in AsyncQueue self.
+
+        @param AsyncQueue self: this AsyncQueue
+        @rtype: int
+
+        >>> len(AsyncQueue())
+        0
+        """
+        return len(self._items)
+
+    def is_empty(self):
+        """
+        Return whether AsyncQueue self holds no objects.
+
+        @param AsyncQueue self: this AsyncQueue
+        @rtype: bool
+
+        >>> AsyncQueue().is_empty()
+        True
+        """
+        return self._items.is_empty()
+
+    def _is_full(self):
+        """
+        Return whether AsyncQueue self holds capacity objects.
+
+        @param AsyncQueue self: this AsyncQueue
+        @rtype: bool
+        """
+        return self.capacity is not None and len(self._items) >= self.capacity
+
+    @staticmethod
+    async def _wait(condition, predicate, timeout, message):
+        """
+        Wait on condition, whose lock is held, until predicate() is true,
+        and return the seconds waited, or None if it was true to start
+        with.  Raise TimeoutError with message if it is still false after
+        timeout seconds, unless timeout is None.
+
+        @param asyncio.Condition condition: condition to wait on
+        @param ()->bool predicate: test to wait for
+        @param float|None timeout: most seconds to wait
+        @param str message: message for the TimeoutError
+        @rtype: float|None
+        """
+        if predicate():
+            return None
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(condition.wait_for(predicate), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(message) from None
+        return time.perf_counter() - start
+
+    async def put(self, o, timeout=None):
+        """
+        Add o at the back of AsyncQueue self, first waiting for room if
+        it is full.  Raise TimeoutError if there is still no room after
+        timeout seconds, unless timeout is None.
+
+        @param AsyncQueue self: this AsyncQueue
+        @param object o: object to add
+        @param float|None timeout: most seconds to wait
+        @rtype: None
+
+        >>> async def fill():
+        ...     q = AsyncQueue(1)
+        ...     await q.put('a')
+        ...     await q.put('b', timeout=0.01)
+        >>> asyncio.run(fill())
+        Traceback (most recent call last):
+        ...
+        TimeoutError: queue stayed full
+        """
+        async with self._not_full:
+            waited = await self._wait(self._not_full,
+                                      lambda: not self._is_full(), timeout,
+                                      "queue stayed full")
+            self._items.add(o)
+            self.metrics.record_put(len(self._items), waited)
+            self._not_empty.notify()
+
+    async def get(self, timeout=None):
+        """
+        Remove and return the front object of AsyncQueue self, first
+        waiting for one if it is empty.  Raise TimeoutError if it is still
+        empty after timeout seconds, unless timeout is None.
+
+        @param AsyncQueue self: this AsyncQueue
+        @param float|None timeout: most seconds to wait
+        @rtype: object
+
+        >>> async def produce_and_consume():
+        ...     q = AsyncQueue(2)
+        ...     consumer = asyncio.ensure_future(q.get())
+        ...     await q.put(3)
+        ...     return await consumer
+        >>> asyncio.run(produce_and_consume())
+        3
+        """
+        async with self._not_empty:
+            waited = await self._wait(self._not_empty,
+                                      lambda: not self._items.is_empty(),
+                                      timeout, "queue stayed empty")
+            o = self._items.remove()
+            self.metrics.record_gets(1, waited)
+            self._not_full.notify()
+            return o
+
+    async def get_many(self, n, timeout=None):
+        """
+        Remove and return a list of up to n objects from the front of
+        AsyncQueue self, first waiting for at least one if it is empty.
+        Raise TimeoutError if it is still empty after timeout seconds,
+        unless timeout is None.
+
+        @param AsyncQueue self: this AsyncQueue
+        @param int n: most objects to remove
+        @param float|None timeout: most seconds to wait
+        @rtype: list
+
+        >>> async def batches():
+        ...     q = AsyncQueue()
+        ...     for o in range(5):
+        ...         await q.put(o)
+        ...     return await q.get_many(3), await q.get_many(3)
+        >>> asyncio.run(batches())
+        ([0, 1, 2], [3, 4])
+        """
+        async with self._not_empty:
+            waited = await self._wait(self._not_empty,
+                                      lambda: not self._items.is_empty(),
+                                      timeout, "queue stayed empty")
+            objects = self._items.drain(n)
+            self.metrics.record_gets(len(objects), waited)
+            self._not_full.notify(len(objects))
+            return objects
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
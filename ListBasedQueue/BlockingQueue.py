@@ -0,0 +1,259 @@
+""" FIFO queue that producer and consumer threads can share
+"""
+
+
+import threading
+import time
+
+from Queue import Queue
+
+
+class QueueMetrics:
+    """
+    Running totals that show how saturated a shared queue is.
+
+    === Attributes ===
+    @param int puts: number of objects added
+    @param int gets: number of objects removed
+    @param int max_depth: most objects the queue has held at once
+    @param int put_waits: number of puts that found the queue full
+    @param float put_wait_time: seconds spent waiting for room
+    @param int get_waits: number of gets that found the queue empty
+    @param float get_wait_time: seconds spent waiting for objects
+    """
+
+    def __init__(self):
+        """
+        Create QueueMetrics self with every total at zero.
+
+        @param QueueMetrics self: this QueueMetrics
+        @rtype: None
+        """
+        self.puts, self.gets, self.max_depth = 0, 0, 0
+        self.put_waits, self.put_wait_time = 0, 0.0
+        self.get_waits, self.get_wait_time = 0, 0.0
+
+    def __repr__(self):
+        """
+        Represent QueueMetrics self as a string.
+
+        @param QueueMetrics self: this QueueMetrics
+        @rtype: str
+
+        >>> QueueMetrics()  # doctest: +NORMALIZE_WHITESPACE
+        QueueMetrics(puts=0, gets=0, max_depth=0, put_waits=0,
+                     put_wait_time=0.000000, get_waits=0,
+                     get_wait_time=0.000000)
+        """
+        return ("QueueMetrics(puts={}, gets={}, max_depth={}, put_waits={}, "
+                "put_wait_time={:.6f}, get_waits={}, get_wait_time={:.6f})"
+                .format(self.puts, self.gets, self.max_depth, self.put_waits,
+                        self.put_wait_time, self.get_waits,
+                        self.get_wait_time))
+
+    def record_put(self, depth, waited):
+        """
+        Count one put that left depth objects queued, after waiting
+        waited seconds (None if it did not wait).
+
+        @param QueueMetrics self: this QueueMetrics
+        @param int depth: number of objects queued after the put
+        @param float|None waited: seconds spent waiting for room
+        @rtype: None
+        """
+        self.puts += 1
+        self.max_depth = max(self.max_depth, depth)
+        if waited is not None:
+            self.put_waits += 1
+            self.put_wait_time += waited
+
+    def record_gets(self, count, waited):
+        """
+        Count count objects removed by one get, after waiting waited
+        seconds (None if it did not wait).
+
+        @param QueueMetrics self: this QueueMetrics
+        @param int count: number of objects removed
+        @param float|None waited: seconds spent waiting for objects
+        @rtype: None
+        """
+        self.gets += count
+        if waited is not None:
+            self.get_waits += 1
+            self.get_wait_time += waited
+
+
+class BlockingQueue:
+    """
+    FIFO queue that several threads can put to and get from at once.
+    If it has a capacity, put waits while it is full, so fast producers
+    are held back to the pace of the consumers.
+
+    === Attributes ===
+    @param int|None capacity: most objects held at once, or None for no
+                              limit
+    @param QueueMetrics metrics: totals of the queue's use so far
+    @param Queue _items: objects queued
+    @param threading.Condition _not_empty: notified when objects are put
+    @param threading.Condition _not_full: notified when objects are got
+    """
+
+    def __init__(self, capacity=None):
+        """
+        Create an empty BlockingQueue self holding at most capacity
+        objects, or any number if capacity is None.
+
+        @param BlockingQueue self: this BlockingQueue
+        @param int|None capacity: most objects held at once
+        @rtype: None
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.metrics = QueueMetrics()
+        self._items = Queue()
+        lock = threading.Lock()
+        self._not_empty = threading.Condition(lock)
+        self._not_full = threading.Condition(lock)
+
+    def __len__(self):
+        """
+        Return the number of objects in BlockingQueue self.  Other threads
+        may change it straight away.
+
+        @param BlockingQueue self: this BlockingQueue
+        @rtype: int
+
+        >>> len(BlockingQueue())
+        0
+        """
+        return len(self._items)
+
+    def is_empty(self):
+        """
+        Return whether BlockingQueue self holds no objects.  Other threads
+        may change that straight away.
+
+        @param BlockingQueue self: this BlockingQueue
+        @rtype: bool
+
+        >>> BlockingQueue().is_empty()
+        True
+        """
+        return self._items.is_empty()
+
+    def _is_full(self):
+        """
+        Return whether BlockingQueue self holds capacity objects.
+
+        @param BlockingQueue self: this BlockingQueue
+        @rtype: bool
+        """
+        return self.capacity is not None and len(self._items) >= self.capacity
+
+    def put(self, o, timeout=None):
+        """
+        Add o at the back of BlockingQueue self, first waiting for room
+        if it is full.  Raise TimeoutError if there is still no room after
+        timeout seconds, unless timeout is None.
+
+        @param BlockingQueue self: this BlockingQueue
+        @param object o: object to add
+        @param float|None timeout: most seconds to wait
+        @rtype: None
+
+        >>> q = BlockingQueue(1)
+        >>> q.put('a')
+        >>> q.put('b', timeout=0.01)
+        Traceback (most recent call last):
+        ...
+        TimeoutError: queue stayed full
+        """
+        with self._not_full:
+            waited = None
+            if self._is_full():
+                start = time.perf_counter()
+                if not self._not_full.wait_for(lambda: not self._is_full(),
+                                               timeout):
+                    raise TimeoutError("queue stayed full")
+                waited = time.perf_counter() - start
+            self._items.add(o)
+            self.metrics.record_put(len(self._items), waited)
+            self._not_empty.notify()
+
+    def _wait_for_items(self, timeout):
+        """
+        Wait, holding the lock, until BlockingQueue self is not empty,
+        and return the seconds waited, or None if it was not empty to
+        start with.  Raise TimeoutError if it is still empty after
+        timeout seconds, unless timeout is None.
+
+        @param BlockingQueue self: this BlockingQueue
+        @param float|None timeout: most seconds to wait
+        @rtype: float|None
+        """
+        if not self._items.is_empty():
+            return None
+        start = time.perf_counter()
+        if not self._not_empty.wait_for(
+                lambda: not self._items.is_empty(), timeout):
+            raise TimeoutError("queue stayed empty")
+        return time.perf_counter() - start
+
+    def get(self, timeout=None):
+        """
+        Remove and return the front object of BlockingQueue self, first
+        waiting for one if it is empty.  Raise TimeoutError if it is still
+        empty after timeout seconds, unless timeout is None.
+
+        @param BlockingQueue self: this BlockingQueue
+        @param float|None timeout: most seconds to wait
+        @rtype: object
+
+        >>> q = BlockingQueue()
+        >>> q.put(3)
+        >>> q.get()
+        3
+        >>> q.get(timeout=0.01)
+        Traceback (most recent call last):
+        ...
+        TimeoutError: queue stayed empty
+        """
+        with self._not_empty:
+            waited = self._wait_for_items(timeout)
+            o = self._items.remove()
+            self.metrics.record_gets(1, waited)
+            self._not_full.notify()
+            return o
+
+    def get_many(self, n, timeout=None):
+        """
+        Remove and return a list of up to n objects from the front of
+        BlockingQueue self, first waiting for at least one if it is
+        empty.  Raise TimeoutError if it is still empty after timeout
+        seconds, unless timeout is None.
+
+        @param BlockingQueue self: this BlockingQueue
+        @param int n: most objects to remove
+        @param float|None timeout: most seconds to wait
+        @rtype: list
+
+        >>> q = BlockingQueue()
+        >>> for o in range(5):
+        ...     q.put(o)
+        >>> q.get_many(3), q.get_many(3)
+        ([0, 1, 2], [3, 4])
+        >>> q.metrics.puts, q.metrics.gets, q.metrics.max_depth
+        (5, 5, 5)
+        """
+        with self._not_empty:
+            waited = self._wait_for_items(timeout)
+            objects = self._items.drain(n)
+            self.metrics.record_gets(len(objects), waited)
+            self._not_full.notify(len(objects))
+            return objects
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
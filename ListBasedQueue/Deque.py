@@ -0,0 +1,265 @@
+""" double-ended queue stored in fixed-size blocks
+"""
+
+
+class Deque:
+    """
+    Double-ended queue: objects can be added and removed at both ends in
+    O(1) amortized time, and looked up by index in O(1) time.  Objects
+    are stored in blocks of _BLOCK slots, reached through a map of
+    blocks, so no object is ever moved once stored.  Position p of the
+    map's slots holds the object at index p - _start.  Blocks are made as
+    they are needed, and freed once emptied.
+
+    === Attributes ===
+    @param list[list|None] _blocks: map of blocks, None where not in use
+    @param int _start: position in the map of the front object
+    @param int _size: number of objects
+    """
+    # number of slots in each block
+    _BLOCK = 64
+
+    def __init__(self, objects=()):
+        """
+        Create Deque self holding objects, front to back.
+
+        @param Deque self: this Deque
+        @param iterable objects: objects to start with
+        @rtype: None
+
+        >>> list(Deque('abc'))
+        ['a', 'b', 'c']
+        """
+        self._blocks, self._start, self._size = [], 0, 0
+        for o in objects:
+            self.append(o)
+
+    def __len__(self):
+        """
+        Return the number of objects in Deque self.
+
+        @param Deque self: this Deque
+        @rtype: int
+
+        >>> len(Deque([1, 2]))
+        2
+        """
+        return self._size
+
+    def is_empty(self):
+        """
+        Return whether Deque self holds no objects.
+
+        @param Deque self: this Deque
+        @rtype: bool
+
+        >>> Deque().is_empty()
+        True
+        """
+        return self._size == 0
+
+    def __iter__(self):
+        """
+        Yield the objects in Deque self from front to back.
+
+        @param Deque self: this Deque
+        @rtype: iterator
+
+        >>> d = Deque(range(3))
+        >>> d.appendleft(-1)
+        >>> list(d)
+        [-1, 0, 1, 2]
+        """
+        for i in range(self._size):
+            position = self._start + i
+            yield self._blocks[position // self._BLOCK][position % self._BLOCK]
+
+    def _position(self, index):
+        """
+        Return the position in the map of the object at index, which may
+        be negative to count from the back.  Raise IndexError if there is
+        no such object.
+
+        @param Deque self: this Deque
+        @param int index: index of the object
+        @rtype: int
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("deque index out of range")
+        return self._start + index
+
+    def __getitem__(self, index):
+        """
+        Return the object at index in Deque self.
+
+        @param Deque self: this Deque
+        @param int index: index of the object, negative from the back
+        @rtype: object
+
+        >>> d = Deque(range(200))
+        >>> d[150], d[-1]
+        (150, 199)
+        """
+        position = self._position(index)
+        return self._blocks[position // self._BLOCK][position % self._BLOCK]
+
+    def __setitem__(self, index, o):
+        """
+        Replace the object at index in Deque self with o.
+
+        @param Deque self: this Deque
+        @param int index: index of the object, negative from the back
+        @param object o: new object
+        @rtype: None
+
+        >>> d = Deque([1, 2])
+        >>> d[-1] = 5
+        >>> list(d)
+        [1, 5]
+        """
+        position = self._position(index)
+        self._blocks[position // self._BLOCK][position % self._BLOCK] = o
+
+    def _store(self, position, o):
+        """
+        Store o at position in the map, making its block if need be.
+
+        @param Deque self: this Deque
+        @param int position: position in the map
+        @param object o: object to store
+        @rtype: None
+        """
+        block = self._blocks[position // self._BLOCK]
+        if block is None:
+            block = self._blocks[position // self._BLOCK] = [None] * self._BLOCK
+        block[position % self._BLOCK] = o
+
+    def append(self, o):
+        """
+        Add o at the back of Deque self.
+
+        @param Deque self: this Deque
+        @param object o: object to add
+        @rtype: None
+
+        >>> d = Deque()
+        >>> d.append(1)
+        >>> d.append(2)
+        >>> list(d)
+        [1, 2]
+        """
+        position = self._start + self._size
+        if position // self._BLOCK == len(self._blocks):
+            self._blocks.append(None)
+        self._store(position, o)
+        self._size += 1
+
+    def appendleft(self, o):
+        """
+        Add o at the front of Deque self.
+
+        @param Deque self: this Deque
+        @param object o: object to add
+        @rtype: None
+
+        >>> d = Deque()
+        >>> for o in range(100):
+        ...     d.appendleft(o)
+        >>> d[0], d[-1]
+        (99, 0)
+        """
+        if self._start == 0:
+            # make as much room in front as the map already has, so the
+            # map is copied only O(log n) times
+            extra = max(1, len(self._blocks))
+            self._blocks[:0] = [None] * extra
+            self._start += extra * self._BLOCK
+        self._start -= 1
+        self._store(self._start, o)
+        self._size += 1
+
+    def pop(self):
+        """
+        Remove and return the object at the back of Deque self.  Raise
+        IndexError if self is empty.
+
+        @param Deque self: this Deque
+        @rtype: object
+
+        >>> d = Deque([1, 2])
+        >>> d.pop(), len(d)
+        (2, 1)
+        """
+        if self._size == 0:
+            raise IndexError("pop from empty deque")
+        position = self._start + self._size - 1
+        block = self._blocks[position // self._BLOCK]
+        o, block[position % self._BLOCK] = block[position % self._BLOCK], None
+        self._size -= 1
+        if position % self._BLOCK == 0:
+            # the block is empty: drop it and any unused blocks after it
+            del self._blocks[position // self._BLOCK:]
+        return o
+
+    def popleft(self):
+        """
+        Remove and return the object at the front of Deque self.  Raise
+        IndexError if self is empty.
+
+        @param Deque self: this Deque
+        @rtype: object
+
+        >>> d = Deque([1, 2])
+        >>> d.popleft(), len(d)
+        (1, 1)
+        """
+        if self._size == 0:
+            raise IndexError("pop from empty deque")
+        index, offset = divmod(self._start, self._BLOCK)
+        block = self._blocks[index]
+        o, block[offset] = block[offset], None
+        self._start += 1
+        self._size -= 1
+        if offset == self._BLOCK - 1 or self._size == 0:
+            # the block is empty: free it
+            self._blocks[index] = None
+            unused = self._start // self._BLOCK
+            if 2 * unused > len(self._blocks):
+                # drop the unused front of the map, at most once for
+                # every block's worth of objects removed
+                del self._blocks[:unused]
+                self._start -= unused * self._BLOCK
+        return o
+
+    def add(self, o):
+        """
+        Add o at the back of Deque self, as Queue does.
+
+        @param Deque self: this Deque
+        @param object o: object to add
+        @rtype: None
+        """
+        self.append(o)
+
+    def remove(self):
+        """
+        Remove and return the object at the front of Deque self, as Queue
+        does.  Raise IndexError if self is empty.
+
+        @param Deque self: this Deque
+        @rtype: object
+
+        >>> d = Deque()
+        >>> d.add(3)
+        >>> d.add(5)
+        >>> d.remove()
+        3
+        """
+        return self.popleft()
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,232 @@
+""" queue that removes objects in order of priority
+"""
+
+
+# default for remove, meaning the object with the smallest priority
+_FRONT = object()
+
+
+class PriorityQueue:
+    """
+    Queue of hashable objects, each with a priority, where remove returns
+    the object with the smallest priority, and of those the one added
+    first.  Objects are kept in a binary min-heap of [priority, number,
+    object] entries, numbered in the order they were added, with a dict
+    from each object to its entry's index in the heap, so any object can
+    be found, moved or removed in O(log n) time.
+
+    === Attributes ===
+    @param list[list] _heap: [priority, number, object] entries in heap
+                             order
+    @param dict[object, int] _index: index in _heap of each object's entry
+    @param int _added: number of objects added so far
+    """
+
+    def __init__(self):
+        """
+        Create an empty PriorityQueue self.
+
+        @param PriorityQueue self: this PriorityQueue
+        @rtype: None
+        """
+        self._heap, self._index, self._added = [], {}, 0
+
+    def __len__(self):
+        """
+        Return the number of objects in PriorityQueue self.
+
+        @param PriorityQueue self: this PriorityQueue
+        @rtype: int
+
+        >>> len(PriorityQueue())
+        0
+        """
+        return len(self._heap)
+
+    def __contains__(self, o):
+        """
+        Return whether o is in PriorityQueue self.
+
+        @param PriorityQueue self: this PriorityQueue
+        @param object o: object to look for
+        @rtype: bool
+
+        >>> pq = PriorityQueue()
+        >>> pq.add('a', 1)
+        >>> 'a' in pq, 'b' in pq
+        (True, False)
+        """
+        return o in self._index
+
+    def is_empty(self):
+        """
+        Return whether PriorityQueue self holds no objects.
+
+        @param PriorityQueue self: this PriorityQueue
+        @rtype: bool
+
+        >>> PriorityQueue().is_empty()
+        True
+        """
+        return not self._heap
+
+    def _place(self, i, entry):
+        """
+        Put entry at index i of the heap, and record where it is.
+
+        @param PriorityQueue self: this PriorityQueue
+        @param int i: index in the heap
+        @param list entry: [priority, number, object]
+        @rtype: None
+        """
+        self._heap[i] = entry
+        self._index[entry[2]] = i
+
+    def _sift_up(self, i):
+        """
+        Move the entry at index i up until its parent is no larger.
+
+        @param PriorityQueue self: this PriorityQueue
+        @param int i: index of the entry to move
+        @rtype: None
+        """
+        heap, index = self._heap, self._index
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            above = heap[parent]
+            if not entry < above:
+                break
+            heap[i] = above
+            index[above[2]] = i
+            i = parent
+        self._place(i, entry)
+
+    def _sift_down(self, i):
+        """
+        Move the entry at index i down until neither child is smaller.
+
+        @param PriorityQueue self: this PriorityQueue
+        @param int i: index of the entry to move
+        @rtype: None
+        """
+        heap, index = self._heap, self._index
+        n = len(heap)
+        entry = heap[i]
+        child = 2 * i + 1
+        while child < n:
+            # pick the smaller child
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            below = heap[child]
+            if not below < entry:
+                break
+            heap[i] = below
+            index[below[2]] = i
+            i = child
+            child = 2 * i + 1
+        self._place(i, entry)
+
+    def add(self, o, priority):
+        """
+        Add o to PriorityQueue self with priority.  Raise ValueError if o
+        is already in self.
+
+        @param PriorityQueue self: this PriorityQueue
+        @param object o: hashable object to add
+        @param object priority: priority of o; smaller comes out first
+        @rtype: None
+
+        >>> pq = PriorityQueue()
+        >>> pq.add('write', 2)
+        >>> pq.add('write', 1)
+        Traceback (most recent call last):
+        ...
+        ValueError: object already in queue
+        """
+        if o in self._index:
+            raise ValueError("object already in queue")
+        self._heap.append([priority, self._added, o])
+        self._added += 1
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self):
+        """
+        Return the object that remove would return from PriorityQueue
+        self, without removing it.  Raise IndexError if self is empty.
+
+        @param PriorityQueue self: this PriorityQueue
+        @rtype: object
+
+        >>> pq = PriorityQueue()
+        >>> pq.add('b', 2)
+        >>> pq.add('a', 1)
+        >>> pq.peek()
+        'a'
+        """
+        if not self._heap:
+            raise IndexError("peek at empty queue")
+        return self._heap[0][2]
+
+    def remove(self, o=_FRONT):
+        """
+        Remove and return the object with the smallest priority in
+        PriorityQueue self, the earliest added of those with equal
+        priority, or remove o if it is given.  Raise IndexError if self
+        is empty, or KeyError if o is not in self.
+
+        @param PriorityQueue self: this PriorityQueue
+        @param object o: object to remove, if not the front one
+        @rtype: object
+
+        >>> pq = PriorityQueue()
+        >>> for o, priority in [('c', 2), ('a', 1), ('d', 2), ('b', 1)]:
+        ...     pq.add(o, priority)
+        >>> pq.remove('a')
+        'a'
+        >>> [pq.remove() for _ in range(len(pq))]
+        ['b', 'c', 'd']
+        """
+        if o is _FRONT:
+            if not self._heap:
+                raise IndexError("remove from empty queue")
+            i = 0
+        else:
+            i = self._index[o]
+        entry = self._heap[i]
+        del self._index[entry[2]]
+        last = self._heap.pop()
+        if i < len(self._heap):
+            # fill the gap with the last entry, and move it into place
+            self._place(i, last)
+            self._sift_down(i)
+            self._sift_up(self._index[last[2]])
+        return entry[2]
+
+    def update_priority(self, o, priority):
+        """
+        Change the priority of o in PriorityQueue self to priority.
+        Among objects of equal priority, o keeps its place by when it
+        was added.  Raise KeyError if o is not in self.
+
+        @param PriorityQueue self: this PriorityQueue
+        @param object o: object to change the priority of
+        @param object priority: new priority of o
+        @rtype: None
+
+        >>> pq = PriorityQueue()
+        >>> pq.add('a', 1)
+        >>> pq.add('b', 2)
+        >>> pq.update_priority('b', 0)
+        >>> pq.remove()
+        'b'
+        """
+        i = self._index[o]
+        self._heap[i][0] = priority
+        self._sift_up(i)
+        self._sift_down(self._index[o])
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
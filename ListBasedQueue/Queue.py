@@ -1,25 +1,76 @@
 class Queue:
-    ''' Represent a FIFO queue.
+    ''' Represent a FIFO queue, stored in a circular buffer of slots.
+
+    The front item is in slot _head, and the rest follow it, wrapping
+    around to slot 0, so add and remove take O(1) time.  With no
+    capacity, the buffer doubles whenever it fills up; with a capacity,
+    a full queue either drops its front item to make room (overwrite) or
+    raises OverflowError.
     '''
+    # number of slots a growable queue starts with
+    _INITIAL_SLOTS = 8
 
-    def __init__(self):
-        ''' (Queue) -> NoneType
+    def __init__(self, capacity=None, overwrite=False):
+        ''' (Queue, int|None, bool) -> NoneType
+
+        Create and initialize new queue self, holding at most capacity
+        items if capacity is given.  If overwrite, adding to a full queue
+        drops its front item; otherwise it raises OverflowError.
 
-        Create and initialize new queue self.
+        >>> Queue(0)
+        Traceback (most recent call last):
+        ...
+        ValueError: capacity must be positive
         '''
-        self._data = []
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._capacity, self._overwrite = capacity, overwrite
+        self._data = [None] * (capacity or self._INITIAL_SLOTS)
+        self._head, self._size = 0, 0
 
     def add(self, o):
         ''' (Queue, object) -> NoneType
 
         Add o at the back of this queue.
+
+        >>> q = Queue(2, overwrite=True)
+        >>> q.extend([1, 2, 3])
+        >>> list(q)
+        [2, 3]
+        >>> q = Queue(1)
+        >>> q.add(1)
+        >>> q.add(2)
+        Traceback (most recent call last):
+        ...
+        OverflowError: queue is full
+        '''
+        slots = len(self._data)
+        if self._size == slots:
+            if self._capacity is None:
+                self._grow()
+                slots = len(self._data)
+            elif self._overwrite:
+                self.remove()
+            else:
+                raise OverflowError("queue is full")
+        self._data[(self._head + self._size) % slots] = o
+        self._size += 1
+
+    def _grow(self):
+        ''' (Queue) -> NoneType
+
+        Double the number of slots in full queue self, moving its items
+        to the front of the new buffer.
         '''
-        self._data.append(o)
+        data, head = self._data, self._head
+        self._data = data[head:] + data[:head] + [None] * len(data)
+        self._head = 0
 
     def remove(self):
         ''' (Queue) -> object
 
-        Remove and return front object from self.
+        Remove and return front object from self.  Raise IndexError if
+        self is empty.
 
         >>> q = Queue()
         >>> q.add(3)
@@ -27,7 +78,31 @@ class Queue:
         >>> q.remove()
         3
         '''
-        return self._data.pop(0)
+        if self._size == 0:
+            raise IndexError("remove from empty queue")
+        o = self._data[self._head]
+        # let go of the item, so the queue does not keep it alive
+        self._data[self._head] = None
+        self._head = (self._head + 1) % len(self._data)
+        self._size -= 1
+        return o
+
+    def peek(self):
+        ''' (Queue) -> object
+
+        Return front object from self without removing it.  Raise
+        IndexError if self is empty.
+
+        >>> q = Queue()
+        >>> q.add(3)
+        >>> q.peek()
+        3
+        >>> len(q)
+        1
+        '''
+        if self._size == 0:
+            raise IndexError("peek at empty queue")
+        return self._data[self._head]
 
     def is_empty(self):
         ''' (Queue) -> bool
@@ -43,7 +118,66 @@ class Queue:
         >>> q.is_empty()
         True
         '''
-        return self._data == []
+        return self._size == 0
+
+    def __len__(self):
+        ''' (Queue) -> int
+
+        Return the number of objects in self.
+
+        >>> q = Queue()
+        >>> q.extend('abc')
+        >>> len(q)
+        3
+        '''
+        return self._size
+
+    def __iter__(self):
+        ''' (Queue) -> iterator
+
+        Yield the objects in self from front to back, without removing
+        them.
+
+        >>> q = Queue(3)
+        >>> q.extend([1, 2, 3])
+        >>> q.remove()
+        1
+        >>> q.add(4)
+        >>> list(q)
+        [2, 3, 4]
+        '''
+        data, head = self._data, self._head
+        for i in range(self._size):
+            yield data[(head + i) % len(data)]
+
+    def extend(self, objects):
+        ''' (Queue, iterable) -> NoneType
+
+        Add each of objects at the back of self, in order.
+
+        >>> q = Queue()
+        >>> q.extend(range(20))
+        >>> q.remove(), len(q)
+        (0, 19)
+        '''
+        for o in objects:
+            self.add(o)
+
+    def drain(self, n=None):
+        ''' (Queue, int|None) -> list
+
+        Remove and return a list of the front n objects of self, or all
+        of them if n is None or self has fewer.
+
+        >>> q = Queue()
+        >>> q.extend([1, 2, 3])
+        >>> q.drain(2)
+        [1, 2]
+        >>> q.drain()
+        [3]
+        '''
+        count = self._size if n is None else min(n, self._size)
+        return [self.remove() for _ in range(count)]
 
 
 if __name__ == '__main__':
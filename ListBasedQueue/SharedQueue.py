@@ -0,0 +1,289 @@
+""" FIFO queue of byte frames shared by two processes
+"""
+
+
+from multiprocessing import shared_memory
+import struct
+
+
+# Bytes before the first slot.  The consumer's count of removed frames
+# and the producer's count of added frames sit on separate cache lines,
+# followed by the number of slots and their size.
+_HEADER = 192
+_HEAD, _TAIL, _SLOTS, _SLOT_SIZE = 0, 8, 16, 17
+# Each frame is stored as its length, then its bytes.
+_LENGTH = struct.Struct('<I')
+
+
+class SharedQueue:
+    """
+    FIFO queue of byte frames in a block of shared memory, for exactly
+    one producer process calling add and one consumer process calling
+    remove.  Frames go in a ring of fixed-size slots.  Each side only
+    ever writes its own counter in the block, publishing it after the
+    slot it covers, so neither side needs a lock and nothing is pickled.
+    This relies on aligned 8-byte stores being atomic and seen in order,
+    as they are on x86-64.
+
+    === Attributes ===
+    @param str name: name of the shared memory block, for attach
+    @param int slots: number of frames the queue can hold
+    @param int slot_size: bytes in each slot, including a 4-byte length
+    @param shared_memory.SharedMemory _block: shared memory block
+    @param memoryview _buf: bytes of the block
+    @param memoryview _counters: the block's header as 8-byte counters
+    """
+
+    def __init__(self, slots=1024, slot_size=256, name=None, _block=None):
+        """
+        Create an empty SharedQueue self of slots slots, each holding a
+        frame of up to slot_size - 4 bytes, in a new shared memory block
+        called name, or a generated name if name is None.
+
+        @param SharedQueue self: this SharedQueue
+        @param int slots: number of frames the queue can hold
+        @param int slot_size: bytes in each slot, including the length
+        @param str|None name: name for the shared memory block
+        @param shared_memory.SharedMemory|None _block: existing block to
+                                                       use, for attach
+        @rtype: None
+        """
+        if _block is None:
+            if slots < 1 or slot_size <= _LENGTH.size:
+                raise ValueError("need at least one slot of over {} bytes"
+                                 .format(_LENGTH.size))
+            _block = shared_memory.SharedMemory(
+                name, create=True, size=_HEADER + slots * slot_size)
+        self._block, self._buf = _block, _block.buf
+        self.name = _block.name
+        self._counters = self._buf[:_HEADER].cast('Q')
+        if slots is not None:
+            self._counters[_HEAD] = self._counters[_TAIL] = 0
+            self._counters[_SLOTS], self._counters[_SLOT_SIZE] = (slots,
+                                                                  slot_size)
+        self.slots = self._counters[_SLOTS]
+        self.slot_size = self._counters[_SLOT_SIZE]
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Return a SharedQueue for the existing shared memory block called
+        name, made by another SharedQueue, perhaps in another process.
+
+        @param type cls: SharedQueue
+        @param str name: name of the shared memory block
+        @rtype: SharedQueue
+
+        >>> q = SharedQueue(4, 16)
+        >>> q.add(b'hi')
+        >>> other = SharedQueue.attach(q.name)
+        >>> other.remove(), other.slots
+        (b'hi', 4)
+        >>> other.close()
+        >>> q.close()
+        >>> q.unlink()
+        """
+        return cls(None, None, _block=shared_memory.SharedMemory(name))
+
+    def __reduce__(self):
+        """
+        Return how to pickle SharedQueue self: by the name of its block,
+        so a process it is sent to attaches to the same queue.
+
+        @param SharedQueue self: this SharedQueue
+        @rtype: tuple
+        """
+        return SharedQueue.attach, (self.name,)
+
+    def __len__(self):
+        """
+        Return the number of frames in SharedQueue self.  The other
+        process may change it straight away.
+
+        @param SharedQueue self: this SharedQueue
+        @rtype: int
+
+        >>> q = SharedQueue(4, 16)
+        >>> q.add(b'a')
+        >>> len(q)
+        1
+        >>> q.close()
+        >>> q.unlink()
+        """
+        return self._counters[_TAIL] - self._counters[_HEAD]
+
+    def is_empty(self):
+        """
+        Return whether SharedQueue self holds no frames.  The producer
+        may add one straight away.
+
+        @param SharedQueue self: this SharedQueue
+        @rtype: bool
+
+        >>> q = SharedQueue(4, 16)
+        >>> q.is_empty()
+        True
+        >>> q.close()
+        >>> q.unlink()
+        """
+        return self._counters[_TAIL] == self._counters[_HEAD]
+
+    def _write(self, index, frame):
+        """
+        Write frame into the slot for the frame numbered index.
+
+        @param SharedQueue self: this SharedQueue
+        @param bytes frame: frame to write
+        @param int index: number of the frame
+        @rtype: None
+        """
+        length = len(frame)
+        if length > self.slot_size - _LENGTH.size:
+            raise ValueError("frame longer than {} bytes".format(
+                self.slot_size - _LENGTH.size))
+        offset = _HEADER + index % self.slots * self.slot_size
+        _LENGTH.pack_into(self._buf, offset, length)
+        offset += _LENGTH.size
+        self._buf[offset:offset + length] = frame
+
+    def _read(self, index):
+        """
+        Return the frame in the slot for the frame numbered index.
+
+        @param SharedQueue self: this SharedQueue
+        @param int index: number of the frame
+        @rtype: bytes
+        """
+        offset = _HEADER + index % self.slots * self.slot_size
+        length = _LENGTH.unpack_from(self._buf, offset)[0]
+        offset += _LENGTH.size
+        return self._buf[offset:offset + length].tobytes()
+
+    def add(self, frame):
+        """
+        Add bytes frame at the back of SharedQueue self.  Raise
+        OverflowError if self is full, and ValueError if frame does not
+        fit in a slot.  Only the producer may call this.
+
+        @param SharedQueue self: this SharedQueue
+        @param bytes frame: frame to add
+        @rtype: None
+
+        >>> q = SharedQueue(1, 16)
+        >>> q.add(b'a')
+        >>> q.add(b'b')
+        Traceback (most recent call last):
+        ...
+        OverflowError: queue is full
+        >>> q.close()
+        >>> q.unlink()
+        """
+        tail = self._counters[_TAIL]
+        if tail - self._counters[_HEAD] == self.slots:
+            raise OverflowError("queue is full")
+        self._write(tail, frame)
+        # publish the frame only once it is written
+        self._counters[_TAIL] = tail + 1
+
+    def add_many(self, frames):
+        """
+        Add as many frames from the front of list frames as there is room
+        for at the back of SharedQueue self, and return how many.  Only
+        the producer may call this.
+
+        @param SharedQueue self: this SharedQueue
+        @param list[bytes] frames: frames to add
+        @rtype: int
+
+        >>> q = SharedQueue(2, 16)
+        >>> q.add_many([b'a', b'b', b'c'])
+        2
+        >>> q.close()
+        >>> q.unlink()
+        """
+        tail = self._counters[_TAIL]
+        count = min(len(frames), self.slots - (tail - self._counters[_HEAD]))
+        for i in range(count):
+            self._write(tail + i, frames[i])
+        self._counters[_TAIL] = tail + count
+        return count
+
+    def remove(self):
+        """
+        Remove and return the front frame of SharedQueue self.  Raise
+        IndexError if self is empty.  Only the consumer may call this.
+
+        @param SharedQueue self: this SharedQueue
+        @rtype: bytes
+
+        >>> q = SharedQueue(4, 16)
+        >>> q.add(b'3')
+        >>> q.add(b'5')
+        >>> q.remove()
+        b'3'
+        >>> q.close()
+        >>> q.unlink()
+        """
+        head = self._counters[_HEAD]
+        if head == self._counters[_TAIL]:
+            raise IndexError("remove from empty queue")
+        frame = self._read(head)
+        # free the slot only once it is read
+        self._counters[_HEAD] = head + 1
+        return frame
+
+    def remove_many(self, n):
+        """
+        Remove and return a list of up to n frames from the front of
+        SharedQueue self; fewer if it holds fewer, and none if n is
+        negative.  Only the consumer may call this.
+
+        @param SharedQueue self: this SharedQueue
+        @param int n: most frames to remove
+        @rtype: list[bytes]
+
+        >>> q = SharedQueue(4, 16)
+        >>> q.add_many([b'a', b'b', b'c'])
+        3
+        >>> q.remove_many(2), q.remove_many(2), q.remove_many(2)
+        ([b'a', b'b'], [b'c'], [])
+        >>> q.add(b'd')
+        >>> q.remove_many(-1), len(q)
+        ([], 1)
+        >>> q.close()
+        >>> q.unlink()
+        """
+        head = self._counters[_HEAD]
+        # never move head backwards, over frames already removed
+        count = max(0, min(n, self._counters[_TAIL] - head))
+        frames = [self._read(head + i) for i in range(count)]
+        self._counters[_HEAD] = head + count
+        return frames
+
+    def close(self):
+        """
+        Stop using the shared memory block of SharedQueue self in this
+        process.
+
+        @param SharedQueue self: this SharedQueue
+        @rtype: None
+        """
+        self._counters.release()
+        self._buf = None
+        self._block.close()
+
+    def unlink(self):
+        """
+        Free the shared memory block of SharedQueue self, once every
+        process has closed it.  Only the process that made it should call
+        this.
+
+        @param SharedQueue self: this SharedQueue
+        @rtype: None
+        """
+        self._block.unlink()
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
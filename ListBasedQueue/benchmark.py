@@ -0,0 +1,291 @@
+""" benchmark the queues in this directory
+
+Run python benchmark.py --help for the options.  For example,
+
+    python benchmark.py --producers 4 --consumers 4 --capacity 100
+
+first times adding --items objects to each single-threaded queue and
+removing them again, then moves --items objects through a BlockingQueue
+shared by producer and
+consumer threads, and through an AsyncQueue shared by producer and
+consumer tasks, and prints the throughput and saturation of each.  It
+then moves --items byte frames to a consumer process through a
+SharedQueue, and through a multiprocessing.Queue for comparison.
+"""
+
+
+import argparse
+import asyncio
+import multiprocessing
+import threading
+import time
+
+from AsyncQueue import AsyncQueue
+from BlockingQueue import BlockingQueue
+from Deque import Deque
+from PriorityQueue import PriorityQueue
+from Queue import Queue
+from SharedQueue import SharedQueue
+
+
+def _split(items, parts):
+    """
+    Return the sizes of parts nearly equal shares of items objects.
+
+    @param int items: number of objects to share out
+    @param int parts: number of shares
+    @rtype: list[int]
+
+    >>> _split(10, 3)
+    [4, 3, 3]
+    """
+    return [items // parts + (i < items % parts) for i in range(parts)]
+
+
+def run_fifo(items):
+    """
+    Return a list of (name, seconds) pairs: the time each single-threaded
+    queue takes to add items objects and then remove them all, and the
+    time Deque takes to look up every index once.
+
+    @param int items: number of objects to add and remove
+    @rtype: list[(str, float)]
+
+    >>> [name for name, seconds in run_fifo(10)]  # doctest: +ELLIPSIS
+    ['Queue', 'Deque', 'PriorityQueue', ..., 'Deque[i]', 'list[i]']
+    """
+    results = []
+    for name, q in [('Queue', Queue()), ('Deque', Deque())]:
+        start = time.perf_counter()
+        for o in range(items):
+            q.add(o)
+        while not q.is_empty():
+            q.remove()
+        results.append((name, time.perf_counter() - start))
+    q = PriorityQueue()
+    start = time.perf_counter()
+    for o in range(items):
+        # a few priorities, so that ties are broken by order of adding
+        q.add(o, o % 8)
+    while not q.is_empty():
+        q.remove()
+    results.append(('PriorityQueue', time.perf_counter() - start))
+    list_ = []
+    start = time.perf_counter()
+    for o in range(items):
+        list_.append(o)
+    while list_:
+        list_.pop(0)
+    results.append(('list.pop(0)', time.perf_counter() - start))
+    for name, sequence in [('Deque[i]', Deque(range(items))),
+                           ('list[i]', list(range(items)))]:
+        start = time.perf_counter()
+        for i in range(items):
+            sequence[i]
+        results.append((name, time.perf_counter() - start))
+    return results
+
+
+def run_threads(items, producers, consumers, capacity, batch):
+    """
+    Move items objects through a BlockingQueue of capacity from producers
+    threads to consumers threads, each getting up to batch objects at a
+    time, and return the seconds taken and the queue.
+
+    @param int items: number of objects to move
+    @param int producers: number of producer threads
+    @param int consumers: number of consumer threads
+    @param int|None capacity: capacity of the queue
+    @param int batch: most objects a consumer gets at once
+    @rtype: (float, BlockingQueue)
+
+    >>> seconds, q = run_threads(100, 2, 2, 10, 4)
+    >>> q.metrics.gets, q.is_empty()
+    (100, True)
+    """
+    q = BlockingQueue(capacity)
+
+    def produce(count):
+        for o in range(count):
+            q.put(o)
+
+    def consume(count):
+        while count > 0:
+            count -= len(q.get_many(min(batch, count)))
+
+    threads = ([threading.Thread(target=produce, args=(count,))
+                for count in _split(items, producers)] +
+               [threading.Thread(target=consume, args=(count,))
+                for count in _split(items, consumers)])
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, q
+
+
+def run_tasks(items, producers, consumers, capacity, batch):
+    """
+    Move items objects through an AsyncQueue of capacity from producers
+    tasks to consumers tasks, each getting up to batch objects at a
+    time, and return the seconds taken and the queue.
+
+    @param int items: number of objects to move
+    @param int producers: number of producer tasks
+    @param int consumers: number of consumer tasks
+    @param int|None capacity: capacity of the queue
+    @param int batch: most objects a consumer gets at once
+    @rtype: (float, AsyncQueue)
+
+    >>> seconds, q = run_tasks(100, 2, 2, 10, 4)
+    >>> q.metrics.gets, q.is_empty()
+    (100, True)
+    """
+    async def main():
+        q = AsyncQueue(capacity)
+
+        async def produce(count):
+            for o in range(count):
+                await q.put(o)
+
+        async def consume(count):
+            while count > 0:
+                count -= len(await q.get_many(min(batch, count)))
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *[produce(count) for count in _split(items, producers)],
+            *[consume(count) for count in _split(items, consumers)])
+        return time.perf_counter() - start, q
+
+    return asyncio.run(main())
+
+
+def _consume_shared(q, items, batch):
+    """
+    Remove items frames from SharedQueue q, up to batch at a time,
+    spinning while it is empty.  Runs in the consumer process.
+
+    @param SharedQueue q: queue to remove from
+    @param int items: number of frames to remove
+    @param int batch: most frames to remove at once
+    @rtype: None
+    """
+    while items > 0:
+        got = len(q.remove_many(min(batch, items)))
+        if not got:
+            # let the producer run if it shares this CPU
+            time.sleep(0)
+        items -= got
+    q.close()
+
+
+def run_shared(items, frame_size, batch):
+    """
+    Move items frames of frame_size bytes through a SharedQueue to a
+    consumer process, up to batch at a time, and return the seconds
+    taken.  Each side spins while it has nothing to do.
+
+    @param int items: number of frames to move
+    @param int frame_size: bytes in each frame
+    @param int batch: most frames to add or remove at once
+    @rtype: float
+
+    >>> run_shared(1000, 8, 16) > 0
+    True
+    """
+    q = SharedQueue(slot_size=frame_size + 4)
+    try:
+        consumer = multiprocessing.Process(target=_consume_shared,
+                                           args=(q, items, batch))
+        consumer.start()
+        frames = [bytes(frame_size)] * batch
+        start = time.perf_counter()
+        sent = 0
+        while sent < items:
+            added = q.add_many(frames[:items - sent])
+            if not added:
+                # let the consumer run if it shares this CPU
+                time.sleep(0)
+            sent += added
+        consumer.join()
+        return time.perf_counter() - start
+    finally:
+        q.close()
+        q.unlink()
+
+
+def _consume_pipe(q, items):
+    """
+    Get items objects from multiprocessing.Queue q.  Runs in the
+    consumer process.
+
+    @param multiprocessing.Queue q: queue to get from
+    @param int items: number of objects to get
+    @rtype: None
+    """
+    for _ in range(items):
+        q.get()
+
+
+def run_pipe(items, frame_size):
+    """
+    Move items frames of frame_size bytes through a multiprocessing.Queue
+    to a consumer process, and return the seconds taken.
+
+    @param int items: number of frames to move
+    @param int frame_size: bytes in each frame
+    @rtype: float
+    """
+    q = multiprocessing.Queue(1024)
+    consumer = multiprocessing.Process(target=_consume_pipe, args=(q, items))
+    consumer.start()
+    frame = bytes(frame_size)
+    start = time.perf_counter()
+    for _ in range(items):
+        q.put(frame)
+    consumer.join()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    """
+    Run the benchmarks as the command line arguments argv ask, and print
+    the results.
+
+    @param list[str]|None argv: arguments, by default sys.argv[1:]
+    @rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--producers', type=int, default=4)
+    parser.add_argument('--consumers', type=int, default=4)
+    parser.add_argument('--capacity', type=int, default=1000,
+                        help="queue capacity; 0 for no limit")
+    parser.add_argument('--batch', type=int, default=1,
+                        help="most objects a consumer gets at once")
+    parser.add_argument('--frame-size', type=int, default=64,
+                        help="bytes in each frame sent between processes")
+    args = parser.parse_args(argv)
+    for name, seconds in run_fifo(args.items):
+        print("{:<14} {} items in {:.3f}s: {:,.0f} items/s".format(
+            name, args.items, seconds, args.items / seconds))
+    for name, runner in [('BlockingQueue', run_threads),
+                         ('AsyncQueue', run_tasks)]:
+        seconds, q = runner(args.items, args.producers, args.consumers,
+                            args.capacity or None, args.batch)
+        print("{:<14} {} items in {:.3f}s: {:,.0f} items/s".format(
+            name, args.items, seconds, args.items / seconds))
+        print("{:<14} {}".format('', q.metrics))
+    for name, seconds in [
+            ('SharedQueue', run_shared(args.items, args.frame_size,
+                                       max(args.batch, 64))),
+            ('multiprocessing.Queue', run_pipe(args.items,
+                                               args.frame_size))]:
+        print("{:<14} {} frames in {:.3f}s: {:,.0f} frames/s".format(
+            name, args.items, seconds, args.items / seconds))
+
+
+if __name__ == '__main__':
+    main()
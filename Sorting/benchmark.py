@@ -0,0 +1,344 @@
+""" benchmark the sorts in sort.py
+
+Run python benchmark.py --help for the options.  For example,
+
+    python benchmark.py --sizes 1000 100000 --output base.json
+    python benchmark.py --sizes 1000 100000 --baseline base.json
+
+times every sort on every distribution, then later fails (exit status 1)
+if any median time has grown by more than the tolerance since base.json.
+"""
+
+
+import argparse
+import csv
+import json
+import math
+import random
+import statistics
+import sys
+import time
+
+from instrument import instrument
+import sort
+from test_sort import generate_data, is_sorted
+
+
+# Sorts that take quadratic time, skipped above --quadratic-limit items.
+# The first two quicksorts do on sorted or duplicated data, recursing
+# O(n) deep, past Python's recursion limit.
+QUADRATIC = ['selection_sort', 'insertion_sort_1', 'insertion_sort_2',
+             'bubblesort_1', 'bubblesort_2', 'quicksort_1', 'quicksort_2']
+# Sorts that compare items; the rest get no comparison count.
+COMPARISON = QUADRATIC + ['mergesort_1', 'mergesort_2', 'mergesort_3',
+                          'quicksort_3', 'introsort', 'hybrid_sort',
+                          'in_place_mergesort', 'heapsort']
+# The built-in sort, timed as a baseline for the others.
+BUILT_IN = 'list.sort'
+SORTS = COMPARISON + ['radix_sort', 'parallel_sort', 'vectorized_sort',
+                      BUILT_IN]
+
+
+def organ_pipe(n):
+    """
+    Return a list of n ints that rises, then falls.
+
+    @param int n: number of ints in the list to be returned
+    @rtype: list[int]
+
+    >>> organ_pipe(7)
+    [0, 2, 4, 6, 4, 2, 0]
+    """
+    return [2 * min(j, n - 1 - j) for j in range(n)]
+
+
+def sawtooth(n, teeth=16):
+    """
+    Return a list of n ints made of teeth sorted runs of about the same
+    length, one after the other.
+
+    @param int n: number of ints in the list to be returned
+    @param int teeth: number of sorted runs
+    @rtype: list[int]
+
+    >>> sawtooth(7, 2)
+    [0, 2, 4, 6, 0, 2, 4]
+    """
+    width = max(1, -(-n // teeth))
+    return [2 * (j % width) for j in range(n)]
+
+
+def random_runs(n, run=32):
+    """
+    Return a list of n ints made of sorted runs of run ints each, with
+    the runs in random order.
+
+    @param int n: number of ints in the list to be returned
+    @param int run: number of ints in each sorted run
+    @rtype: list[int]
+
+    >>> sorted(random_runs(10, 4)) == list(range(0, 20, 2))
+    True
+    """
+    runs = [list(range(2 * j, 2 * min(j + run, n), 2))
+            for j in range(0, n, run)]
+    random.shuffle(runs)
+    return [v for r in runs for v in r]
+
+
+DISTRIBUTIONS = {
+    'random': generate_data,
+    'nearly_sorted': lambda n: generate_data(n, sorted_=True),
+    'nearly_reversed': lambda n: generate_data(n, sorted_=True,
+                                               reversed_=True),
+    'few_unique': lambda n: generate_data(n, distinct=10),
+    'organ_pipe': organ_pipe,
+    'sawtooth': sawtooth,
+    'random_runs': random_runs,
+}
+
+
+def get_sorter(name):
+    """
+    Return the sort called name: one in sort.py, or BUILT_IN.
+
+    @param str name: name of the sort
+    @rtype: (list)->None
+
+    >>> get_sorter('list.sort')([2, 1]) is None
+    True
+    """
+    return list.sort if name == BUILT_IN else getattr(sort, name)
+
+
+def count_operations(name, data):
+    """
+    Return the SortStats of the sort called name sorting a copy of data,
+    or None for sorts that hand the work to other processes or NumPy.
+    The comparison count is None for sorts that do not compare items, and
+    the move count is None for the built-in sort, which moves items in C.
+
+    @param str name: name of the sort
+    @param list data: items to sort
+    @rtype: SortStats|None
+
+    >>> stats = count_operations('insertion_sort_1', [1, 2, 3])
+    >>> stats.comparisons, stats.moves
+    (2, 2)
+    """
+    if name in ('parallel_sort', 'vectorized_sort'):
+        return None
+    stats = instrument(get_sorter(name), data[:],
+                       compare=name in COMPARISON or name == BUILT_IN)
+    if name == BUILT_IN:
+        stats.moves = None
+    return stats
+
+
+def percentile(times, p):
+    """
+    Return the p-th percentile of times by the nearest-rank method.
+
+    @param list[float] times: measurements
+    @param float p: percentile, between 0 and 100
+    @rtype: float
+
+    >>> percentile([5.0, 1.0, 3.0, 2.0, 4.0], 95)
+    5.0
+    >>> percentile([5.0, 1.0, 3.0, 2.0, 4.0], 50)
+    3.0
+    """
+    ordered = sorted(times)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def time_sort(sorter, data, warmup, repeat):
+    """
+    Return the seconds sorter takes to sort each of repeat fresh copies
+    of data, after warmup untimed runs.  Copying is not timed.  Raise
+    AssertionError if sorter gets the order wrong.
+
+    @param (list)->None sorter: sort to time
+    @param list data: items to sort
+    @param int warmup: number of untimed runs
+    @param int repeat: number of timed runs
+    @rtype: list[float]
+    """
+    times = []
+    for run in range(warmup + repeat):
+        list_ = data[:]
+        start = time.perf_counter()
+        sorter(list_)
+        elapsed = time.perf_counter() - start
+        if run == 0:
+            assert is_sorted(list_), sorter.__name__ + " did not sort"
+        if run >= warmup:
+            times.append(elapsed)
+    return times
+
+
+def run(sorts, distributions, sizes, warmup=1, repeat=5, count=True,
+        quadratic_limit=5000, seed=0):
+    """
+    Time each sort in sorts on data of each size from each of the
+    distributions, and return a list of result rows.
+
+    @param list[str] sorts: names of sorts in sort.py, or BUILT_IN
+    @param list[str] distributions: names of keys of DISTRIBUTIONS
+    @param list[int] sizes: numbers of items to sort
+    @param int warmup: number of untimed runs before timing
+    @param int repeat: number of timed runs
+    @param bool count: whether to count the work each sort does
+    @param int quadratic_limit: largest size for QUADRATIC sorts
+    @param int seed: seed for the random data
+    @rtype: list[dict]
+
+    >>> rows = run(['mergesort_3'], ['random'], [10], 0, 1)
+    >>> rows[0]['sort'], rows[0]['size'], rows[0]['comparisons'] > 0
+    ('mergesort_3', 10, True)
+    >>> size = 10000
+    >>> size > sys.getrecursionlimit()
+    True
+    >>> rows = run(SORTS, sorted(DISTRIBUTIONS), [size], 0, 1, False)
+    >>> len(rows) == (len(SORTS) - len(QUADRATIC)) * len(DISTRIBUTIONS)
+    True
+    """
+    rows = []
+    for distribution in distributions:
+        for size in sizes:
+            random.seed(seed)
+            data = DISTRIBUTIONS[distribution](size)
+            for name in sorts:
+                if name in QUADRATIC and size > quadratic_limit:
+                    continue
+                times = time_sort(get_sorter(name), data, warmup, repeat)
+                stats = count_operations(name, data) if count else None
+                rows.append({'sort': name, 'distribution': distribution,
+                             'size': size, 'repeat': repeat,
+                             'median': statistics.median(times),
+                             'p95': percentile(times, 95),
+                             'min': min(times),
+                             'comparisons': stats and stats.comparisons,
+                             'moves': stats and stats.moves,
+                             'allocated': stats and stats.allocated,
+                             'max_depth': stats and stats.max_depth})
+    return rows
+
+
+def compare(rows, baseline, tolerance):
+    """
+    Return a list of messages, one for each row in rows whose median time
+    is more than tolerance (a fraction) slower than the row for the same
+    sort, distribution and size in baseline.
+
+    @param list[dict] rows: new results
+    @param list[dict] baseline: earlier results
+    @param float tolerance: allowed slowdown, e.g. 0.1 for 10%
+    @rtype: list[str]
+
+    >>> old = [{'sort': 's', 'distribution': 'd', 'size': 1, 'median': 1.0}]
+    >>> new = [{'sort': 's', 'distribution': 'd', 'size': 1, 'median': 1.5}]
+    >>> compare(new, old, 0.1)
+    ['s d 1: median 1.500000s vs 1.000000s in baseline (+50%)']
+    >>> compare(new, old, 0.6)
+    []
+    """
+    before = {(row['sort'], row['distribution'], row['size']): row['median']
+              for row in baseline}
+    regressions = []
+    for row in rows:
+        old = before.get((row['sort'], row['distribution'], row['size']))
+        if old and row['median'] > old * (1 + tolerance):
+            regressions.append(
+                "{} {} {}: median {:.6f}s vs {:.6f}s in baseline "
+                "(+{:.0%})".format(row['sort'], row['distribution'],
+                                   row['size'], row['median'], old,
+                                   row['median'] / old - 1))
+    return regressions
+
+
+def write(rows, format_, file):
+    """
+    Write rows to file as JSON, CSV or a plain text table.
+
+    @param list[dict] rows: results to write
+    @param str format_: 'json', 'csv' or 'table'
+    @param file file: text file to write to
+    @rtype: None
+    """
+    if format_ == 'json':
+        json.dump(rows, file, indent=1)
+        file.write('\n')
+    elif format_ == 'csv':
+        writer = csv.DictWriter(file, ['sort', 'distribution', 'size',
+                                       'repeat', 'median', 'p95', 'min',
+                                       'comparisons', 'moves', 'allocated',
+                                       'max_depth'])
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        for row in rows:
+            file.write("{sort:<18} {distribution:<16} {size:>9} "
+                       "median {median:.6f}s p95 {p95:.6f}s "
+                       "comparisons {comparisons} moves {moves} "
+                       "allocated {allocated} max_depth {max_depth}\n"
+                       .format(**row))
+
+
+def main(argv=None):
+    """
+    Run the benchmarks as the command line arguments argv ask, and
+    return the exit status: 1 if there are regressions from the
+    baseline, otherwise 0.
+
+    @param list[str]|None argv: arguments, by default sys.argv[1:]
+    @rtype: int
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sorts', nargs='+', choices=SORTS, default=SORTS)
+    parser.add_argument('--distributions', nargs='+',
+                        choices=sorted(DISTRIBUTIONS),
+                        default=sorted(DISTRIBUTIONS))
+    parser.add_argument('--sizes', nargs='+', type=int,
+                        default=[1000, 10000])
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--no-count', dest='count', action='store_false',
+                        help="skip counting comparisons, moves, allocations "
+                             "and call depth")
+    parser.add_argument('--quadratic-limit', type=int, default=5000,
+                        help="largest size to run quadratic sorts on")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--format', choices=['table', 'json', 'csv'],
+                        default=None,
+                        help="output format; json if --output ends in "
+                             ".json, csv if it ends in .csv")
+    parser.add_argument('--output', help="file to write results to")
+    parser.add_argument('--baseline',
+                        help="JSON results to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help="allowed slowdown from the baseline")
+    args = parser.parse_args(argv)
+    format_ = args.format
+    if format_ is None:
+        format_ = next((f for f in ('json', 'csv')
+                        if args.output and args.output.endswith('.' + f)),
+                       'table')
+    rows = run(args.sorts, args.distributions, args.sizes, args.warmup,
+               args.repeat, args.count, args.quadratic_limit, args.seed)
+    if args.output:
+        with open(args.output, 'w', newline='') as file:
+            write(rows, format_, file)
+    else:
+        write(rows, format_, sys.stdout)
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(rows, json.load(file), args.tolerance)
+        for message in regressions:
+            print("REGRESSION " + message, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
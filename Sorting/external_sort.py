@@ -0,0 +1,260 @@
+""" sorting data that does not fit in memory
+"""
+
+
+from itertools import chain, islice
+import heapq
+import pickle
+import sys
+import tempfile
+
+from sort import mergesort_3
+
+
+# Default number of bytes of items to sort in memory at once.
+DEFAULT_MEMORY = 64 * 1024 * 1024
+# Default number of runs to merge at once.
+DEFAULT_FAN_IN = 64
+# Number of items read or written at a time.
+_BLOCK = 1024
+
+
+def read_records(file, record_size):
+    """
+    Yield the records of size record_size bytes in binary file file.
+
+    @param file file: binary file to read from
+    @param int record_size: number of bytes in each record
+    @rtype: generator[bytes]
+
+    >>> import io
+    >>> list(read_records(io.BytesIO(b'abcdef'), 2))
+    [b'ab', b'cd', b'ef']
+    """
+    while True:
+        block = file.read(record_size * _BLOCK)
+        if not block:
+            return
+        if len(block) % record_size != 0:
+            raise ValueError("file does not hold whole records")
+        for i in range(0, len(block), record_size):
+            yield block[i:i + record_size]
+
+
+def _chunks(iterable, memory, record_size):
+    """
+    Yield lists of consecutive items from iterable, each taking up about
+    memory bytes.
+
+    @param iterable iterable: items to split into chunks
+    @param int memory: number of bytes for each chunk
+    @param int|None record_size: number of bytes per item, if fixed
+    @rtype: generator[list]
+
+    >>> list(_chunks(b'abcde', 2, 1))
+    [[97, 98], [99, 100], [101]]
+    """
+    iterator = iter(iterable)
+    if record_size is not None:
+        size = max(1, memory // record_size)
+        chunk = list(islice(iterator, size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(iterator, size))
+        return
+    chunk, used = [], 0
+    for item in iterator:
+        chunk.append(item)
+        # count the item and its slot in the list
+        used += sys.getsizeof(item) + 8
+        if used >= memory:
+            yield chunk
+            chunk, used = [], 0
+    if chunk:
+        yield chunk
+
+
+def _sort_chunk(chunk, key, reverse):
+    """
+    Sort list chunk in non-decreasing order of key(item), or of the items
+    themselves if key is None, or in non-increasing order if reverse.
+    Equal items keep their order.
+
+    @param list chunk: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @rtype: None
+
+    >>> chunk = ['ccc', 'a', 'bb', 'd']
+    >>> _sort_chunk(chunk, len, False)
+    >>> chunk
+    ['a', 'd', 'bb', 'ccc']
+    """
+    mergesort_3(chunk, key=key, reverse=reverse)
+
+
+def _write_run(items, record_size, tmp_dir):
+    """
+    Write items to a new temporary file and return it, rewound.  Records
+    of a fixed size are written back to back; other items are pickled in
+    blocks.  The file is deleted when it is closed.
+
+    @param iterable items: items to write
+    @param int|None record_size: number of bytes per item, if fixed
+    @param str|None tmp_dir: directory to create the file in
+    @rtype: file
+    """
+    run = tempfile.TemporaryFile(dir=tmp_dir)
+    try:
+        iterator = iter(items)
+        block = list(islice(iterator, _BLOCK))
+        while block:
+            if record_size is not None:
+                run.write(b''.join(block))
+            else:
+                pickle.dump(block, run, pickle.HIGHEST_PROTOCOL)
+            block = list(islice(iterator, _BLOCK))
+        run.seek(0)
+    except BaseException:
+        run.close()
+        raise
+    return run
+
+
+def _read_run(run, record_size):
+    """
+    Yield the items written to file run by _write_run.
+
+    @param file run: file to read from
+    @param int|None record_size: number of bytes per item, if fixed
+    @rtype: generator
+    """
+    if record_size is not None:
+        yield from read_records(run, record_size)
+        return
+    while True:
+        try:
+            block = pickle.load(run)
+        except EOFError:
+            return
+        yield from block
+
+
+def _merge_runs(runs, record_size, key, reverse):
+    """
+    Yield the items of the sorted run files in runs, merged in
+    non-decreasing order of key, or non-increasing order if reverse.
+    Equal items come from earlier runs first.
+
+    @param list[file] runs: sorted run files to merge
+    @param int|None record_size: number of bytes per item, if fixed
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether the runs are in non-increasing order
+    @rtype: generator
+    """
+    return heapq.merge(*[_read_run(run, record_size) for run in runs],
+                       key=key, reverse=reverse)
+
+
+def external_sort(iterable, memory=DEFAULT_MEMORY, record_size=None,
+                  fan_in=DEFAULT_FAN_IN, key=None, reverse=False,
+                  tmp_dir=None):
+    """
+    Yield the items of iterable in non-decreasing order of key(item), or
+    of the items themselves if key is None, or in non-increasing order if
+    reverse, holding about memory bytes of items at a time.  Equal items
+    keep their order.
+
+    Sorted chunks of iterable are spilled to temporary run files.  If
+    there are more than fan_in runs, groups of fan_in runs are merged
+    into longer runs, in as many passes as it takes, so that no more
+    than fan_in files are ever open for merging.  If fan_in is None, all
+    runs are merged in a single pass.
+
+    If record_size is given, every item must be a bytes object of that
+    size, and runs are stored as raw records; otherwise items are
+    pickled.
+
+    @param iterable iterable: items to sort
+    @param int memory: number of bytes of items to sort in memory at once
+    @param int|None record_size: number of bytes per item, if fixed
+    @param int|None fan_in: largest number of runs to merge at once
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @param str|None tmp_dir: directory for run files
+    @rtype: generator
+
+    >>> list(external_sort([3, 1, 2]))
+    [1, 2, 3]
+    >>> items = range(20, 0, -1)
+    >>> list(external_sort(items, memory=100, fan_in=2)) == sorted(items)
+    True
+    >>> list(external_sort([b'cc', b'aa', b'bb'], memory=2, record_size=2))
+    [b'aa', b'bb', b'cc']
+    """
+    if fan_in is not None and fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    chunks = _chunks(iterable, memory, record_size)
+    first = next(chunks, [])
+    second = next(chunks, None)
+    if second is None:
+        # everything fits in memory
+        _sort_chunk(first, key, reverse)
+        yield from first
+        return
+    files = []
+    try:
+        runs = []
+        for chunk in chain([first, second], chunks):
+            _sort_chunk(chunk, key, reverse)
+            runs.append(_write_run(chunk, record_size, tmp_dir))
+            files.append(runs[-1])
+            # let go of the items before reading the next chunk
+            chunk.clear()
+        while fan_in is not None and len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                merged.append(_write_run(
+                    _merge_runs(group, record_size, key, reverse),
+                    record_size, tmp_dir))
+                files.append(merged[-1])
+                for run in group:
+                    run.close()
+            runs = merged
+        yield from _merge_runs(runs, record_size, key, reverse)
+    finally:
+        for run in files:
+            run.close()
+
+
+def sort_file(source, target, record_size, memory=DEFAULT_MEMORY,
+              fan_in=DEFAULT_FAN_IN, key=None, reverse=False, tmp_dir=None):
+    """
+    Write the records of size record_size bytes in the file at path
+    source to the file at path target, in non-decreasing order of key,
+    or in non-increasing order if reverse.
+
+    @param str source: path of the file to sort
+    @param str target: path of the file to write
+    @param int record_size: number of bytes in each record
+    @param int memory: number of bytes of records to sort in memory at once
+    @param int|None fan_in: largest number of runs to merge at once
+    @param (bytes)->object|None key: function computing each record's key
+    @param bool reverse: whether to sort in non-increasing order
+    @param str|None tmp_dir: directory for run files
+    @rtype: None
+    """
+    with open(source, 'rb') as in_file, open(target, 'wb') as out_file:
+        records = external_sort(read_records(in_file, record_size), memory,
+                                record_size, fan_in, key, reverse,
+                                tmp_dir)
+        block = list(islice(records, _BLOCK))
+        while block:
+            out_file.write(b''.join(block))
+            block = list(islice(records, _BLOCK))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
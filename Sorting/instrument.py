@@ -0,0 +1,292 @@
+""" counting what the sorts in sort.py do
+
+Nothing here touches sort.py itself: a sort is instrumented by handing it
+items (or keys) that count their comparisons and a list that counts its
+writes, so sorts called the usual way run at full speed.
+"""
+
+
+import sys
+import tracemalloc
+
+import sort
+
+
+class SortStats:
+    """
+    Counts of the work done by one call to a sort.
+
+    === Attributes ===
+    @param int|None comparisons: number of item (or key) comparisons,
+                                 or None if they were not counted
+    @param int moves: number of items written into the list being sorted,
+                      or shifted inside it by inserting or deleting
+    @param int allocated: most bytes allocated at once during the call
+    @param int max_depth: deepest nesting of calls to functions in sort.py
+    """
+
+    def __init__(self, comparisons=None, moves=0, allocated=0, max_depth=0):
+        """
+        Create SortStats self with the given counts.
+
+        @param SortStats self: this SortStats
+        @param int|None comparisons: number of comparisons
+        @param int moves: number of item moves
+        @param int allocated: most bytes allocated at once
+        @param int max_depth: deepest nesting of calls
+        @rtype: None
+        """
+        self.comparisons, self.moves = comparisons, moves
+        self.allocated, self.max_depth = allocated, max_depth
+
+    def __repr__(self):
+        """
+        Represent SortStats self as a string that can be evaluated to
+        produce an equivalent SortStats.
+
+        @param SortStats self: this SortStats
+        @rtype: str
+
+        >>> SortStats(3, 2, 0, 1)
+        SortStats(3, 2, 0, 1)
+        """
+        return "SortStats({}, {}, {}, {})".format(
+            self.comparisons, self.moves, self.allocated, self.max_depth)
+
+    def __eq__(self, other):
+        """
+        Return whether SortStats self has the same counts as other.
+
+        @param SortStats self: this SortStats
+        @param SortStats|object other: object to compare to self
+        @rtype: bool
+
+        >>> SortStats(3, 2) == SortStats(3, 2, 0, 0)
+        True
+        """
+        return type(self) == type(other) and vars(self) == vars(other)
+
+
+class _Counted:
+    """
+    Item that counts how many times it is compared for order.
+
+    === Attributes ===
+    @param object value: item being counted
+    @param list[int] counter: one-item list holding the shared count
+    """
+    __slots__ = ('value', 'counter')
+
+    def __init__(self, value, counter):
+        """
+        Create _Counted self wrapping value, counting in counter.
+
+        @param _Counted self: this _Counted
+        @param object value: item to wrap
+        @param list[int] counter: one-item list holding the shared count
+        @rtype: None
+        """
+        self.value, self.counter = value, counter
+
+    def __eq__(self, other):
+        """
+        Return whether self and other wrap equal items.  Not counted: the
+        sorts only test equality when comparing (key, index) pairs, right
+        before the counted comparison of the keys.
+
+        @param _Counted self: this _Counted
+        @param _Counted other: _Counted to compare to
+        @rtype: bool
+        """
+        return self.value == other.value
+
+    def __lt__(self, other):
+        """
+        Return whether self wraps a smaller item than other.
+
+        @param _Counted self: this _Counted
+        @param _Counted other: _Counted to compare to
+        @rtype: bool
+        """
+        self.counter[0] += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        """
+        Return whether self wraps an item no larger than other's.
+
+        @param _Counted self: this _Counted
+        @param _Counted other: _Counted to compare to
+        @rtype: bool
+        """
+        self.counter[0] += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        """
+        Return whether self wraps a larger item than other.
+
+        @param _Counted self: this _Counted
+        @param _Counted other: _Counted to compare to
+        @rtype: bool
+        """
+        self.counter[0] += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        """
+        Return whether self wraps an item no smaller than other's.
+
+        @param _Counted self: this _Counted
+        @param _Counted other: _Counted to compare to
+        @rtype: bool
+        """
+        self.counter[0] += 1
+        return self.value >= other.value
+
+
+class _MoveCountingList(list):
+    """
+    List that counts how many items are written into it or shifted
+    inside it.
+
+    === Attributes ===
+    @param int moves: number of items moved so far
+    """
+
+    def __init__(self, items=()):
+        """
+        Create _MoveCountingList self holding items.
+
+        @param _MoveCountingList self: this _MoveCountingList
+        @param iterable items: items to hold
+        @rtype: None
+        """
+        list.__init__(self, items)
+        self.moves = 0
+
+    def __setitem__(self, index, value):
+        """
+        Set self[index] to value, counting each item written.
+
+        @param _MoveCountingList self: this _MoveCountingList
+        @param int|slice index: position(s) to write
+        @param object value: item, or items for a slice
+        @rtype: None
+        """
+        if isinstance(index, slice):
+            value = list(value)
+            self.moves += len(value)
+        else:
+            self.moves += 1
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index):
+        """
+        Delete self[index], counting every item moved to close the gap.
+
+        @param _MoveCountingList self: this _MoveCountingList
+        @param int|slice index: position(s) to delete
+        @rtype: None
+        """
+        if isinstance(index, slice):
+            stop = index.indices(len(self))[1]
+        else:
+            stop = index % len(self) + 1
+        self.moves += len(self) - stop
+        list.__delitem__(self, index)
+
+    def insert(self, index, value):
+        """
+        Insert value before index, counting it and every item it moves.
+
+        @param _MoveCountingList self: this _MoveCountingList
+        @param int index: position to insert at
+        @param object value: item to insert
+        @rtype: None
+        """
+        self.moves += len(self) - min(max(index, 0), len(self)) + 1
+        list.insert(self, index, value)
+
+
+def _depth_tracker(depth):
+    """
+    Return a profiling function for sys.setprofile that keeps depth, a
+    two-item list, holding the current and the deepest nesting of calls
+    to named functions in sort.py.
+
+    @param list[int] depth: [current depth, deepest depth]
+    @rtype: function
+    """
+    filename = sort.__file__
+
+    def track(frame, event, arg):
+        code = frame.f_code
+        # comprehensions and lambdas are not part of the algorithm
+        if code.co_filename == filename and code.co_name[0] != '<':
+            if event == 'call':
+                depth[0] += 1
+                depth[1] = max(depth)
+            elif event == 'return':
+                depth[0] -= 1
+    return track
+
+
+def instrument(sorter, list_, compare=True, **kwargs):
+    """
+    Sort list_ with sorter(list_, **kwargs), and return the SortStats of
+    the work it did.  If compare, wrap each item (or each key, if a key
+    is given in kwargs) so that its comparisons are counted; pass False
+    for sorts that need plain ints, strs or bytes.
+
+    The sort runs much slower than usual while it is counted, so time it
+    separately.  Sorts that hand the work to other processes or to NumPy
+    are not counted there.
+
+    @param (list)->None sorter: sort to run
+    @param list list_: list to sort
+    @param bool compare: whether to count comparisons
+    @rtype: SortStats
+
+    >>> list_ = [3, 1, 2]
+    >>> stats = instrument(sort.insertion_sort_1, list_)
+    >>> list_, stats.comparisons, stats.moves, stats.max_depth
+    ([1, 2, 3], 3, 4, 2)
+    >>> instrument(sort.mergesort_3, ['b', 'aa'], key=len).comparisons
+    1
+    """
+    counter = [0]
+    key = kwargs.get('key')
+    if not compare:
+        items = _MoveCountingList(list_)
+    elif key is not None:
+        kwargs['key'] = lambda v: _Counted(key(v), counter)
+        items = _MoveCountingList(list_)
+    else:
+        items = _MoveCountingList([_Counted(v, counter) for v in list_])
+    depth = [0, 0]
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    old_profile = sys.getprofile()
+    sys.setprofile(_depth_tracker(depth))
+    try:
+        sorter(items, **kwargs)
+    finally:
+        sys.setprofile(old_profile)
+        peak = tracemalloc.get_traced_memory()[1]
+        if not tracing:
+            tracemalloc.stop()
+    if compare and key is None:
+        list_[:] = [c.value for c in items]
+    else:
+        list_[:] = items
+    return SortStats(counter[0] if compare else None, items.moves,
+                     max(0, peak - start), depth[1])
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -1,3 +1,144 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, repeat
+from multiprocessing import shared_memory
+import heapq
+import math
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# === Sort keys === #
+class _Reversed:
+    """
+    Sort key that orders like key, but backwards.
+
+    === Attributes ===
+    @param object key: key to order backwards
+    """
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        """
+        Create _Reversed self to order like key, but backwards.
+
+        @param _Reversed self: this _Reversed
+        @param object key: key to order backwards
+        @rtype: None
+        """
+        self.key = key
+
+    def __eq__(self, other):
+        """
+        Return whether _Reversed self and other have equal keys.
+
+        @param _Reversed self: this _Reversed
+        @param _Reversed other: _Reversed to compare to
+        @rtype: bool
+        """
+        return self.key == other.key
+
+    def __lt__(self, other):
+        """
+        Return whether _Reversed self sorts before other.
+
+        @param _Reversed self: this _Reversed
+        @param _Reversed other: _Reversed to compare to
+        @rtype: bool
+
+        >>> _Reversed(2) < _Reversed(1)
+        True
+        """
+        return other.key < self.key
+
+    def __le__(self, other):
+        """
+        Return whether _Reversed self sorts before or equal to other.
+
+        @param _Reversed self: this _Reversed
+        @param _Reversed other: _Reversed to compare to
+        @rtype: bool
+        """
+        return other.key <= self.key
+
+    def __gt__(self, other):
+        """
+        Return whether _Reversed self sorts after other.
+
+        @param _Reversed self: this _Reversed
+        @param _Reversed other: _Reversed to compare to
+        @rtype: bool
+        """
+        return other.key > self.key
+
+    def __ge__(self, other):
+        """
+        Return whether _Reversed self sorts after or equal to other.
+
+        @param _Reversed self: this _Reversed
+        @param _Reversed other: _Reversed to compare to
+        @rtype: bool
+        """
+        return other.key >= self.key
+
+
+def _sort_decorated(sorter, list_, key, reverse):
+    """
+    Sort list_ with sorter by key(item), or by the items themselves if
+    key is None, in non-increasing order if reverse.
+
+    Each key is computed once and paired with its item's index, so sorter
+    only ever compares keys, and items with equal keys keep their order
+    whether sorter is stable or not.  The items are then rearranged to
+    match the sorted pairs.
+
+    @param (list)->None sorter: sort to use on the (key, index) pairs
+    @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @rtype: None
+
+    >>> list_ = ['bb', 'a', 'ccc', 'd']
+    >>> _sort_decorated(selection_sort, list_, len, True)
+    >>> list_
+    ['ccc', 'bb', 'a', 'd']
+    """
+    _sort_by_keys(sorter, list_,
+                  list_ if key is None else [key(v) for v in list_], reverse)
+
+
+def _sort_by_keys(sorter, list_, keys, reverse):
+    """
+    Sort list_ with sorter so that it is in non-decreasing order of the
+    matching items of keys, or in non-increasing order if reverse, as
+    _sort_decorated does once it has computed the keys.
+
+    @param (list)->None sorter: sort to use on the (key, index) pairs
+    @param list list_: list to sort
+    @param list keys: key of each item of list_
+    @param bool reverse: whether to sort in non-increasing order
+    @rtype: None
+
+    >>> list_ = ['a', 'b', 'c']
+    >>> _sort_by_keys(quicksort_2, list_, [2, 3, 1], False)
+    >>> list_
+    ['c', 'a', 'b']
+    """
+    if reverse:
+        if all(type(k) is int or type(k) is float for k in keys):
+            keys = [-k for k in keys]
+        else:
+            keys = [_Reversed(k) for k in keys]
+    decorated = list(zip(keys, range(len(list_))))
+    sorter(decorated)
+    list_[:] = [list_[i] for _, i in decorated]
+
+
 # === Selection sort === #
 
 
@@ -28,13 +169,20 @@ def find_min(list_, i):
     # return min([(k, j) for j, k in enumerate(list_[i:])])[1] + i
 
 
-def selection_sort(list_):
+def selection_sort(list_, key=None, reverse=False):
     """
     Sort the items in list_ in non-decreasing order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
 
     @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
     @rtype: None
     """
+    if key is not None or reverse:
+        _sort_decorated(selection_sort, list_, key, reverse)
+        return
     i = 0
     list_len = len(list_)
     while i != list_len - 1:
@@ -60,13 +208,20 @@ def insert(list_, i):
     list_[i] = v
 
 
-def insertion_sort_1(list_):
+def insertion_sort_1(list_, key=None, reverse=False):
     """
     Sort the items in list_ in non-decreasing order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
 
     @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
     @rtype: None
     """
+    if key is not None or reverse:
+        _sort_decorated(insertion_sort_1, list_, key, reverse)
+        return
     i = 1
     # Insert each item i where it belongs in list_[0:i + 1]
     while i != len(list_):
@@ -92,13 +247,20 @@ def find_insertion_point(list_, i):
     return i
 
 
-def insertion_sort_2(list_):
+def insertion_sort_2(list_, key=None, reverse=False):
     """
     Sort the items in list_ in non-decreasing order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
 
     @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
     @rtype: None
     """
+    if key is not None or reverse:
+        _sort_decorated(insertion_sort_2, list_, key, reverse)
+        return
     i = 1
     # Insert each item i where it belongs in list_[0:i + 1]
     while i != len(list_):
@@ -110,13 +272,20 @@ def insertion_sort_2(list_):
 
 
 # === Bubblesort 1 == #
-def bubblesort_1(list_):
+def bubblesort_1(list_, key=None, reverse=False):
     """
     Sort the items in list_ in non-decreasing order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
 
     @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
     @rtype: None
     """
+    if key is not None or reverse:
+        _sort_decorated(bubblesort_1, list_, key, reverse)
+        return
     j = len(list_) - 1
     while j != 0:
         # Swap every item that is out of order.
@@ -127,13 +296,20 @@ def bubblesort_1(list_):
 
 
 # === Bubblesort 2 === #
-def bubblesort_2(list_):
+def bubblesort_2(list_, key=None, reverse=False):
     """
     Sort the items in list_ in non-decreasing order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
 
     @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
     @rtype: None
     """
+    if key is not None or reverse:
+        _sort_decorated(bubblesort_2, list_, key, reverse)
+        return
     j = len(list_) - 1
     swapped = True
     # Stop when no elements are swapped.
@@ -193,13 +369,20 @@ def _mergesort_1(list_):
     return _merge_1(left, right)
 
 
-def mergesort_1(list_):
+def mergesort_1(list_, key=None, reverse=False):
     """
     Sort list list_ in non-decreasing order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
 
     @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
     @rtype: None
     """
+    if key is not None or reverse:
+        _sort_decorated(mergesort_1, list_, key, reverse)
+        return
     list_[:] = _mergesort_1(list_)
 
 
@@ -253,13 +436,20 @@ def _mergesort_2(list_, i, j):
         list_[i:j + 1] = _merge_2(list_, i, mid, j)
 
 
-def mergesort_2(list_):
+def mergesort_2(list_, key=None, reverse=False):
     """
     Sort list list_ in non-decreasing order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
 
     @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
     @rtype: None
     """
+    if key is not None or reverse:
+        _sort_decorated(mergesort_2, list_, key, reverse)
+        return
     _mergesort_2(list_, 0, len(list_) - 1)
 
 
@@ -309,13 +499,20 @@ def _quicksort_1(list_):
         return _quicksort_1(left) + [list_[pivot]] + _quicksort_1(right)
 
 
-def quicksort_1(list_):
+def quicksort_1(list_, key=None, reverse=False):
     """
     Sort list list_ in non-decreasing order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
 
     @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
     @rtype: None
     """
+    if key is not None or reverse:
+        _sort_decorated(quicksort_1, list_, key, reverse)
+        return
     list_[:] = _quicksort_1(list_)
 
 
@@ -362,11 +559,1486 @@ def _quicksort_2(list_, i, j):
         _quicksort_2(list_, pivot + 1, j)
 
 
-def quicksort_2(list_):
+def quicksort_2(list_, key=None, reverse=False):
     """
     Sort list list_ in non-decreasing order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
 
     @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
     @rtype: None
     """
+    if key is not None or reverse:
+        _sort_decorated(quicksort_2, list_, key, reverse)
+        return
     _quicksort_2(list_, 0, len(list_))
+
+
+# === Hybrid sort === #
+# Runs shorter than this are extended with binary insertion sort.
+_MIN_MERGE = 32
+# Number of consecutive wins by one run before a merge starts galloping.
+_MIN_GALLOP = 7
+
+
+def _binary_insertion_sort(list_, i, j, start):
+    """
+    Sort list_[i:j] in non-decreasing order, given that list_[i:start]
+    is already sorted.  Like insertion_sort_2, but the spot for each item
+    is found with a binary search, and only items inside list_[i:j] are
+    shifted to make room for it.
+
+    @param list list_: list to sort
+    @param int i: index to begin sorted slice
+    @param int j: index to end sorted slice
+    @param int start: index of the first item not yet in place
+    @rtype: None
+
+    >>> list_ = [1, 4, 9, 3, 2, 8]
+    >>> _binary_insertion_sort(list_, 0, 6, 3)
+    >>> list_
+    [1, 2, 3, 4, 8, 9]
+    """
+    for k in range(start, j):
+        v = list_[k]
+        # bisect_right keeps equal items in their original order
+        the_spot = bisect_right(list_, v, i, k)
+        if the_spot != k:
+            list_[the_spot + 1:k + 1] = list_[the_spot:k]
+            list_[the_spot] = v
+
+
+def _count_run(list_, i, j):
+    """
+    Return the index just past the run that starts at list_[i] in
+    list_[i:j].  A run is either non-decreasing or strictly decreasing;
+    a decreasing run is reversed in place so every run comes back
+    non-decreasing.
+
+    @param list list_: list to search for a run
+    @param int i: index where the run starts
+    @param int j: index to stop searching at
+    @rtype: int
+
+    >>> list_ = [5, 4, 1, 2, 7]
+    >>> _count_run(list_, 0, 5)
+    3
+    >>> list_
+    [1, 4, 5, 2, 7]
+    >>> _count_run(list_, 3, 5)
+    5
+    """
+    k = i + 1
+    if k == j:
+        return k
+    if list_[k] < list_[i]:
+        # strictly decreasing, so reversing it keeps the sort stable
+        while k + 1 < j and list_[k + 1] < list_[k]:
+            k += 1
+        list_[i:k + 1] = list_[i:k + 1][::-1]
+    else:
+        while k + 1 < j and not list_[k + 1] < list_[k]:
+            k += 1
+    return k + 1
+
+
+def _min_run_length(n):
+    """
+    Return the shortest run length worth merging for a list of n items:
+    a number between _MIN_MERGE / 2 and _MIN_MERGE such that n divided by
+    it is a power of 2, or close to one.
+
+    @param int n: length of the list to sort
+    @rtype: int
+
+    >>> _min_run_length(31)
+    31
+    >>> _min_run_length(1000)
+    32
+    """
+    r = 0
+    while n >= _MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _gallop(list_, v, i, j, right):
+    """
+    Return the index where v belongs in the sorted slice list_[i:j]: after
+    any items equal to v if right, otherwise before them.  The slice is
+    probed at exponentially growing distances from i before a binary
+    search, so this is fast when the answer is close to i.
+
+    @param list list_: sorted list to search
+    @param object v: item to find a spot for
+    @param int i: index to begin search from
+    @param int j: index to end search at
+    @param bool right: whether v belongs after items equal to it
+    @rtype: int
+
+    >>> _gallop([1, 2, 2, 3, 5, 8, 13], 2, 0, 7, True)
+    3
+    >>> _gallop([1, 2, 2, 3, 5, 8, 13], 2, 0, 7, False)
+    1
+    """
+    step = 1
+    bound = i
+    # everything in list_[i:bound] is known to come before v
+    while bound < j and (not v < list_[bound] if right
+                         else list_[bound] < v):
+        i = bound + 1
+        bound = i + step
+        step *= 2
+    if right:
+        return bisect_right(list_, v, i, min(bound, j))
+    return bisect_left(list_, v, i, min(bound, j))
+
+
+def _merge_runs(list_, i, mid, j):
+    """
+    Merge the sorted runs list_[i:mid] and list_[mid:j] in place.  Items
+    already in their final spot at either end are skipped, and once one
+    run keeps winning, whole stretches of it are copied at a time.
+
+    @param list list_: list to merge runs of
+    @param int i: index where the left run starts
+    @param int mid: index where the right run starts
+    @param int j: index just past the right run
+    @rtype: None
+
+    >>> list_ = [1, 3, 5, 7, 2, 4, 6, 8]
+    >>> _merge_runs(list_, 0, 4, 8)
+    >>> list_
+    [1, 2, 3, 4, 5, 6, 7, 8]
+    """
+    # items of the left run <= list_[mid] are already in place
+    i = _gallop(list_, list_[mid], i, mid, True)
+    if i == mid:
+        return
+    # items of the right run >= list_[mid - 1] are already in place
+    j = bisect_left(list_, list_[mid - 1], mid, j)
+    left = list_[i:mid]
+    left_len = len(left)
+    a, b, k = 0, mid, i
+    while a < left_len and b < j:
+        # one item at a time, until one run wins _MIN_GALLOP times in a row
+        a_wins = b_wins = 0
+        while (a < left_len and b < j and a_wins < _MIN_GALLOP and
+               b_wins < _MIN_GALLOP):
+            if list_[b] < left[a]:
+                list_[k] = list_[b]
+                b += 1
+                b_wins, a_wins = b_wins + 1, 0
+            else:
+                list_[k] = left[a]
+                a += 1
+                a_wins, b_wins = a_wins + 1, 0
+            k += 1
+        # galloping: copy whole stretches while they stay long
+        while a < left_len and b < j:
+            end = _gallop(left, list_[b], a, left_len, True)
+            list_[k:k + end - a] = left[a:end]
+            k, a_count, a = k + end - a, end - a, end
+            if a == left_len:
+                break
+            end = _gallop(list_, left[a], b, j, False)
+            list_[k:k + end - b] = list_[b:end]
+            k, b_count, b = k + end - b, end - b, end
+            if a_count < _MIN_GALLOP and b_count < _MIN_GALLOP:
+                break
+    # whatever is left of the right run is already in place
+    list_[k:k + left_len - a] = left[a:]
+
+
+def _merge_at(list_, runs, n):
+    """
+    Merge runs[n] and runs[n + 1], the (start, length) pairs of two
+    adjacent runs of list_, and replace them in runs with the result.
+
+    @param list list_: list being sorted
+    @param list[(int, int)] runs: stack of pending runs
+    @param int n: index in runs of the left run to merge
+    @rtype: None
+    """
+    (start, length), (start2, length2) = runs[n], runs[n + 1]
+    _merge_runs(list_, start, start2, start2 + length2)
+    runs[n:n + 2] = [(start, length + length2)]
+
+
+def _merge_collapse(list_, runs):
+    """
+    Merge runs at the top of the stack until the run lengths shrink
+    faster than the Fibonacci numbers from the bottom of the stack up.
+    This keeps merges balanced and the stack O(log n) deep.
+
+    @param list list_: list being sorted
+    @param list[(int, int)] runs: stack of pending runs
+    @rtype: None
+    """
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        _merge_at(list_, runs, n)
+
+
+def hybrid_sort(list_, key=None, reverse=False):
+    """
+    Sort list_ in non-decreasing order.  Ascending and descending runs
+    already in list_ are found and merged, so nearly sorted input takes
+    close to linear time.  Equal items keep their order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
+
+    @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @rtype: None
+
+    >>> list_ = [3, 1, 2, 9, 8, 7, 4]
+    >>> hybrid_sort(list_)
+    >>> list_
+    [1, 2, 3, 4, 7, 8, 9]
+    >>> words = ['bb', 'a', 'ccc', 'd']
+    >>> hybrid_sort(words, key=len)
+    >>> words
+    ['a', 'd', 'bb', 'ccc']
+    >>> hybrid_sort(words, key=len, reverse=True)
+    >>> words
+    ['ccc', 'bb', 'a', 'd']
+    """
+    if key is not None or reverse:
+        _sort_decorated(hybrid_sort, list_, key, reverse)
+        return
+    n = len(list_)
+    if n < 2:
+        return
+    if n < _MIN_MERGE:
+        # too short to merge: fall back on insertion sort
+        _binary_insertion_sort(list_, 0, n, _count_run(list_, 0, n))
+        return
+    min_run = _min_run_length(n)
+    runs = []
+    i = 0
+    while i < n:
+        j = _count_run(list_, i, n)
+        if j - i < min_run:
+            # extend a short run to min_run items
+            end = min(i + min_run, n)
+            _binary_insertion_sort(list_, i, end, j)
+            j = end
+        runs.append((i, j - i))
+        _merge_collapse(list_, runs)
+        i = j
+    while len(runs) > 1:
+        _merge_at(list_, runs, len(runs) - 2)
+
+
+# === Introsort === #
+# Slices this short are left for a final insertion sort pass.
+_INSERTION_CUTOFF = 16
+# Slices this long pick their pivot as a median of three medians.
+_NINTHER_CUTOFF = 128
+
+
+def _median_of_three(list_, a, b, c):
+    """
+    Return whichever of the indices a, b and c holds the median of
+    list_[a], list_[b] and list_[c].
+
+    @param list list_: list to choose from
+    @param int a: first index
+    @param int b: second index
+    @param int c: third index
+    @rtype: int
+
+    >>> _median_of_three([5, 1, 3], 0, 1, 2)
+    2
+    """
+    if list_[a] < list_[b]:
+        if list_[b] < list_[c]:
+            return b
+        return c if list_[a] < list_[c] else a
+    if list_[a] < list_[c]:
+        return a
+    return c if list_[b] < list_[c] else b
+
+
+def _choose_pivot(list_, i, j):
+    """
+    Move a median of three (or, for long slices, a median of three
+    medians) of list_[i:j] to list_[i], where _partition_2 expects its
+    pivot.
+
+    @param list list_: list to choose a pivot from
+    @param int i: beginning of slice
+    @param int j: end of slice
+    @rtype: None
+
+    >>> list_ = [1, 2, 3, 4, 5]
+    >>> _choose_pivot(list_, 0, 5)
+    >>> list_[0]
+    3
+    """
+    mid, last = (i + j) // 2, j - 1
+    if j - i > _NINTHER_CUTOFF:
+        step = (j - i) // 8
+        pivot = _median_of_three(
+            list_,
+            _median_of_three(list_, i, i + step, i + 2 * step),
+            _median_of_three(list_, mid - step, mid, mid + step),
+            _median_of_three(list_, last - 2 * step, last - step, last))
+    else:
+        pivot = _median_of_three(list_, i, mid, last)
+    list_[i], list_[pivot] = list_[pivot], list_[i]
+
+
+def _sift_down(list_, i, root, j):
+    """
+    Move list_[root] down the max-heap stored in list_[i:j] until
+    neither of its children is larger.
+
+    @param list list_: list holding the heap
+    @param int i: index of the top of the heap
+    @param int root: index of the item to move down
+    @param int j: index just past the end of the heap
+    @rtype: None
+
+    >>> list_ = [1, 5, 3, 4]
+    >>> _sift_down(list_, 0, 0, 4)
+    >>> list_
+    [5, 4, 3, 1]
+    """
+    v = list_[root]
+    child = 2 * root - i + 1
+    while child < j:
+        # pick the larger child
+        if child + 1 < j and list_[child] < list_[child + 1]:
+            child += 1
+        if not v < list_[child]:
+            break
+        list_[root] = list_[child]
+        root = child
+        child = 2 * root - i + 1
+    list_[root] = v
+
+
+def _heapify(list_, i, j):
+    """
+    Rearrange list_[i:j] into a max-heap.
+
+    @param list list_: list to rearrange
+    @param int i: index of the top of the heap
+    @param int j: index just past the end of the heap
+    @rtype: None
+
+    >>> list_ = [1, 2, 3, 4, 5]
+    >>> _heapify(list_, 0, 5)
+    >>> list_
+    [5, 4, 3, 1, 2]
+    """
+    for root in range((i + j) // 2 - 1, i - 1, -1):
+        _sift_down(list_, i, root, j)
+
+
+def _sort_heap(list_, i, j):
+    """
+    Sort the max-heap list_[i:j] in non-decreasing order by repeatedly
+    moving its top to the end.
+
+    @param list list_: list holding the heap
+    @param int i: index of the top of the heap
+    @param int j: index just past the end of the heap
+    @rtype: None
+
+    >>> list_ = [5, 4, 3, 1, 2]
+    >>> _sort_heap(list_, 0, 5)
+    >>> list_
+    [1, 2, 3, 4, 5]
+    """
+    for end in range(j - 1, i, -1):
+        list_[i], list_[end] = list_[end], list_[i]
+        _sift_down(list_, i, i, end)
+
+
+def _heapsort(list_, i, j):
+    """
+    Sort list_[i:j] in non-decreasing order by building a max-heap and
+    repeatedly moving its top to the end.
+
+    @param list list_: list to sort
+    @param int i: index to begin sorted slice
+    @param int j: index to end sorted slice
+    @rtype: None
+
+    >>> list_ = [9, 4, 7, 1, 8, 0]
+    >>> _heapsort(list_, 1, 5)
+    >>> list_
+    [9, 1, 4, 7, 8, 0]
+    """
+    _heapify(list_, i, j)
+    _sort_heap(list_, i, j)
+
+
+def _introsort(list_, i, j, depth):
+    """
+    Partition list_[i:j] like _quicksort_2 until slices are shorter than
+    _INSERTION_CUTOFF, switching to heapsort once depth more levels of
+    partitioning have been used.
+
+    @param list list_: list to sort
+    @param int i: index to begin sorted slice
+    @param int j: index to end sorted slice
+    @param int depth: levels of partitioning left before heapsort
+    @rtype: None
+    """
+    while j - i > _INSERTION_CUTOFF:
+        if depth == 0:
+            _heapsort(list_, i, j)
+            return
+        depth -= 1
+        _choose_pivot(list_, i, j)
+        pivot = _partition_2(list_, i, j)
+        # recurse on the shorter side, loop on the longer one
+        if pivot - i < j - pivot:
+            _introsort(list_, i, pivot, depth)
+            i = pivot + 1
+        else:
+            _introsort(list_, pivot + 1, j, depth)
+            j = pivot
+
+
+def introsort(list_, key=None, reverse=False):
+    """
+    Sort list list_ in non-decreasing order, in O(n log n) time even for
+    sorted, reversed or otherwise adversarial input.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
+
+    @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @rtype: None
+
+    >>> list_ = list(range(100, 0, -1))
+    >>> introsort(list_)
+    >>> list_ == list(range(1, 101))
+    True
+    """
+    if key is not None or reverse:
+        _sort_decorated(introsort, list_, key, reverse)
+        return
+    n = len(list_)
+    if n < 2:
+        return
+    _introsort(list_, 0, n, 2 * (n.bit_length() - 1))
+    # every item is now less than _INSERTION_CUTOFF away from its spot
+    insertion_sort_1(list_)
+
+
+# === Heapsort === #
+def heapsort(list_, key=None, reverse=False):
+    """
+    Sort list list_ in non-decreasing order in place, by building a
+    max-heap in list_ and repeatedly moving its top to the end.  This
+    takes O(n log n) time even on the worst input and no extra lists,
+    but equal items may not keep their order.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
+
+    @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @rtype: None
+
+    >>> list_ = [5, 2, 4, 6, 1, 3]
+    >>> heapsort(list_)
+    >>> list_
+    [1, 2, 3, 4, 5, 6]
+    """
+    if key is not None or reverse:
+        _sort_decorated(heapsort, list_, key, reverse)
+        return
+    _heapsort(list_, 0, len(list_))
+
+
+# === Quicksort 3 === #
+def _partition_3(list_, i, j):
+    """
+    Rearrange list_[i:j] so that items < list_[i] are at the beginning,
+    items equal to list_[i] in the middle and items > list_[i] at the
+    end, and return the indices (lt, gt) where the middle part
+    list_[lt:gt] begins and ends.
+
+    @param list list_: list to partition
+    @param int i: beginning of partition slice
+    @param int j: end of partition slice
+    @rtype: (int, int)
+
+    >>> list_ = [2, 3, 2, 1, 2]
+    >>> _partition_3(list_, 0, 5)
+    (1, 4)
+    >>> list_
+    [1, 2, 2, 2, 3]
+    """
+    v = list_[i]
+    lt, k, gt = i, i + 1, j
+    # list_[i:lt] < v, list_[lt:k] == v, list_[gt:j] > v
+    while k < gt:
+        if list_[k] < v:
+            list_[lt], list_[k] = list_[k], list_[lt]
+            lt += 1
+            k += 1
+        elif v < list_[k]:
+            gt -= 1
+            list_[k], list_[gt] = list_[gt], list_[k]
+        else:
+            k += 1
+    return lt, gt
+
+
+def _quicksort_3(list_, i, j):
+    """
+    Sort list_[i:j] by partitioning it three ways around a median of
+    three, then recursing on the items that are not equal to it.
+
+    @param list list_: list to sort
+    @param int i: index to begin sorted slice
+    @param int j: index to end sorted slice
+    @rtype: None
+    """
+    while j - i > 1:
+        _choose_pivot(list_, i, j)
+        lt, gt = _partition_3(list_, i, j)
+        # recurse on the shorter side, loop on the longer one
+        if lt - i < j - gt:
+            _quicksort_3(list_, i, lt)
+            i = gt
+        else:
+            _quicksort_3(list_, gt, j)
+            j = lt
+
+
+def quicksort_3(list_, key=None, reverse=False):
+    """
+    Sort list list_ in non-decreasing order.  Items equal to the pivot
+    are never partitioned again, so lists with few distinct items sort
+    in close to linear time.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
+
+    @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @rtype: None
+
+    >>> list_ = [3, 1, 3, 2, 1, 3]
+    >>> quicksort_3(list_)
+    >>> list_
+    [1, 1, 2, 3, 3, 3]
+    """
+    if key is not None or reverse:
+        _sort_decorated(quicksort_3, list_, key, reverse)
+        return
+    _quicksort_3(list_, 0, len(list_))
+
+
+# === Mergesort 3 === #
+def _merge_3(source, target, i, mid, j):
+    """
+    Merge the sorted halves source[i:mid] and source[mid:j] into
+    target[i:j], without building any new lists.  If the halves are
+    already in order they are copied across without comparing any more
+    items.
+
+    @param list source: list holding the sorted halves
+    @param list target: list to merge into
+    @param int i: starting index for first half
+    @param int mid: starting index for second half
+    @param int j: index just past the end of second half
+    @rtype: None
+
+    >>> target = [None] * 6
+    >>> _merge_3([1, 3, 5, 2, 4, 6], target, 0, 3, 6)
+    >>> target
+    [1, 2, 3, 4, 5, 6]
+    """
+    if mid == j or not source[mid] < source[mid - 1]:
+        # already in order: nothing to merge
+        for k in range(i, j):
+            target[k] = source[k]
+        return
+    left, right, k = i, mid, i
+    while left < mid and right < j:
+        # take from the left half on ties, to keep the sort stable
+        if source[right] < source[left]:
+            target[k] = source[right]
+            right += 1
+        else:
+            target[k] = source[left]
+            left += 1
+        k += 1
+    # copy whatever is left of the halves
+    while left < mid:
+        target[k] = source[left]
+        left += 1
+        k += 1
+    while right < j:
+        target[k] = source[right]
+        right += 1
+        k += 1
+
+
+def mergesort_3(list_, key=None, reverse=False):
+    """
+    Sort list list_ in non-decreasing order, merging ever longer sorted
+    runs bottom-up between list_ and a single buffer of len(list_)
+    slots.  No recursion and no other lists are used.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
+
+    @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @rtype: None
+
+    >>> list_ = [5, 2, 4, 6, 1, 3]
+    >>> mergesort_3(list_)
+    >>> list_
+    [1, 2, 3, 4, 5, 6]
+    """
+    if key is not None or reverse:
+        _sort_decorated(mergesort_3, list_, key, reverse)
+        return
+    n = len(list_)
+    if n < 2:
+        return
+    width = 1
+    # each pass of merging moves the items to the other list, so if the
+    # number of passes is odd, do the first one in place by sorting pairs
+    if (n - 1).bit_length() % 2 == 1:
+        for k in range(1, n, 2):
+            if list_[k] < list_[k - 1]:
+                list_[k - 1], list_[k] = list_[k], list_[k - 1]
+        width = 2
+    source, target = list_, [None] * n
+    while width < n:
+        for i in range(0, n, 2 * width):
+            _merge_3(source, target, i, min(i + width, n),
+                     min(i + 2 * width, n))
+        source, target = target, source
+        width *= 2
+
+
+# === In-place mergesort === #
+def _shift(list_, i, j, offset, cap):
+    """
+    Copy list_[i:j] to list_[i + offset:j + offset], cap items at a time,
+    so that no more than cap items are ever copied out of list_.
+
+    @param list list_: list to shift items in
+    @param int i: index of the first item to shift
+    @param int j: index just past the last item to shift
+    @param int offset: number of places to move the items right (or left,
+                       if negative)
+    @param int cap: largest number of items to copy at once
+    @rtype: None
+
+    >>> list_ = [1, 2, 3, 4, 5]
+    >>> _shift(list_, 2, 5, -2, 2)
+    >>> list_
+    [3, 4, 5, 4, 5]
+    """
+    if offset < 0:
+        for k in range(i, j, cap):
+            end = min(k + cap, j)
+            list_[k + offset:end + offset] = list_[k:end]
+    else:
+        for k in range(j, i, -cap):
+            start = max(k - cap, i)
+            list_[start + offset:k + offset] = list_[start:k]
+
+
+def _swap_blocks(list_, a, b, length, cap):
+    """
+    Swap list_[a:a + length] with the later list_[b:b + length], which
+    it does not overlap, cap items at a time.
+
+    @param list list_: list to swap blocks of
+    @param int a: index where the first block starts
+    @param int b: index where the second block starts
+    @param int length: number of items in each block
+    @param int cap: largest number of items to copy at once
+    @rtype: None
+
+    >>> list_ = [1, 2, 3, 4, 5]
+    >>> _swap_blocks(list_, 0, 3, 2, 1)
+    >>> list_
+    [4, 5, 3, 1, 2]
+    """
+    for k in range(0, length, cap):
+        end = min(k + cap, length)
+        block = list_[a + k:a + end]
+        list_[a + k:a + end] = list_[b + k:b + end]
+        list_[b + k:b + end] = block
+
+
+def _rotate(list_, i, mid, j, cap):
+    """
+    Exchange list_[i:mid] and list_[mid:j], keeping the order of the items
+    within each, copying no more than cap items out of list_ at once.
+
+    @param list list_: list to rotate a slice of
+    @param int i: index where the first slice starts
+    @param int mid: index where the second slice starts
+    @param int j: index just past the second slice
+    @param int cap: largest number of items to copy at once
+    @rtype: None
+
+    >>> list_ = [1, 2, 3, 4, 5, 6, 7]
+    >>> _rotate(list_, 0, 5, 7, 1)
+    >>> list_
+    [6, 7, 1, 2, 3, 4, 5]
+    """
+    while i < mid < j:
+        if mid - i <= cap:
+            left = list_[i:mid]
+            _shift(list_, mid, j, i - mid, cap)
+            list_[j - len(left):j] = left
+            return
+        if j - mid <= cap:
+            right = list_[mid:j]
+            _shift(list_, i, mid, j - mid, cap)
+            list_[i:i + len(right)] = right
+            return
+        if mid - i <= j - mid:
+            # the left slice swaps into its final place at the end
+            _swap_blocks(list_, i, j - (mid - i), mid - i, cap)
+            j -= mid - i
+        else:
+            # the right slice swaps into its final place at the start
+            _swap_blocks(list_, i, mid, j - mid, cap)
+            i += j - mid
+
+
+def _merge_with_buffer(list_, i, mid, j):
+    """
+    Merge the sorted runs list_[i:mid] and list_[mid:j] in place, copying
+    out only the shorter run.
+
+    @param list list_: list to merge runs of
+    @param int i: index where the left run starts
+    @param int mid: index where the right run starts
+    @param int j: index just past the right run
+    @rtype: None
+
+    >>> list_ = [1, 4, 5, 6, 2, 3]
+    >>> _merge_with_buffer(list_, 0, 4, 6)
+    >>> list_
+    [1, 2, 3, 4, 5, 6]
+    """
+    if mid - i <= j - mid:
+        left = list_[i:mid]
+        left_len = len(left)
+        a, b, k = 0, mid, i
+        while a < left_len and b < j:
+            # take from the left run on ties, to keep the sort stable
+            if list_[b] < left[a]:
+                list_[k] = list_[b]
+                b += 1
+            else:
+                list_[k] = left[a]
+                a += 1
+            k += 1
+        # whatever is left of the right run is already in place
+        list_[k:k + left_len - a] = left[a:]
+    else:
+        right = list_[mid:j]
+        a, b, k = mid - 1, len(right) - 1, j - 1
+        while a >= i and b >= 0:
+            # take from the right run on ties, filling from the end
+            if right[b] < list_[a]:
+                list_[k] = list_[a]
+                a -= 1
+            else:
+                list_[k] = right[b]
+                b -= 1
+            k -= 1
+        # whatever is left of the left run is already in place
+        list_[i:i + b + 1] = right[:b + 1]
+
+
+def _merge_in_place(list_, i, mid, j, cap):
+    """
+    Merge the sorted runs list_[i:mid] and list_[mid:j] in place, copying
+    no more than cap items out of list_ at once.  While both runs are
+    longer than cap, the longer one is cut in half, the other is cut
+    where that middle item belongs, and the two inner pieces are rotated
+    so that what is left is two smaller merges.
+
+    @param list list_: list to merge runs of
+    @param int i: index where the left run starts
+    @param int mid: index where the right run starts
+    @param int j: index just past the right run
+    @param int cap: largest number of items to copy at once
+    @rtype: None
+
+    >>> list_ = [1, 3, 5, 7, 9, 2, 4, 6, 8]
+    >>> _merge_in_place(list_, 0, 5, 9, 1)
+    >>> list_
+    [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    """
+    while i < mid < j and list_[mid] < list_[mid - 1]:
+        # items already in their final spot at either end stay put
+        i = bisect_right(list_, list_[mid], i, mid)
+        j = bisect_left(list_, list_[mid - 1], mid, j)
+        if min(mid - i, j - mid) <= cap:
+            _merge_with_buffer(list_, i, mid, j)
+            return
+        if mid - i > j - mid:
+            left_cut = (i + mid) // 2
+            right_cut = bisect_left(list_, list_[left_cut], mid, j)
+        else:
+            right_cut = (mid + j) // 2
+            left_cut = bisect_right(list_, list_[right_cut], i, mid)
+        _rotate(list_, left_cut, mid, right_cut, cap)
+        new_mid = left_cut + right_cut - mid
+        # recurse into the smaller merge and loop on the larger, so the
+        # recursion is never more than about log2(j - i) deep
+        if new_mid - i < j - new_mid:
+            _merge_in_place(list_, i, left_cut, new_mid, cap)
+            i, mid = new_mid, right_cut
+        else:
+            _merge_in_place(list_, new_mid, right_cut, j, cap)
+            mid, j = left_cut, new_mid
+
+
+def in_place_mergesort(list_, key=None, reverse=False):
+    """
+    Sort list list_ in non-decreasing order, keeping equal items in
+    their original order like mergesort_1, but with about sqrt(len(list_))
+    extra slots instead of len(list_).  Blocks of _MIN_MERGE items are
+    insertion sorted, then merged bottom-up by _merge_in_place.  This
+    takes O(n log n) comparisons, but up to O(n log^2 n) moves.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once.
+    The keys then take len(list_) extra slots.
+
+    @param list list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @rtype: None
+
+    >>> list_ = [5, 2, 4, 6, 1, 3]
+    >>> in_place_mergesort(list_)
+    >>> list_
+    [1, 2, 3, 4, 5, 6]
+    >>> list_ = [(1, 'b'), (0, 'a'), (1, 'a'), (0, 'b')]
+    >>> in_place_mergesort(list_, key=lambda pair: pair[0])
+    >>> list_
+    [(0, 'a'), (0, 'b'), (1, 'b'), (1, 'a')]
+    """
+    if key is not None or reverse:
+        _sort_decorated(in_place_mergesort, list_, key, reverse)
+        return
+    n = len(list_)
+    for i in range(0, n, _MIN_MERGE):
+        _binary_insertion_sort(list_, i, min(i + _MIN_MERGE, n), i + 1)
+    cap = max(_MIN_MERGE, math.isqrt(n))
+    width = _MIN_MERGE
+    while width < n:
+        for i in range(0, n - width, 2 * width):
+            _merge_in_place(list_, i, i + width, min(i + 2 * width, n), cap)
+        width *= 2
+
+
+# === Parallel sort === #
+# Lists shorter than this are not worth shipping to other processes.
+_PARALLEL_CUTOFF = 10000
+
+
+def _merge_k(runs):
+    """
+    Merge the sorted sequences in runs into a new list and return that
+    new list.  As in _merge_1, equal items are taken from earlier runs
+    first.
+
+    @param list[list] runs: sorted sequences to merge
+    @rtype: list
+
+    >>> _merge_k([[1, 4, 4], [0, 4], [], [2, 3]])
+    [0, 1, 2, 3, 4, 4, 4]
+    """
+    heap = [(run[0], k, 0) for k, run in enumerate(runs) if len(run) > 0]
+    heapq.heapify(heap)
+    result = []
+    while len(heap) > 1:
+        v, k, i = heap[0]
+        result.append(v)
+        i += 1
+        if i < len(runs[k]):
+            heapq.heapreplace(heap, (runs[k][i], k, i))
+        else:
+            heapq.heappop(heap)
+    if heap:
+        # only one run left: copy the rest of it
+        _, k, i = heap[0]
+        result += runs[k][i:]
+    return result
+
+
+def _sort_chunk(chunk):
+    """
+    Sort list chunk and return it.  Runs in a worker process.
+
+    @param list chunk: list to sort
+    @rtype: list
+    """
+    mergesort_3(chunk)
+    return chunk
+
+
+def _sort_shared_chunk(name, typecode, i, j):
+    """
+    Sort items i through j - 1 of the array with the given typecode
+    stored in the shared memory block called name.  Runs in a worker
+    process.
+
+    @param str name: name of the shared memory block
+    @param str typecode: array typecode of the items in the block
+    @param int i: index to begin sorted slice
+    @param int j: index to end sorted slice
+    @rtype: None
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        with block.buf.cast(typecode) as view:
+            chunk = view[i:j].tolist()
+            mergesort_3(chunk)
+            view[i:j] = array(typecode, chunk)
+    finally:
+        block.close()
+
+
+def _pack(list_):
+    """
+    Return list_ as an array of machine ints or floats, or None if its
+    items are not all one of those types.
+
+    @param list list_: list to pack
+    @rtype: array|None
+
+    >>> _pack([3, 1, 2])
+    array('q', [3, 1, 2])
+    >>> _pack([3, 1.5]) is None
+    True
+    """
+    if all(type(v) is int for v in list_):
+        try:
+            return array('q', list_)
+        except OverflowError:
+            return None
+    if all(type(v) is float for v in list_):
+        return array('d', list_)
+    return None
+
+
+def _parallel_sort_shared(list_, packed, bounds, pool):
+    """
+    Sort list_ by copying it into shared memory as packed, having pool
+    sort each slice in bounds there, and merging the slices back into
+    list_.  Only names and indices are sent to the workers.
+
+    @param list list_: list to sort
+    @param array packed: list_ as an array
+    @param list[(int, int)] bounds: (start, end) of each chunk to sort
+    @param ProcessPoolExecutor pool: workers to sort chunks with
+    @rtype: None
+    """
+    n, typecode = len(packed), packed.typecode
+    block = shared_memory.SharedMemory(create=True,
+                                       size=n * packed.itemsize)
+    try:
+        with block.buf.cast(typecode) as view:
+            view[:n] = packed
+            list(pool.map(_sort_shared_chunk, repeat(block.name),
+                          repeat(typecode), *zip(*bounds)))
+            runs = [view[i:j] for i, j in bounds]
+            try:
+                list_[:] = _merge_k(runs)
+            finally:
+                for run in runs:
+                    run.release()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def parallel_sort(list_, workers=None, key=None, reverse=False):
+    """
+    Sort list list_ in non-decreasing order, sorting chunks of it in up
+    to workers processes and merging them.  Lists of only ints that fit
+    in 64 bits, or only floats, reach the workers through shared memory
+    instead of being pickled.
+    If key is given, sort by key(item) instead of by the items, and if
+    reverse, sort in non-increasing order.  Each key is computed once,
+    in this process, so keys must be picklable but key need not be.
+
+    On platforms that spawn worker processes, call this only from code
+    guarded by if __name__ == '__main__'.
+
+    @param list list_: list to sort
+    @param int|None workers: number of processes, by default one per CPU
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @rtype: None
+
+    >>> list_ = [3, 1, 2]
+    >>> parallel_sort(list_, 2)
+    >>> list_
+    [1, 2, 3]
+    """
+    if key is not None or reverse:
+        _sort_decorated(lambda decorated: parallel_sort(decorated, workers),
+                        list_, key, reverse)
+        return
+    n = len(list_)
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or n < _PARALLEL_CUTOFF:
+        mergesort_3(list_)
+        return
+    size = -(-n // workers)
+    bounds = [(i, min(i + size, n)) for i in range(0, n, size)]
+    packed = _pack(list_)
+    with ProcessPoolExecutor(workers) as pool:
+        if packed is None:
+            runs = pool.map(_sort_chunk, [list_[i:j] for i, j in bounds])
+            list_[:] = _merge_k(list(runs))
+        else:
+            _parallel_sort_shared(list_, packed, bounds, pool)
+
+
+# === Counting and radix sorts === #
+# Slices of strs or bytes this short are insertion sorted instead.
+_MSD_CUTOFF = 16
+
+
+def counting_sort(list_):
+    """
+    Sort list list_ of ints in non-decreasing order by counting how many
+    times each value between min(list_) and max(list_) appears.  Takes
+    O(n + max(list_) - min(list_)) time.
+
+    @param list[int] list_: list to sort
+    @rtype: None
+
+    >>> list_ = [3, -1, 3, 0, 2]
+    >>> counting_sort(list_)
+    >>> list_
+    [-1, 0, 2, 3, 3]
+    """
+    if len(list_) < 2:
+        return
+    lo = min(list_)
+    counts = [0] * (max(list_) - lo + 1)
+    for v in list_:
+        counts[v - lo] += 1
+    list_[:] = [v for v, n in zip(count(lo), counts) if n
+                for v in repeat(v, n)]
+
+
+def lsd_radix_sort(list_):
+    """
+    Sort list list_ of ints in non-decreasing order by distributing them
+    into buckets one digit at a time, least significant digit first.
+    Digits are sized from len(list_) and the range of the values, so
+    that there are only a few passes of O(n) each.
+
+    @param list[int] list_: list to sort
+    @rtype: None
+
+    >>> list_ = [170, 45, -75, 90, 802, 24, 2, 66]
+    >>> lsd_radix_sort(list_)
+    >>> list_
+    [-75, 2, 24, 45, 66, 90, 170, 802]
+    >>> list_ = [5, 5]
+    >>> lsd_radix_sort(list_)
+    >>> list_
+    [5, 5]
+    """
+    if len(list_) < 2:
+        return
+    lo = min(list_)
+    span_bits = (max(list_) - lo).bit_length()
+    if span_bits == 0:
+        # all the values are equal, so already in order
+        return
+    # at most about n buckets per pass, spread evenly over the passes
+    digit_bits = max(4, min(16, len(list_).bit_length()))
+    passes = max(1, -(-span_bits // digit_bits))
+    digit_bits = -(-span_bits // passes)
+    mask = (1 << digit_bits) - 1
+    keys = [v - lo for v in list_]
+    for shift in range(0, passes * digit_bits, digit_bits):
+        buckets = [[] for _ in range(mask + 1)]
+        appends = [bucket.append for bucket in buckets]
+        for k in keys:
+            appends[(k >> shift) & mask](k)
+        keys = [k for bucket in buckets for k in bucket]
+    list_[:] = [k + lo for k in keys]
+
+
+def msd_radix_sort(list_):
+    """
+    Sort list list_ of strs, or of bytes, in non-decreasing order by
+    distributing them into buckets by their first character, then
+    sorting each bucket by the next character, and so on.  Short
+    buckets are insertion sorted.  Equal items keep their order.
+
+    @param list[str]|list[bytes] list_: list to sort
+    @rtype: None
+
+    >>> list_ = ['she', 'sells', 'sea', 'shells', 'by', 'the', 'sea']
+    >>> msd_radix_sort(list_)
+    >>> list_
+    ['by', 'sea', 'sea', 'sells', 'she', 'shells', 'the']
+    """
+    # slices list_[i:j] that agree on their first d characters
+    pending = [(0, len(list_), 0)]
+    while pending:
+        i, j, d = pending.pop()
+        if j - i < _MSD_CUTOFF:
+            _binary_insertion_sort(list_, i, j, i + 1)
+            continue
+        done, buckets = [], {}
+        for k in range(i, j):
+            item = list_[k]
+            if len(item) > d:
+                buckets.setdefault(item[d], []).append(item)
+            else:
+                # items with no character d come first
+                done.append(item)
+        list_[i:i + len(done)] = done
+        k = i + len(done)
+        for c in sorted(buckets):
+            bucket = buckets[c]
+            list_[k:k + len(bucket)] = bucket
+            if len(bucket) > 1:
+                pending.append((k, k + len(bucket), d + 1))
+            k += len(bucket)
+
+
+def radix_sort(list_):
+    """
+    Sort list list_ of ints, of strs or of bytes in non-decreasing order
+    without comparing whole items.  Ints in a range no wider than twice
+    len(list_) are counting sorted, other ints are LSD radix sorted and
+    strs or bytes are MSD radix sorted.
+
+    @param list[int]|list[str]|list[bytes] list_: list to sort
+    @rtype: None
+
+    >>> list_ = [5, 3, 9, 1]
+    >>> radix_sort(list_)
+    >>> list_
+    [1, 3, 5, 9]
+    >>> list_ = [b'b', b'a']
+    >>> radix_sort(list_)
+    >>> list_
+    [b'a', b'b']
+    """
+    if len(list_) < 2:
+        return
+    if all(type(v) is int for v in list_):
+        if max(list_) - min(list_) <= 2 * len(list_):
+            counting_sort(list_)
+        else:
+            lsd_radix_sort(list_)
+    elif (all(type(v) is str for v in list_) or
+          all(type(v) is bytes for v in list_)):
+        msd_radix_sort(list_)
+    else:
+        raise TypeError("radix_sort needs all ints, all strs or all bytes")
+
+
+# === Vectorized sort === #
+def _as_numeric_array(list_):
+    """
+    Return list_ as a NumPy array of 64-bit ints or floats holding exactly
+    the same numbers, or None if NumPy is missing or list_ holds anything
+    else.  One-dimensional NumPy arrays of numbers are returned as they
+    are; raise ValueError for NumPy arrays of other shapes.
+
+    @param list|numpy.ndarray list_: list to convert
+    @rtype: numpy.ndarray|None
+    """
+    if numpy is None:
+        return None
+    if isinstance(list_, numpy.ndarray):
+        if list_.ndim != 1:
+            raise ValueError("can only sort one-dimensional arrays")
+        return list_ if list_.dtype.kind in 'iuf' else None
+    if all(type(v) is int for v in list_):
+        try:
+            return numpy.array(list_, dtype=numpy.int64)
+        except OverflowError:
+            return None
+    if all(type(v) is float for v in list_):
+        return numpy.array(list_, dtype=numpy.float64)
+    return None
+
+
+def vectorized_sort(list_, key=None, reverse=False, kind=None,
+                    fallback=hybrid_sort):
+    """
+    Sort list_ in non-decreasing order, or in non-decreasing order of
+    key(item) if key is given, or in non-increasing order if reverse,
+    with NumPy if it is installed and the items (or keys) are all ints
+    or all floats.  A one-dimensional NumPy
+    array of numbers is sorted where it is, without copying; other NumPy
+    arrays raise ValueError.  Anything else is sorted by fallback: with
+    key, fallback sorts (key, index) pairs, so it must compare items, and
+    with reverse, it must take reverse=, as the comparison sorts in this
+    module do.  Otherwise any of the sorts in this module will do.
+
+    @param list|numpy.ndarray list_: list to sort
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to sort in non-increasing order
+    @param str|None kind: NumPy sorting algorithm, by default 'quicksort'
+                          without key and 'stable' with it
+    @param (list)->None fallback: sort to use when NumPy can't
+    @rtype: None
+
+    >>> list_ = [3.5, 1.0, 2.25]
+    >>> vectorized_sort(list_)
+    >>> list_
+    [1.0, 2.25, 3.5]
+    >>> list_ = ['bb', 'a', 'ccc']
+    >>> vectorized_sort(list_, key=len)
+    >>> list_
+    ['a', 'bb', 'ccc']
+    >>> list_ = [3, 1.5, 2]
+    >>> vectorized_sort(list_, fallback=mergesort_1)
+    >>> list_
+    [1.5, 2, 3]
+    >>> list_ = ['b', 'a']
+    >>> vectorized_sort(list_, fallback=radix_sort)
+    >>> list_
+    ['a', 'b']
+    """
+    if key is None:
+        array_ = _as_numeric_array(list_)
+        if array_ is None and reverse:
+            fallback(list_, reverse=True)
+            return
+        elif array_ is None:
+            # radix sorts take no reverse
+            fallback(list_)
+            return
+        array_.sort(kind=kind or 'quicksort')
+        if reverse:
+            # equal numbers can't be told apart, so reading the sorted
+            # array backwards is as good as a stable reverse sort
+            array_ = array_[::-1]
+        if isinstance(list_, list):
+            list_[:] = array_.tolist()
+        elif array_ is not list_:
+            list_[:] = array_
+        return
+    raw_keys = [key(v) for v in list_]
+    keys = _as_numeric_array(raw_keys)
+    if keys is None:
+        _sort_by_keys(fallback, list_, raw_keys, reverse)
+        return
+    if reverse:
+        # a stable sort of the reversed keys, read backwards, puts the
+        # largest keys first with equal keys still in their old order
+        n = len(keys)
+        order = (n - 1 - keys[::-1].argsort(kind=kind or 'stable'))[::-1]
+    else:
+        order = keys.argsort(kind=kind or 'stable')
+    if isinstance(list_, list):
+        list_[:] = [list_[i] for i in order.tolist()]
+    else:
+        list_[:] = list_[order]
+
+
+# === Selection === #
+def _introselect(list_, i, j, k, depth):
+    """
+    Rearrange list_[i:j] so that list_[k] holds the item that would be
+    there if list_[i:j] were sorted, with no larger items before it and
+    no smaller items after it.  Partitions like _quicksort_3, but only
+    the part holding index k, switching to heapsort once depth levels of
+    partitioning have been used.
+
+    @param list list_: list to rearrange
+    @param int i: index to begin slice
+    @param int j: index to end slice
+    @param int k: index to put in place, i <= k < j
+    @param int depth: levels of partitioning left before heapsort
+    @rtype: None
+    """
+    while j - i > _INSERTION_CUTOFF:
+        if depth == 0:
+            _heapsort(list_, i, j)
+            return
+        depth -= 1
+        _choose_pivot(list_, i, j)
+        lt, gt = _partition_3(list_, i, j)
+        if k < lt:
+            j = lt
+        elif k >= gt:
+            i = gt
+        else:
+            # list_[k] is equal to the pivot, so it is in place
+            return
+    _binary_insertion_sort(list_, i, j, i + 1)
+
+
+def nth_element(list_, k, key=None, reverse=False):
+    """
+    Rearrange list_ so that list_[k] holds the item that would be there if
+    list_ were sorted, with no larger items before it and no smaller
+    items after it, and return that item.  Takes O(n) time on average and
+    O(n log n) at worst.
+    If key is given, compare key(item) instead of the items, and if
+    reverse, use non-increasing order.  Each key is computed once.
+
+    @param list list_: list to rearrange
+    @param int k: index to put in place; may be negative, as for lists
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to use non-increasing order
+    @rtype: object
+
+    >>> list_ = [7, 1, 5, 3, 9, 2]
+    >>> nth_element(list_, 2)
+    3
+    >>> sorted(list_[:2]), sorted(list_[3:])
+    ([1, 2], [5, 7, 9])
+    >>> nth_element(list_, 0, reverse=True)
+    9
+    """
+    n = len(list_)
+    if not -n <= k < n:
+        raise IndexError("out of range!!!")
+    k %= n
+    if key is not None or reverse:
+        _sort_decorated(lambda decorated: nth_element(decorated, k),
+                        list_, key, reverse)
+        return list_[k]
+    _introselect(list_, 0, n, k, 2 * (n.bit_length() - 1))
+    return list_[k]
+
+
+def partial_sort(list_, k, key=None, reverse=False):
+    """
+    Rearrange list_ so that list_[:k] holds its k smallest items in
+    non-decreasing order, and the rest of the items follow in no
+    particular order.  The k smallest so far are kept in a max-heap
+    while scanning the rest, so this takes O(n log k) time and no extra
+    space.
+    If key is given, compare key(item) instead of the items, and if
+    reverse, put the k largest first in non-increasing order.  Each key
+    is computed once.
+
+    @param list list_: list to rearrange
+    @param int k: number of items to put in place
+    @param (object)->object|None key: function computing each item's key
+    @param bool reverse: whether to use non-increasing order
+    @rtype: None
+
+    >>> list_ = [7, 1, 5, 3, 9, 2]
+    >>> partial_sort(list_, 3)
+    >>> list_[:3], sorted(list_[3:])
+    ([1, 2, 3], [5, 7, 9])
+    """
+    k = min(k, len(list_))
+    if k <= 0:
+        return
+    if key is not None or reverse:
+        _sort_decorated(lambda decorated: partial_sort(decorated, k),
+                        list_, key, reverse)
+        return
+    _heapify(list_, 0, k)
+    for m in range(k, len(list_)):
+        # replace the largest of the k smallest so far
+        if list_[m] < list_[0]:
+            list_[0], list_[m] = list_[m], list_[0]
+            _sift_down(list_, 0, 0, k)
+    _sort_heap(list_, 0, k)
+
+
+def _select_k(iterable, k, key, largest):
+    """
+    Return a list of the k largest items of iterable, largest first, if
+    largest, or else of its k smallest items, smallest first.  Items with
+    equal keys come in the order iterable yields them.  Only k items are
+    held at a time.
+
+    @param iterable iterable: items to choose from
+    @param int k: number of items to choose
+    @param (object)->object|None key: function computing each item's key
+    @param bool largest: whether to choose the largest items
+    @rtype: list
+    """
+    # a min-heap of (key, -index, item) whose top is the item to drop
+    # first; index breaks ties, so items are never compared
+    heap = []
+    if k <= 0:
+        return heap
+    for index, item in enumerate(iterable):
+        item_key = item if key is None else key(item)
+        entry = (item_key if largest else _Reversed(item_key), -index, item)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif heap[0][0] < entry[0]:
+            heapq.heapreplace(heap, entry)
+    result = [heapq.heappop(heap)[2] for _ in range(len(heap))]
+    result.reverse()
+    return result
+
+
+def top_k(iterable, k, key=None):
+    """
+    Return a list of the k largest items of iterable, largest first,
+    without holding more than k of them at a time.  Items with equal keys
+    come in the order iterable yields them.  Takes O(n log k) time.
+
+    @param iterable iterable: items to choose from
+    @param int k: number of items to choose
+    @param (object)->object|None key: function computing each item's key
+    @rtype: list
+
+    >>> top_k(iter([5, 1, 8, 3, 9, 2]), 3)
+    [9, 8, 5]
+    >>> top_k(['bb', 'a', 'cc', 'd'], 2, key=len)
+    ['bb', 'cc']
+    """
+    return _select_k(iterable, k, key, True)
+
+
+def nsmallest(iterable, k, key=None):
+    """
+    Return a list of the k smallest items of iterable, smallest first,
+    without holding more than k of them at a time.  Items with equal keys
+    come in the order iterable yields them.  Takes O(n log k) time.
+
+    @param iterable iterable: items to choose from
+    @param int k: number of items to choose
+    @param (object)->object|None key: function computing each item's key
+    @rtype: list
+
+    >>> nsmallest(iter([5, 1, 8, 3, 9, 2]), 3)
+    [1, 2, 3]
+    >>> nsmallest(['bb', 'a', 'cc', 'd'], 2, key=len)
+    ['a', 'd']
+    """
+    return _select_k(iterable, k, key, False)
@@ -1,7 +1,7 @@
 from sort import *
 import random
 import timeit
-import cProfile
+from instrument import instrument
 
 
 def is_sorted(list_):
@@ -44,28 +44,38 @@ def time_sort(list_, sorted_list, which_sort):
 
     # The timeit module provides accurate timing of code in seconds, by
     # running the code a number of times and adding up the total time.
-    t = timeit.timeit('{}({})'.format(sorter_name, list_),
-                      'from sort import ' + sorter_name,
-                      number=4) / 4
+    # Each run sorts a fresh copy of list_, made in the untimed setup.
+    t = sum(timeit.repeat('which_sort(new_list)', 'new_list = list_[:]',
+                          repeat=4, number=1,
+                          globals={'which_sort': which_sort,
+                                   'list_': list_})) / 4
 
     # Print information about the results so far, before all of the output
-    # generated by the cProfile module.
+    # generated by profile_comparisons.
     print("{} {} items in {:.6f}\n".format(sorter_name, len(list_), t))
 
 
-def generate_data(n, sorted_=False, reversed_=False):
+def generate_data(n, sorted_=False, reversed_=False, distinct=None):
     """
     Return a list of n ints. If sorted_, the list should be nearly sorted:
     only a few elements are out of order. If sorted_ and reversed_, the list
     should be nearly sorted in reverse. The list should otherwise be
-    shuffled (in random order).
+    shuffled (in random order). If distinct, the list should hold only
+    that many different ints, each repeated about n / distinct times.
 
     @param int n: number of ints in the list to be returned
     @param bool sorted_: indicates whether or not to sort
     @param bool reversed_: indicates whether or not to reverse
+    @param int|None distinct: number of different ints in the list
     @rtype: list[int]
+
+    >>> sorted(set(generate_data(100, distinct=3)))
+    [0, 2, 4]
     """
-    list_ = [2 * j for j in range(n)]
+    if distinct:
+        list_ = [2 * (j * distinct // n) for j in range(n)]
+    else:
+        list_ = [2 * j for j in range(n)]
     if sorted_:
         j = random.randrange(5, 11)
         while j < n // 2:
@@ -80,33 +90,31 @@ def generate_data(n, sorted_=False, reversed_=False):
 
 def profile_comparisons(n):
     """
-    Run cProfile to identify bottlenecks in algorithms.
+    Count the comparisons, moves, allocated bytes and call depth of each
+    algorithm sorting the same n shuffled items, and print them.
 
     @param int n: size of list to run algorithms on.
     @rtype: None
     """
+    data = generate_data(n)
     for algo in [selection_sort, insertion_sort_1, bubblesort_1,
                  mergesort_1, quicksort_1]:
-        list_ = generate_data(n)
-        name = algo.__name__
-        print("=== profiling {} ===".format(name))
-        cProfile.run("{}({})".format(algo.__name__, list_), sort='calls')
+        stats = instrument(algo, data[:])
+        print("{:<18} comparisons {:>8} moves {:>8} allocated {:>8} "
+              "max_depth {:>4}".format(algo.__name__, stats.comparisons,
+                                       stats.moves, stats.allocated,
+                                       stats.max_depth))
 
 
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
 
-    for algo_ in [selection_sort, insertion_sort_1, bubblesort_1,
-                  mergesort_1, quicksort_1]:
-        for i in range(1, 7):
-            L = generate_data(i * 100)
-            time_sort(L, sorted(L), algo_)
-    for i in range(1, 7):
-        L = generate_data(i * 100)
-        time = timeit.timeit('{}.sort()'.format(L), number=100) / 100
-        print("built-in sort {} items in {:.6f}\n".format(len(L), time))
-
-    # uncomment this call to profile-comparisons, and edit the list of
-    # algorithms to see call-by-call comparison
+    # time every sort, and the built-in one, on every distribution of
+    # data; run benchmark.py --help for more sizes and options
+    import benchmark
+    benchmark.main(['--sizes', '100', '300', '600'])
+
+    # count the work each algorithm does; edit the list of algorithms in
+    # profile_comparisons to compare others
     profile_comparisons(1000)
@@ -9,6 +9,7 @@ class Tree:
     """
     A bare-bones Tree ADT that identifies the root with the entire tree.
     """
+    __slots__ = ('value', 'children')
 
     def __init__(self, value=None, children=None):
         """
@@ -338,14 +339,16 @@ def descendants_from_list(t, list_, branching):
     """
     q = Queue()
     q.add(t)
-    list_ = list_.copy()
+    # index of the next value to place, instead of popping the front
+    list_index = 0
     while not q.is_empty():  # unlikely to happen
         new_t = q.remove()
         for i in range(0, branching):
-            if len(list_) == 0:
+            if list_index == len(list_):
                 return t  # our work here is done
             else:
-                new_t_child = Tree(list_.pop(0))
+                new_t_child = Tree(list_[list_index])
+                list_index += 1
                 new_t.children.append(new_t_child)
                 q.add(new_t_child)
     return t
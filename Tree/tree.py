@@ -13,6 +13,7 @@ class Tree:
     @param object value: value of root node
     @param list[Tree|None] children: child nodes
     """
+    __slots__ = ('value', 'children')
 
     def __init__(self, value=None, children=None):
         """
@@ -145,6 +146,7 @@ class BinaryTree(Tree):
     @param BinaryTree|None left: left child, aliases children[0]
     @param BinaryTree|None right: right child, aliases children[1]
     """
+    __slots__ = ()
 
     def __init__(self, value=None, left=None, right=None):
         """ Create BinaryTree self with value, left and right children.
@@ -315,14 +317,16 @@ def descendants_from_list(t, list_, arity):
     """
     q = Queue()
     q.add(t)
-    list_ = list_.copy()
+    # index of the next value to place, instead of popping the front
+    list_index = 0
     while not q.is_empty():  # unlikely to happen
         new_t = q.remove()
         for i in range(0, arity):
-            if len(list_) == 0:
+            if list_index == len(list_):
                 return t  # our work here is done
             else:
-                new_t_child = Tree(list_.pop(0))
+                new_t_child = Tree(list_[list_index])
+                list_index += 1
                 new_t.children.append(new_t_child)
                 q.add(new_t_child)
     return t
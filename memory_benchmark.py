@@ -0,0 +1,121 @@
+""" measure the memory each kind of node takes
+
+Run python memory_benchmark.py [n] from this directory.  For each node
+class, n nodes are made with the class as it is, and with a copy of it
+that keeps its attributes in a per-instance __dict__ instead of
+__slots__, as every node class used to.  The bytes per node of both are
+printed.  Each node holds the same small int, so the value itself costs
+nothing; a Tree's bytes include its list of children.
+"""
+
+
+import importlib
+import sys
+import tracemalloc
+import warnings
+
+
+# (directory, module, class, arguments for one node)
+NODES = [
+    ('LinkedList', 'LinkedList', 'LinkedListNode', (0,)),
+    ('LinkedList', 'node', 'LinkedListNode', (0,)),
+    ('BinaryTree', 'BtLinkedList', 'LinkedListNode', (0,)),
+    ('BinaryTree', 'BinaryTree', 'BinaryTree', (0,)),
+    ('BinaryTree', 'BtLinkedList', 'BinaryTree', (0,)),
+    ('BinaryTree', 'BSTQueue', 'BinaryTree', (0,)),
+    ('Tree', 'tree', 'Tree', (0,)),
+    ('Tree', 'tree', 'BinaryTree', (0,)),
+    ('Tree', 'SimpleTree', 'Tree', (0,)),
+]
+
+
+def load(directory, module):
+    """
+    Import and return module from directory, which is put on sys.path
+    so that the module can import its neighbours.
+
+    @param str directory: directory holding the module
+    @param str module: name of the module
+    @rtype: module
+    """
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    with warnings.catch_warnings():
+        # some modules compare ints with "is"; that is not measured here
+        warnings.simplefilter('ignore', SyntaxWarning)
+        return importlib.import_module(module)
+
+
+def without_slots(cls):
+    """
+    Return a copy of class cls, and of its base classes, whose instances
+    keep their attributes in a __dict__ rather than in __slots__.
+
+    @param type cls: class to copy
+    @rtype: type
+
+    >>> class Node:
+    ...     __slots__ = ('value',)
+    >>> hasattr(Node(), '__dict__'), hasattr(without_slots(Node)(), '__dict__')
+    (False, True)
+    """
+    if cls is object:
+        return object
+    namespace = {name: attribute for name, attribute in vars(cls).items()
+                 if name not in getattr(cls, '__slots__', ())
+                 and name not in ('__slots__', '__dict__', '__weakref__')}
+    return type(cls.__name__, tuple(without_slots(base)
+                                    for base in cls.__bases__), namespace)
+
+
+def bytes_per_node(cls, args, n):
+    """
+    Return the bytes allocated per node to make n instances cls(*args).
+
+    @param type cls: node class
+    @param tuple args: arguments for each node
+    @param int n: number of nodes to make
+    @rtype: float
+
+    >>> class Node:
+    ...     __slots__ = ('value',)
+    ...     def __init__(self, value):
+    ...         self.value = value
+    >>> bytes_per_node(Node, (0,), 1000) < 64
+    True
+    """
+    nodes = [None] * n
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        for i in range(n):
+            nodes[i] = cls(*args)
+        return (tracemalloc.get_traced_memory()[0] - start) / n
+    finally:
+        tracemalloc.stop()
+
+
+def main(n):
+    """
+    Print the bytes per node of each class in NODES, with a __dict__ and
+    with __slots__, measured over n nodes.
+
+    @param int n: number of nodes to make of each class
+    @rtype: None
+    """
+    print("{:<30} {:>10} {:>10}".format('node', '__dict__', '__slots__'))
+    for directory, module, name, args in NODES:
+        try:
+            cls = getattr(load(directory, module), name)
+        except SyntaxError as error:
+            print("{:<30} not imported: {}".format(module + '.' + name,
+                                                  error.msg))
+            continue
+        print("{:<30} {:>10.1f} {:>10.1f}".format(
+            module + '.' + name,
+            bytes_per_node(without_slots(cls), args, n),
+            bytes_per_node(cls, args, n)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)